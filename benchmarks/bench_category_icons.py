@@ -0,0 +1,120 @@
+# benchmarks/bench_category_icons.py
+"""Microbenchmark: category icons for 75 and 5000 result rows.
+
+Compares the old per-row lookup (lower-case every map key, linear keyword
+scan, build a fresh qtawesome icon) against CategoryIconCache, both for the
+lookup alone and for lookup + painting the icon at table size.
+
+Run from the repository root:
+    python benchmarks/bench_category_icons.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QApplication
+import qtawesome as qta
+
+from ui.category_icons import CategoryIconCache
+
+CATEGORY_ICON_MAP = {
+    "Anime - AMV": ("mdi.filmstrip", "lightblue"),
+    "Anime - English-translated": ("mdi.translate", "lightgreen"),
+    "Anime - Non-English-translated": ("mdi.translate", "salmon"),
+    "Anime - Raw": ("mdi.video-outline", "lightgrey"),
+    "Audio - Lossless": ("mdi.music-note-outline", "cyan"),
+    "Audio - Lossy": ("mdi.music-note-outline", "skyblue"),
+    "Literature - English-translated": ("mdi.book-open-page-variant-outline", "lightgreen"),
+    "Literature - Non-English-translated": ("mdi.book-open-page-variant-outline", "salmon"),
+    "Literature - Raw": ("mdi.book-outline", "lightgrey"),
+    "Live Action - English-translated": ("mdi.television-classic", "lightgreen"),
+    "Live Action - Idol/Promotional Video": ("mdi.star-outline", "pink"),
+    "Live Action - Non-English-translated": ("mdi.television-classic", "salmon"),
+    "Live Action - Raw": ("mdi.television-classic-off", "lightgrey"),
+    "Pictures - Graphics": ("mdi.image-outline", "mediumpurple"),
+    "Pictures - Photos": ("mdi.camera-outline", "lightcoral"),
+    "Software - Applications": ("mdi.application-cog-outline", "orange"),
+    "Software - Games": ("mdi.gamepad-variant-outline", "tomato"),
+    "default": ("mdi.help-circle-outline", "grey")
+}
+ROW_COUNTS = (75, 5000)
+REPEATS = 5
+
+
+def legacy_get_category_icon(category_name):
+    """The lookup MainWindow.get_category_icon used to do for every row."""
+    norm_category_name = category_name.lower().strip()
+    if norm_category_name in (key.lower() for key in CATEGORY_ICON_MAP):
+        for key, (icon_name, color) in CATEGORY_ICON_MAP.items():
+            if key.lower() == norm_category_name:
+                return qta.icon(icon_name, color=color)
+    for key, (icon_name, color) in CATEGORY_ICON_MAP.items():
+        if key == "default": continue
+        if key.lower() in norm_category_name:
+            return qta.icon(icon_name, color=color)
+    return qta.icon(CATEGORY_ICON_MAP["default"][0], color=CATEGORY_ICON_MAP["default"][1])
+
+
+def _renderable(spec):
+    try:
+        qta.icon(spec[0], color=spec[1])
+        return True
+    except Exception:
+        return False
+
+
+def make_rows(count):
+    # Skip names the installed qtawesome can't draw, the legacy path would raise on them
+    names = [key for key, spec in CATEGORY_ICON_MAP.items() if key != "default" and _renderable(spec)]
+    names.append("Unknown - Other")
+    return [names[i % len(names)] for i in range(count)]
+
+
+def best_of(func):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    canvas = QImage(16, 16, QImage.Format_ARGB32_Premultiplied)
+    target = QRect(0, 0, 16, 16)
+
+    print(f"{'rows':>6} | {'legacy lookup':>14} | {'cached lookup':>14} | {'legacy paint':>13} | {'cached paint':>13}")
+    for count in ROW_COUNTS:
+        rows = make_rows(count)
+        cache = CategoryIconCache(CATEGORY_ICON_MAP)
+        cache.warm(CATEGORY_ICON_MAP) # Done once at startup in MainWindow
+
+        def legacy_lookup():
+            for category in rows:
+                legacy_get_category_icon(category)
+
+        def cached_lookup():
+            for category in rows:
+                cache.icon(category)
+
+        def paint_with(get_icon):
+            def run():
+                painter = QPainter(canvas)
+                for category in rows:
+                    get_icon(category).paint(painter, target, Qt.AlignCenter)
+                painter.end()
+            return run
+
+        print(f"{count:>6} | {best_of(legacy_lookup):>11.2f} ms | {best_of(cached_lookup):>11.2f} ms | "
+              f"{best_of(paint_with(legacy_get_category_icon)):>10.2f} ms | {best_of(paint_with(cache.icon)):>10.2f} ms")
+    del app
+
+
+if __name__ == "__main__":
+    main()
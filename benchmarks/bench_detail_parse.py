@@ -0,0 +1,208 @@
+# benchmarks/bench_detail_parse.py
+"""Measures details page parsing: time, peak memory and the size of what is kept.
+
+Builds a synthetic details page in the layout _parse_details reads, sized like
+the heaviest pages seen on Nyaa (long description with image links, a 5000
+file batch, 1000 comments), then compares:
+
+  before:   the parser as it was before detail payloads were capped (a copy,
+            below), which also re-parsed the description for images
+  full:     everything kept (comment_limit/description_limit = None)
+  capped:   NyaaScraper.DETAIL_COMMENT_LIMIT comments and
+            DETAIL_DESCRIPTION_LIMIT characters of description; comments
+            past the cap are cut off before the page is parsed
+  comments: the on-demand path (get_torrent_comments), which parses only the
+            #comments subtree, for the comments after the first page
+
+Run from the repository root:
+    python benchmarks/bench_detail_parse.py
+"""
+import contextlib
+import io
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+from core.models import FileInfo, TorrentDetails
+from core.scraper import NyaaScraper
+
+URL = "https://nyaa.si/view/1234567"
+FILE_COUNT = 5000
+COMMENT_COUNT = 1000
+DESCRIPTION_LINES = 4000
+REPEATS = 3
+
+
+def make_page():
+    info_rows = "".join(
+        f'<div class="row"><div class="col-md-1"><strong>{label}:</strong></div><div class="col-md-5">{value}</div></div>'
+        for label, value in (("Category", '<a href="/?c=1_2">Anime - English-translated</a>'),
+                             ("Date", "2024-05-01 12:00 UTC"), ("Submitter", '<a class="username-link" href="/user/x">x</a>'),
+                             ("Seeders", "<span>1234</span>"), ("Leechers", "<span>56</span>"),
+                             ("File size", "1.2 TiB"), ("Completed", "98765"),
+                             ("Info hash", "<kbd>0123456789abcdef0123456789abcdef01234567</kbd>")))
+    description = "\n".join(
+        f"Line {i}: **episode notes** ![shot](https://i.example.org/{i}.png) [mirror](https://example.org/{i})"
+        for i in range(DESCRIPTION_LINES))
+    files = "".join(
+        f'<li><i class="fa fa-file"></i>Episode {i:04d} [1080p].mkv <span class="file-size">(1.4 GiB)</span></li>'
+        for i in range(FILE_COUNT))
+    comments = "".join(
+        f'<div class="comment panel"><div class="panel-heading"><a href="/user/user{i}">user{i}</a> '
+        f'<span data-timestamp="{1714560000 + i}">2024-05-01 12:{i % 60:02d}</span></div>'
+        f'<div class="panel-body"><div class="comment-content">Thanks for the batch! '
+        f'<p>Comment {i} with <a href="https://example.org/{i}">a link</a> and some more text.</p></div></div></div>'
+        for i in range(COMMENT_COUNT))
+    return (f'<html><body><div class="panel"><div class="panel-heading"><h3 class="panel-title">Big Batch</h3></div>'
+            f'<div class="panel-body">{info_rows}</div>'
+            f'<div class="panel-footer"><a href="magnet:?xt=urn:btih:0123456789abcdef0123456789abcdef01234567">Magnet</a></div></div>'
+            f'<div class="panel"><div class="panel-body" id="torrent-description">{description}</div></div>'
+            f'<div class="torrent-file-list panel-body"><ul>{files}</ul></div>'
+            f'<div id="comments">{comments}</div></body></html>')
+
+
+def legacy_parse_details(scraper, html_content, url):
+    """NyaaScraper._parse_details before the single-tree rewrite, minus its debug output."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    details = TorrentDetails()
+    for row in soup.select_one('.panel-body').select('div.row'):
+        cols = row.find_all('div', class_=re.compile(r'col-md-\d+'), recursive=False)
+        for label_tag, value_tag in zip(cols[::2], cols[1::2]):
+            strong_label = label_tag.find('strong')
+            label = strong_label.get_text(strip=True).replace(':', '').lower() if strong_label else None
+            if not label:
+                label = label_tag.get_text(strip=True).replace(':', '').lower()
+            raw_value_text = value_tag.get_text(strip=True)
+            if label == 'submitter':
+                user_link = value_tag.find('a', class_='username-link')
+                details.submitter = user_link.get_text(strip=True) if user_link else raw_value_text
+            elif label == 'date':
+                details.date_submitted = raw_value_text
+            elif label == 'category':
+                cat_link = value_tag.find('a')
+                details.category = cat_link.get_text(strip=True) if cat_link else raw_value_text
+            elif label == 'file size':
+                details.size_str = raw_value_text
+            elif label in ('seeders', 'leechers'):
+                span_tag = value_tag.find('span')
+                setattr(details, label, int(span_tag.get_text(strip=True) if span_tag else raw_value_text))
+            elif label == 'completed':
+                details.completed = int(raw_value_text)
+            elif label == 'info hash':
+                kbd_tag = value_tag.find('kbd')
+                details.info_hash = kbd_tag.get_text(strip=True) if kbd_tag else raw_value_text
+
+    magnet_tag = soup.find('a', href=lambda href: href and href.startswith('magnet:?'))
+    details.magnet_link = magnet_tag['href'] if magnet_tag else ""
+    desc_tag = soup.select_one('#torrent-description')
+    details.description = str(desc_tag) if desc_tag else "No description found."
+
+    found_urls = set()
+    for md_url in re.findall(r'!\[.*?\]\((.*?)\)', desc_tag.get_text() if desc_tag else ""):
+        if md_url and md_url not in found_urls:
+            details.image_urls.append(requests.compat.urljoin(url, md_url.strip()))
+            found_urls.add(md_url)
+            if len(details.image_urls) >= 10: break
+    if len(details.image_urls) < 10: # The second soup, over the description's HTML
+        desc_soup = BeautifulSoup(details.description, 'html.parser')
+        for img_tag in desc_soup.find_all('img', limit=10 - len(details.image_urls)):
+            if img_tag.get('src') and img_tag['src'] not in found_urls:
+                details.image_urls.append(requests.compat.urljoin(url, img_tag['src']))
+                found_urls.add(img_tag['src'])
+
+    file_list_container = soup.select_one('div.torrent-file-list')
+    for item in file_list_container.select('ul > li') if file_list_container else ():
+        link_tag = item.find('a')
+        if link_tag:
+            file_name = link_tag.get_text(strip=True)
+        else:
+            full_text = item.get_text(strip=True)
+            match = re.match(r'^(.*?)\s*\([\d.,]+\s*[KMGTPEZY]?I?B\)$', full_text)
+            file_name = match.group(1).strip() if match else full_text
+        size_span = item.find('span', class_='file-size')
+        size_str = size_span.get_text(strip=True).replace('(', '').replace(')', '') if size_span else "0 B"
+        details.file_list.append(FileInfo(name=file_name, size_bytes=scraper._parse_size_to_bytes(size_str),
+                                          size_str=size_str))
+
+    comments_container = soup.select_one('#comments')
+    for comment_div in comments_container.find_all('div', class_='comment', recursive=False) if comments_container else ():
+        comment_data = {'author': 'N/A', 'date': 'N/A', 'content_html': ''}
+        heading = comment_div.select_one('.panel-heading')
+        if heading:
+            author_tag = heading.find('a', href=re.compile(r'/user/'))
+            if author_tag: comment_data['author'] = author_tag.get_text(strip=True)
+            date_span = heading.find('span', attrs={'data-timestamp': True})
+            if date_span: comment_data['date'] = date_span.get_text(strip=True)
+        body = comment_div.select_one('.panel-body .comment-content')
+        if body:
+            comment_data['content_html'] = str(body).strip()
+        if comment_data['content_html']:
+            details.comments.append(comment_data)
+    details.comment_count = len(details.comments)
+    return details
+
+
+def measure(func):
+    """Best time (ms), peak traced memory (MiB) and the result of func."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    result = func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings) * 1000, peak / (1024 * 1024), result
+
+
+def kept_bytes(details):
+    return (len(details.description) + sum(len(c["content_html"]) + len(c["author"]) + len(c["date"])
+                                           for c in details.comments))
+
+
+def main():
+    html = make_page()
+    print(f"Page: {len(html) / 1024:.0f} KiB, {FILE_COUNT} files, {COMMENT_COUNT} comments\n")
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper = NyaaScraper()
+
+    def parse(**limits):
+        with contextlib.redirect_stdout(io.StringIO()): # The parser's debug output isn't what's measured
+            return scraper._parse_details(html, URL, **limits)
+
+    def parse_more_comments():
+        with contextlib.redirect_stdout(io.StringIO()):
+            soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer(id='comments'))
+            return scraper._parse_comments(scraper._comment_divs(soup)[NyaaScraper.DETAIL_COMMENT_LIMIT:])
+
+    def parse_before():
+        return legacy_parse_details(scraper, html, URL)
+
+    parsed = {}
+    print(f"{'parse':>9} | {'time':>9} | {'peak':>9} | {'kept text':>10} | comments")
+    for name, func in (("before", parse_before),
+                       ("full", lambda: parse(comment_limit=None, description_limit=None)),
+                       ("capped", lambda: parse(comment_limit=NyaaScraper.DETAIL_COMMENT_LIMIT,
+                                                description_limit=NyaaScraper.DETAIL_DESCRIPTION_LIMIT))):
+        elapsed, peak, details = parsed[name] = measure(func)
+        print(f"{name:>9} | {elapsed:>6.0f} ms | {peak:>5.1f} MiB | {kept_bytes(details) / 1024:>6.0f} KiB | "
+              f"{len(details.comments)}/{details.comment_count}")
+    elapsed, peak, comments = measure(parse_more_comments)
+    print(f"{'comments':>9} | {elapsed:>6.0f} ms | {peak:>5.1f} MiB | {'':>10} | {len(comments)} more")
+
+    before, full, capped = (parsed[name][2] for name in ("before", "full", "capped"))
+    for field in ("description", "image_urls", "file_list", "comments"):
+        assert getattr(before, field) == getattr(full, field), field
+    assert capped.comments + comments == full.comments and capped.file_list == full.file_list
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_downloads_model.py
+"""Measures one downloads refresh tick on the UI thread with hundreds to thousands of torrents.
+
+  rebuild: reset the model with the full torrent list every tick (what refilling
+           a QTableWidget per refresh amounts to).
+  delta:   DownloadsTableModel.apply_changes with the tick's TorrentChanges, so
+           only the changed cells of the active torrents repaint.
+
+Each tick includes the view repainting whatever the model invalidated. 5% of
+torrents are transferring.
+
+Run from the repository root:
+    python benchmarks/bench_downloads_model.py
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QSortFilterProxyModel
+from PySide6.QtWidgets import QApplication, QTableView
+
+from core.transmission import TorrentChanges
+from ui.downloads_model import DownloadsTableModel, ProgressBarDelegate, SortRole
+
+TORRENT_COUNTS = (200, 1000, 5000)
+ACTIVE_SHARE = 0.05
+TICKS = 20
+
+
+def make_torrents(count):
+    return [{"id": i, "hashString": f"{i:040x}", "name": f"[Group] Show {i:05d} - 01 [1080p].mkv", "status": 6,
+             "percentDone": 1.0, "rateDownload": 0, "rateUpload": 0, "eta": -1, "sizeWhenDone": 1 << 30,
+             "leftUntilDone": 0, "uploadedEver": 0, "uploadRatio": 0.5, "peersConnected": 0, "error": 0,
+             "errorString": "", "addedDate": 1700000000 + i, "downloadDir": "/downloads", "queuePosition": i}
+            for i in range(1, count + 1)]
+
+
+def tick_changes(torrents, active_ids, rng):
+    changed = {}
+    for torrent_id in active_ids:
+        delta = {"rateDownload": rng.randint(1, 5000) * 1024, "peersConnected": rng.randint(1, 40),
+                 "percentDone": rng.random(), "eta": rng.randint(1, 9999)}
+        torrents[torrent_id - 1].update(delta)
+        changed[torrent_id] = delta
+    return TorrentChanges(changed=changed)
+
+
+def run(count, mode):
+    rng = random.Random(count)
+    torrents = make_torrents(count)
+    active_ids = rng.sample(range(1, count + 1), int(count * ACTIVE_SHARE))
+    model = DownloadsTableModel()
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setSortRole(SortRole)
+    view = QTableView()
+    view.setModel(proxy)
+    view.setItemDelegateForColumn(DownloadsTableModel.PROGRESS_COLUMN, ProgressBarDelegate(view))
+    view.resize(1200, 700)
+    view.show()
+    model.apply_changes(TorrentChanges(added=[dict(t) for t in torrents], full=True))
+    QApplication.processEvents()
+    timings = []
+    for _ in range(TICKS):
+        changes = tick_changes(torrents, active_ids, rng)
+        start = time.perf_counter()
+        if mode == "rebuild":
+            model.set_torrents(torrents)
+        else:
+            model.apply_changes(changes)
+        QApplication.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+    view.close()
+    return statistics.median(timings)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"median of {TICKS} ticks, {ACTIVE_SHARE:.0%} of torrents active")
+    print(f"{'torrents':>8} | {'rebuild ms':>10} | {'delta ms':>8}")
+    for count in TORRENT_COUNTS:
+        print(f"{count:>8} | {run(count, 'rebuild'):>10.2f} | {run(count, 'delta'):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# benchmarks/bench_file_tree.py
+"""Measures how long the detail dialog's file list takes to appear for large batch torrents.
+
+  legacy: one QTreeWidgetItem per file and folder, a qtawesome icon, tooltips and
+          alignment on each (the old populate_nested_file_tree).
+  model:  FileTreeModel over a prebuilt path trie; only the expanded top level
+          gets rows.
+
+Both include expandToDepth(0), sorting by name and the first paint.
+
+Run from the repository root:
+    python benchmarks/bench_file_tree.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QTreeView, QTreeWidget, QTreeWidgetItem
+import qtawesome as qta
+
+from core.models import FileInfo, format_size
+from ui.file_tree_model import FileTreeModel
+from ui.torrent_detail_dialog import TorrentDetailDialog
+
+FILE_COUNTS = [200, 20000, 100000]
+REPEATS = 3
+EXTENSIONS = ["mkv", "ass", "flac", "jpg", "nfo"]
+
+
+def make_file_list(count):
+    files = []
+    for i in range(count):
+        season, episode = divmod(i, 500)
+        name = f"Batch/Season {season:02d}/Extras {episode % 7}/Episode {episode:03d}.{EXTENSIONS[i % len(EXTENSIONS)]}"
+        size = 50_000_000 + i * 1013
+        files.append(FileInfo(name=name, size_bytes=size, size_str=format_size(size)))
+    return files
+
+
+def icon_for_name(filename):
+    extension = filename.split('.')[-1].lower() if '.' in filename else ""
+    icon_name, color = TorrentDetailDialog.FILE_TYPE_ICONS.get(extension, TorrentDetailDialog.FILE_TYPE_ICONS["default"])
+    return qta.icon(icon_name, color=color)
+
+
+def best_of(func):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def legacy(file_list):
+    tree = QTreeWidget()
+    tree.setHeaderLabels(["Name", "Size"])
+    tree.setSortingEnabled(True)
+    folder_items = {}
+    tree.setUpdatesEnabled(False)
+    for file_info in file_list:
+        path_components = file_info.name.split('/')
+        filename = path_components[-1]
+        folder_path_components = path_components[:-1]
+        parent = tree.invisibleRootItem()
+        for i, component in enumerate(folder_path_components):
+            path_str = "/".join(folder_path_components[:i + 1])
+            if path_str not in folder_items:
+                item = QTreeWidgetItem(parent)
+                item.setText(0, component)
+                item.setIcon(0, qta.icon('mdi.folder-outline', color='#87CEFA'))
+                item.setData(0, Qt.UserRole, component.lower())
+                item.setData(1, Qt.UserRole, 0)
+                item.setToolTip(0, path_str)
+                folder_items[path_str] = item
+            parent = folder_items[path_str]
+            parent.setData(1, Qt.UserRole, (parent.data(1, Qt.UserRole) or 0) + file_info.size_bytes)
+        item = QTreeWidgetItem(parent)
+        item.setText(0, filename)
+        item.setText(1, file_info.size_str)
+        item.setData(0, Qt.UserRole, filename.lower())
+        item.setData(1, Qt.UserRole, file_info.size_bytes)
+        item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
+        item.setIcon(0, icon_for_name(filename))
+        item.setToolTip(0, file_info.name)
+        item.setToolTip(1, f"{file_info.size_bytes:,} bytes")
+    for item in folder_items.values():
+        item.setText(1, format_size(item.data(1, Qt.UserRole)))
+        item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
+    tree.setUpdatesEnabled(True)
+    show(tree)
+
+
+def model(file_list):
+    tree = QTreeView()
+    tree.setUniformRowHeights(True)
+    tree.setModel(FileTreeModel(file_list, icon_for_name, tree))
+    tree.setSortingEnabled(True)
+    show(tree)
+
+
+def show(tree):
+    tree.expandToDepth(0)
+    tree.sortByColumn(0, Qt.AscendingOrder)
+    tree.resize(600, 400)
+    tree.show()
+    QApplication.processEvents()
+    tree.grab() # Forces the first paint
+    tree.close()
+    tree.deleteLater()
+    QApplication.processEvents()
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'files':>7} | {'legacy':>10} | {'model':>9}")
+    for count in FILE_COUNTS:
+        file_list = make_file_list(count)
+        legacy_ms = best_of(lambda: legacy(file_list))
+        model_ms = best_of(lambda: model(file_list))
+        print(f"{count:>7} | {legacy_ms:>7.0f} ms | {model_ms:>6.1f} ms")
+    del app
+
+
+if __name__ == "__main__":
+    main()
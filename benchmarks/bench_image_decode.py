@@ -0,0 +1,142 @@
+# benchmarks/bench_image_decode.py
+"""Measures GUI frame stalls while 10 large preview images are turned into thumbnails.
+
+A 16 ms heartbeat timer stands in for the UI's frames; the longest gap between
+beats (and the number of gaps over 50 ms) is what the user sees as stutter.
+
+  legacy: QPixmap.loadFromData + pixmap.scaled(SmoothTransformation) on the GUI
+          thread, one image per event loop turn (the old dialog code).
+  pool:   ImagePreviewCache's thumbnail job (QImageReader with a scaled size,
+          cache writes) on its thread pool; the GUI thread only wraps the
+          150px result in a QPixmap.
+
+Run from the repository root:
+    python benchmarks/bench_image_decode.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QBuffer, QByteArray, QEventLoop, QIODevice, Qt, QTimer
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from ui.image_cache import ImagePreviewCache, _ThumbnailJob
+
+IMAGE_COUNT = 10
+FRAME_MS = 16
+STALL_MS = 50
+
+
+def make_images():
+    """Screenshot-sized PNGs (half noise, so they don't compress away) and photo-sized JPEGs."""
+    images = []
+    for i in range(IMAGE_COUNT):
+        if i % 2 == 0:
+            width, height, fmt = 2560, 1440, "PNG"
+        else:
+            width, height, fmt = 4000, 3000, "JPG"
+        noise = os.urandom(width * (height // 2) * 4)
+        image = QImage(width, height, QImage.Format_RGB32)
+        image.fill(Qt.darkCyan)
+        noisy = QImage(noise, width, height // 2, QImage.Format_RGB32)
+        image = image.copy()
+        for y in range(height // 2):
+            image.scanLine(y)[:width * 4] = noisy.constScanLine(y)[:width * 4]
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        image.save(buffer, fmt)
+        images.append(data.data())
+    return images
+
+
+class FrameMonitor:
+    def __init__(self):
+        self.timer = QTimer()
+        self.timer.setInterval(FRAME_MS)
+        self.timer.timeout.connect(self._beat)
+        self.gaps = []
+        self._last = None
+
+    def _beat(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.gaps.append((now - self._last) * 1000)
+        self._last = now
+
+    def start(self):
+        self.gaps, self._last = [], time.perf_counter()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        self._beat()
+        return max(self.gaps), sum(1 for gap in self.gaps if gap > STALL_MS)
+
+
+def run_until(done, timeout_ms=60000):
+    loop = QEventLoop()
+    check = QTimer()
+    check.timeout.connect(lambda: done() and loop.quit())
+    check.start(5)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    check.stop()
+
+
+def legacy(images, monitor):
+    results = []
+
+    def decode(data):
+        pixmap = QPixmap()
+        pixmap.loadFromData(data)
+        results.append(pixmap.scaled(QPixmap(150, 150).size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+
+    monitor.start()
+    start = time.perf_counter()
+    for data in images:
+        QTimer.singleShot(0, lambda data=data: decode(data))
+    run_until(lambda: len(results) == len(images))
+    return (time.perf_counter() - start) * 1000, monitor.stop()
+
+
+def pooled(images, monitor, cache):
+    results = []
+    jobs = []
+
+    def on_decoded(url, image, _written):
+        results.append(QPixmap.fromImage(image))
+
+    monitor.start()
+    start = time.perf_counter()
+    for i, data in enumerate(images):
+        job = _ThumbnailJob(cache, f"bench{i}", f"bench://{i}", data, {"url": f"bench://{i}"})
+        job.signals.finished.connect(on_decoded)
+        jobs.append(job.signals)
+        cache._decode_pool.start(job)
+    run_until(lambda: len(results) == len(images))
+    return (time.perf_counter() - start) * 1000, monitor.stop()
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    print("Generating test images...")
+    images = make_images()
+    print(f"{IMAGE_COUNT} images, {sum(map(len, images)) / (1024 * 1024):.1f} MiB total\n")
+    monitor = FrameMonitor()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ImagePreviewCache(cache_dir)
+        print(f"{'path':>7} | {'total':>9} | {'longest frame':>13} | {'frames > ' + str(STALL_MS) + ' ms':>15}")
+        for name, run in (("legacy", lambda: legacy(images, monitor)), ("pool", lambda: pooled(images, monitor, cache))):
+            total_ms, (longest_ms, stalls) = run()
+            print(f"{name:>7} | {total_ms:>6.0f} ms | {longest_ms:>10.0f} ms | {stalls:>15}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
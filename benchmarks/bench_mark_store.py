@@ -0,0 +1,87 @@
+# benchmarks/bench_mark_store.py
+"""Microbenchmark: startup and per-page mark lookups at 1k / 10k / 100k marks.
+
+Compares the old storage (a JSON list of detail links loaded into a set at
+startup, one `link in set` per row) against MarkStore (mapped id snapshot,
+one marked_flags() call per 75-row page). Also times export + import.
+
+Run from the repository root:
+    python benchmarks/bench_mark_store.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.mark_store import MarkStore
+
+MARK_COUNTS = (1000, 10000, 100000)
+PAGE_SIZE = 75
+REPEATS = 5
+
+
+def link(torrent_id):
+    return f"https://nyaa.si/view/{torrent_id}"
+
+
+def best_of(func):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def measure_memory(func):
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size / 1024
+
+
+def main():
+    print(f"{'marks':>7} | {'legacy open':>11} | {'store open':>10} | {'legacy mem':>10} | {'store mem':>9} | "
+          f"{'legacy page':>11} | {'store page':>10} | {'export':>8} | {'import':>8}")
+    for count in MARK_COUNTS:
+        with tempfile.TemporaryDirectory() as data_dir:
+            links = [link(torrent_id) for torrent_id in range(1, count * 2, 2)]
+            legacy_path = os.path.join(data_dir, "settings.json")
+            with open(legacy_path, "w", encoding="utf-8") as f:
+                json.dump({"marked_torrents": links}, f)
+            base_path = os.path.join(data_dir, "marks")
+            store = MarkStore(base_path)
+            store.update(links)
+            store.close()
+            page = [link(torrent_id) for torrent_id in range(count // 2, count // 2 + PAGE_SIZE)]
+
+            def legacy_open():
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    return set(json.load(f)["marked_torrents"])
+
+            def store_open():
+                store = MarkStore(base_path)
+                store.close()
+
+            legacy_set, legacy_kib = measure_memory(legacy_open)
+            store, store_kib = measure_memory(lambda: MarkStore(base_path))
+            legacy_page = best_of(lambda: [page_link in legacy_set for page_link in page])
+            store_page = best_of(lambda: store.marked_flags(page))
+            export_path = os.path.join(data_dir, "export.txt")
+            export_ms = best_of(lambda: store.export_marks(export_path))
+            store.clear()
+            import_ms = best_of(lambda: store.import_marks(export_path))
+            store.close()
+
+            print(f"{count:>7} | {best_of(legacy_open):>8.2f} ms | {best_of(store_open):>7.2f} ms | "
+                  f"{legacy_kib:>6.0f} KiB | {store_kib:>5.0f} KiB | {legacy_page:>8.3f} ms | {store_page:>7.3f} ms | "
+                  f"{export_ms:>5.1f} ms | {import_ms:>5.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_search_history.py
+"""Microbenchmark: SearchHistory.suggest() latency with 100k past queries.
+
+Builds a throwaway history of synthetic release-style queries (uses spread
+over a year), then times suggestions for short, long, rare and substring-only
+inputs. Building the history takes a few seconds.
+
+  keystroke: suggest(use_trigrams=False), what the search box runs per key
+  pause:     suggest(), run once typing pauses if the keystroke list was short
+
+Run from the repository root:
+    python benchmarks/bench_search_history.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.search_history import SearchHistory
+
+QUERY_COUNT = 100000
+REPEATS = 20
+GROUPS = ["subsplease", "erai-raws", "judas", "ember", "asw", "yameii", "[1080p]", "batch", "hevc", "dual audio"]
+TITLES = ["one piece", "frieren", "jujutsu kaisen", "bocchi", "spy x family", "attack on titan", "naruto",
+          "bleach", "dungeon meshi", "oshi no ko"]
+INPUTS = ["s", "sub", "subsplease fri", "frieren", "dungeon meshi 4", "zz", "x fam", "2160"]
+
+
+def best_of(func):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    random.seed(1)
+    with tempfile.TemporaryDirectory() as data_dir:
+        history = SearchHistory(os.path.join(data_dir, "history.sqlite3"))
+        now = time.time()
+        start = time.perf_counter()
+        for i in range(QUERY_COUNT):
+            term = f"{random.choice(GROUPS)} {random.choice(TITLES)} {i} {random.choice(['1080p', '720p'])}"
+            history._record(term, now - random.random() * 365 * 86400)
+        history._db.commit()
+        print(f"Built {len(history)} queries in {time.perf_counter() - start:.1f} s\n")
+
+        print(f"{'input':>18} | {'keystroke':>9} | {'pause':>9} | top suggestion")
+        for text in INPUTS:
+            suggestions = history.suggest(text)
+            keystroke = best_of(lambda: history.suggest(text, use_trigrams=False))
+            pause = best_of(lambda: history.suggest(text))
+            print(f"{text!r:>18} | {keystroke:>6.3f} ms | {pause:>6.3f} ms | {suggestions[0] if suggestions else '-'}")
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
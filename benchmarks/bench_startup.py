@@ -0,0 +1,82 @@
+# benchmarks/bench_startup.py
+"""Measures cold start: importing ui.main_window, and process start to first painted frame.
+
+Each run is a fresh interpreter, so module caches don't carry over (the OS
+file cache does; the first run is dropped as a warm-up). The first-paint child
+builds the QApplication and MainWindow the way main.py does and reports when
+the window's first Paint event has been handled.
+
+The child exits with os._exit right after measuring: the initial search it
+starts is never awaited, and no settings are written back.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 7
+
+IMPORT_CHILD = """
+import sys, time
+start = time.perf_counter()
+import ui.main_window
+open(sys.argv[1], "w").write(f"{(time.perf_counter() - start) * 1000}")
+"""
+
+FIRST_PAINT_CHILD = """
+import time
+start = time.perf_counter()
+import os, sys
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QEvent, QObject
+app = QApplication(sys.argv[:1])
+imported_at = time.perf_counter()
+from ui.main_window import MainWindow
+imported_at = time.perf_counter() - imported_at
+
+class FirstPaint(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and watched is window:
+            result = watched.event(event) # Let the frame paint, then stop the clock
+            open(sys.argv[1], "w").write(f"{(time.perf_counter() - start) * 1000} {imported_at * 1000}")
+            os._exit(0)
+        return False
+
+window = MainWindow()
+first_paint = FirstPaint()
+window.installEventFilter(first_paint)
+window.showMaximized()
+app.exec()
+"""
+
+
+def run_child(code):
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    with tempfile.TemporaryDirectory() as result_dir:
+        result_path = os.path.join(result_dir, "result") # Not stdout: the app's threads print there too
+        subprocess.run([sys.executable, "-c", code, result_path], cwd=ROOT, env=env, capture_output=True, check=True)
+        with open(result_path) as f:
+            return [float(value) for value in f.read().split()]
+
+
+def median_of(code):
+    runs = [run_child(code) for _ in range(RUNS + 1)][1:] # First run warms the file cache
+    return [statistics.median(values) for values in zip(*runs)]
+
+
+def main():
+    (import_ms,) = median_of(IMPORT_CHILD)
+    first_paint_ms, window_import_ms = median_of(FIRST_PAINT_CHILD)
+    print(f"import ui.main_window:              {import_ms:>7.0f} ms")
+    print(f"  (after QApplication, in-process): {window_import_ms:>7.0f} ms")
+    print(f"process start -> first paint:       {first_paint_ms:>7.0f} ms")
+    print(f"(median of {RUNS} runs)")
+
+
+if __name__ == "__main__":
+    main()
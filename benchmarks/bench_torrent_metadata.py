@@ -0,0 +1,126 @@
+# benchmarks/bench_torrent_metadata.py
+"""Measures getting a batch's file list from the details page vs the .torrent file.
+
+For batches of increasing file counts, builds a details page in the layout
+_parse_details reads (description, 50 comments, the file list) and a
+.torrent with the same files and a realistic pieces table, then compares:
+
+  html:    NyaaScraper._parse_details with the default caps (get_torrent_details)
+  naive:   a plain full bencode decode, then SHA-1 of the re-encoded info dict
+           (what a decoder without span tracking has to do for the info hash)
+  torrent: core.bencode.parse_torrent (get_torrent_metadata)
+
+Download sizes are shown too: a .torrent carries 20 bytes per piece, so for
+huge batches it can outweigh the page even though it is far cheaper to read.
+
+Run from the repository root:
+    python benchmarks/bench_torrent_metadata.py
+"""
+import contextlib
+import hashlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bencode import decode, encode, parse_torrent
+from core.scraper import NyaaScraper
+
+URL = "https://nyaa.si/view/1234567"
+FILE_COUNTS = (10, 500, 5000, 20000)
+FILE_SIZE = 50_000_000 # Batches with thousands of files are mostly small files
+COMMENT_COUNT = 50
+DESCRIPTION_LINES = 200
+REPEATS = 5
+
+
+def piece_length_for(total_size):
+    """Roughly what torrent creators pick: about 1500-3000 pieces, 256 KiB to 16 MiB each."""
+    length = 256 * 1024
+    while total_size // length > 3000 and length < 16 * 1024 * 1024:
+        length *= 2
+    return length
+
+
+def file_path(i):
+    return [f"Season {i // 100 + 1:02d}", f"[Group] Show - {i:05d} [1080p].mkv"]
+
+
+def make_torrent(file_count):
+    total = file_count * FILE_SIZE
+    piece_length = piece_length_for(total)
+    pieces = bytes(range(256)) * ((-(-total // piece_length) * 20) // 256 + 1)
+    info = {"name": "[Group] Show (Batch)", "piece length": piece_length,
+            "pieces": pieces[:-(-total // piece_length) * 20],
+            "files": [{"length": FILE_SIZE, "path": file_path(i)} for i in range(file_count)]}
+    return encode({"announce": "http://nyaa.tracker.wf:7777/announce", "creation date": 1714560000,
+                   "info": info})
+
+
+def make_page(file_count):
+    info_rows = "".join(
+        f'<div class="row"><div class="col-md-1"><strong>{label}:</strong></div><div class="col-md-5">{value}</div></div>'
+        for label, value in (("Category", '<a href="/?c=1_2">Anime - English-translated</a>'),
+                             ("Date", "2024-05-01 12:00 UTC"), ("Submitter", '<a class="username-link" href="/user/x">x</a>'),
+                             ("Seeders", "<span>1234</span>"), ("Leechers", "<span>56</span>"),
+                             ("File size", "1.2 TiB"), ("Completed", "98765"),
+                             ("Info hash", "<kbd>0123456789abcdef0123456789abcdef01234567</kbd>")))
+    description = "\n".join(f"Line {i}: **episode notes** ![shot](https://i.example.org/{i}.png)"
+                            for i in range(DESCRIPTION_LINES))
+    folders = {}
+    for i in range(file_count):
+        folder, name = file_path(i)
+        folders.setdefault(folder, []).append(
+            f'<li><i class="fa fa-file"></i>{name} <span class="file-size">(47.7 MiB)</span></li>')
+    files = "".join(f'<li><a class="folder"><i class="fa fa-folder-open"></i>{folder}</a><ul>{"".join(items)}</ul></li>'
+                    for folder, items in folders.items())
+    comments = "".join(
+        f'<div class="comment panel"><div class="panel-heading"><a href="/user/user{i}">user{i}</a> '
+        f'<span data-timestamp="{1714560000 + i}">2024-05-01 12:{i % 60:02d}</span></div>'
+        f'<div class="panel-body"><div class="comment-content">Thanks for the batch!</div></div></div>'
+        for i in range(COMMENT_COUNT))
+    return (f'<html><body><div class="panel"><div class="panel-heading"><h3 class="panel-title">Big Batch</h3></div>'
+            f'<div class="panel-body">{info_rows}</div>'
+            f'<div class="panel-footer"><a href="magnet:?xt=urn:btih:0123456789abcdef0123456789abcdef01234567">Magnet</a></div></div>'
+            f'<div class="panel"><div class="panel-body" id="torrent-description">{description}</div></div>'
+            f'<div class="torrent-file-list panel-body"><ul>{files}</ul></div>'
+            f'<div id="comments">{comments}</div></body></html>')
+
+
+def naive(data):
+    torrent = decode(data)
+    info_hash = hashlib.sha1(encode(torrent[b"info"])).hexdigest()
+    return info_hash, len(torrent[b"info"][b"files"])
+
+
+def best_of(func):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraper = NyaaScraper()
+
+    def html(page):
+        with contextlib.redirect_stdout(io.StringIO()): # The parser's debug output isn't what's measured
+            return scraper._parse_details(page, URL)
+
+    print(f"best of {REPEATS}; sizes are the download, uncompressed")
+    print(f"{'files':>6} | {'page KiB':>8} | {'.torrent KiB':>12} | {'html ms':>8} | {'naive ms':>8} | {'torrent ms':>10}")
+    for count in FILE_COUNTS:
+        page, torrent = make_page(count), make_torrent(count)
+        assert len(parse_torrent(torrent).files) == count
+        print(f"{count:>6} | {len(page.encode()) / 1024:>8.0f} | {len(torrent) / 1024:>12.0f} | "
+              f"{best_of(lambda: html(page)):>8.1f} | {best_of(lambda: naive(torrent)):>8.2f} | "
+              f"{best_of(lambda: parse_torrent(torrent)):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# core/batch.py
+"""Runs many saved searches concurrently against one scraper session.
+
+Every request from every worker goes through one RateLimiter, so the worker
+count only decides how many requests can be in flight while others wait on
+Nyaa. It doesn't change how fast Nyaa is hit. The first request runs alone,
+so the Cloudflare clearance it earns is in the shared session before the
+other workers start.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+
+from core.models import ScrapeResult
+
+RESULTS_PER_PAGE = 75 # Nyaa's page size; a shorter page is the last one
+MAX_WORKERS = 10 # requests' default connection pool size per host
+# Errors worth retrying after backing off (NyaaScraper raises them as ConnectionError)
+_THROTTLE_MARKERS = ("Cloudflare", "HTTP error 429", "HTTP error 503", "timed out")
+
+
+@dataclass
+class BatchQuery:
+    """One saved search; the fields mirror NyaaScraper.search."""
+    query: str = ""
+    category: str = "0_0"
+    sort_by: str = "date"
+    trusted_only: bool = False
+    uploader: str = ""
+    pages: int = 1 # Stops early at the last page
+    name: str = "" # Label in the output, the query text if empty
+
+    def label(self) -> str:
+        if self.name or self.query:
+            return self.name or self.query
+        return f"uploader:{self.uploader}" if self.uploader else "(latest)"
+
+
+@dataclass
+class QueryReport:
+    """How one query went: counts and where its time went."""
+    name: str
+    results: int = 0
+    new_results: int = 0 # Not already found by a query earlier in the file
+    pages: int = 0
+    seconds: float = 0.0 # Wall time from its first request to its last response
+    waited: float = 0.0 # Part of that spent waiting for the rate limiter
+    retries: int = 0
+    error: str | None = None
+
+
+class RateLimiter:
+    """Spaces requests from all threads at least `interval` seconds apart.
+
+    The interval doubles (up to max_interval) when Nyaa pushes back and eases
+    back toward 1/rate after each success.
+    """
+    RECOVERY = 0.9 # Interval multiplier per successful request while backed off
+
+    def __init__(self, rate: float, max_interval: float = 60.0):
+        self.base_interval = 1.0 / rate
+        self.max_interval = max_interval
+        self.interval = self.base_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Blocks until this caller's slot; returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def throttled(self):
+        with self._lock:
+            self.interval = min(self.max_interval, self.interval * 2)
+            self._next_slot = max(self._next_slot, time.monotonic() + self.interval)
+
+    def succeeded(self):
+        with self._lock:
+            self.interval = max(self.base_interval, self.interval * self.RECOVERY)
+
+
+def load_queries(lines, defaults: BatchQuery | None = None) -> list[BatchQuery]:
+    """Reads a query file: one JSON object per line with BatchQuery's keys, or plain
+    search text. Blank lines and lines starting with # are skipped. Keys a line
+    leaves out come from defaults."""
+    defaults = defaults or BatchQuery()
+    types = {f.name: f.type for f in fields(BatchQuery)}
+    queries = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        values = {f.name: getattr(defaults, f.name) for f in fields(BatchQuery)}
+        values["name"] = ""
+        if line.startswith("{"):
+            try:
+                entry = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"line {line_number}: invalid JSON: {e}") from e
+            unknown = set(entry) - set(types)
+            if unknown:
+                raise ValueError(f"line {line_number}: unknown key(s) {', '.join(sorted(unknown))}")
+            for key, value in entry.items():
+                if type(value) is not types[key]: # Exact type: true is not a page count, "3" is not 3
+                    raise ValueError(f"line {line_number}: {key} must be {types[key].__name__}, "
+                                     f"got {json.dumps(value)}")
+            if entry.get("pages", 1) < 1:
+                raise ValueError(f"line {line_number}: pages must be at least 1")
+            values.update(entry)
+        else:
+            values["query"] = line
+        queries.append(BatchQuery(**values))
+    return queries
+
+
+class BatchRunner:
+    """Runs BatchQuery lists on one NyaaScraper with bounded parallelism and a shared rate limit."""
+
+    def __init__(self, scraper, workers: int = 4, rate: float = 1.0, timeout: int = 30, retries: int = 3, log=None):
+        self.scraper = scraper # Its session (and Cloudflare clearance) is shared by every worker
+        self.workers = max(1, min(MAX_WORKERS, workers))
+        self.limiter = RateLimiter(rate)
+        self.timeout = timeout
+        self.retries = retries
+        self.log = log or (lambda message: None)
+        self._session_ready = threading.Event()
+        self._warmup_lock = threading.Lock()
+
+    def run(self, queries: list[BatchQuery]) -> tuple[list[tuple[ScrapeResult, list[str]]], list[QueryReport]]:
+        """Returns the merged results, each unique torrent once with the labels of the
+        queries that found it (in file order), and one report per query."""
+        page_results = [None] * len(queries)
+        reports = [None] * len(queries)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="BatchQuery") as pool:
+            futures = {pool.submit(self._run_query, query): index for index, query in enumerate(queries)}
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                page_results[index], reports[index] = future.result()
+                report = reports[index]
+                status = f"error: {report.error}" if report.error else f"{report.results} results"
+                self.log(f"[{done}/{len(queries)}] {report.name}: {status} in {report.seconds:.1f}s "
+                         f"(waited {report.waited:.1f}s, {report.retries} retries)")
+
+        merged = {} # info hash (or link) -> (result, labels); dicts keep first-seen order
+        for query, results, report in zip(queries, page_results, reports):
+            for result in results:
+                key = result.info_hash or result.link or result.magnet_link # Re-uploads of one torrent count once
+                entry = merged.get(key)
+                if entry is None:
+                    merged[key] = (result, [report.name])
+                    report.new_results += 1
+                elif report.name not in entry[1]:
+                    entry[1].append(report.name)
+        return list(merged.values()), reports
+
+    def _run_query(self, query: BatchQuery) -> tuple[list[ScrapeResult], QueryReport]:
+        report = QueryReport(name=query.label())
+        results = []
+        start = time.perf_counter()
+        try:
+            for page in range(1, max(1, query.pages) + 1):
+                page_results = self._fetch_page(query, page, report)
+                results.extend(page_results)
+                report.pages += 1
+                if len(page_results) < RESULTS_PER_PAGE:
+                    break
+        except (ValueError, FileNotFoundError, ConnectionError, RuntimeError) as e:
+            report.error = str(e)
+        report.seconds = round(time.perf_counter() - start, 3)
+        report.waited = round(report.waited, 3)
+        report.results = len(results)
+        return results, report
+
+    def _fetch_page(self, query: BatchQuery, page: int, report: QueryReport) -> list[ScrapeResult]:
+        if not self._session_ready.is_set():
+            with self._warmup_lock: # The first request runs alone and passes any Cloudflare challenge
+                if not self._session_ready.is_set():
+                    try:
+                        return self._request(query, page, report)
+                    finally:
+                        self._session_ready.set()
+        return self._request(query, page, report)
+
+    def _request(self, query: BatchQuery, page: int, report: QueryReport) -> list[ScrapeResult]:
+        attempt = 0
+        while True:
+            report.waited += self.limiter.acquire()
+            try:
+                results = self.scraper.search(query.query, category=query.category, sort_by=query.sort_by, page=page,
+                                              timeout=self.timeout, trusted_only=query.trusted_only,
+                                              uploader=query.uploader)
+            except ConnectionError as e:
+                if attempt >= self.retries or not any(marker in str(e) for marker in _THROTTLE_MARKERS):
+                    raise
+                attempt += 1
+                report.retries += 1
+                self.limiter.throttled() # Everyone slows down, not just this worker
+                continue
+            self.limiter.succeeded()
+            return results
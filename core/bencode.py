@@ -0,0 +1,215 @@
+# core/bencode.py
+"""Bencode decoding and .torrent metadata.
+
+The decoder walks the buffer once by offset, with no intermediate copies.
+Values under keys listed in `lazy_keys` (a torrent's 20-byte-per-piece
+"pieces" blob) come back as memoryview slices instead of bytes, so a
+multi-megabyte piece table is skipped rather than copied. The byte span of
+the values of the top-level keys in `span_keys` is recorded too: a torrent's info hash is the
+SHA-1 of its info dict exactly as written, so hashing that span gives the
+right hash even for torrents a re-encoder would not reproduce byte for byte
+(unsorted keys, extra fields).
+"""
+import hashlib
+import re
+from dataclasses import dataclass, field
+
+from core.models import FileInfo, format_size
+
+MAX_DEPTH = 64 # Nesting deeper than any real torrent; guards against crafted input
+# int() alone would also take " 5", "+5", "1_0", "-0" and "03"
+_LENGTH = re.compile(rb"[0-9]+")
+_INTEGER = re.compile(rb"-?[1-9][0-9]*|0")
+
+
+class BencodeError(ValueError):
+    """The data is not valid bencode."""
+
+
+class _Decoder:
+    def __init__(self, data: bytes, lazy_keys=frozenset(), span_keys=frozenset()):
+        self.data = data
+        self.size = len(data)
+        self.view = memoryview(data)
+        self.lazy_keys = lazy_keys
+        self.span_keys = span_keys
+        self.spans: dict[bytes, tuple[int, int]] = {} # key -> (start, end) of its dict value
+
+    def decode(self, pos: int, depth: int = 0, lazy: bool = False):
+        """Returns (value, position after it)."""
+        data = self.data
+        if pos >= self.size:
+            raise BencodeError("Unexpected end of data")
+        if depth > MAX_DEPTH:
+            raise BencodeError("Nesting too deep")
+        token = data[pos]
+        if 48 <= token <= 57: # b"0".."9": <length>:<bytes>
+            colon = data.find(b":", pos)
+            if colon < 0:
+                raise BencodeError(f"Unterminated string length at {pos}")
+            if not _LENGTH.fullmatch(data, pos, colon):
+                raise BencodeError(f"Bad string length at {pos}")
+            start = colon + 1
+            end = start + int(data[pos:colon])
+            if end > self.size:
+                raise BencodeError(f"String at {pos} runs past the end of the data")
+            return (self.view[start:end] if lazy else data[start:end]), end
+        if token == 105: # b"i": i<digits>e
+            end = data.find(b"e", pos)
+            if end < 0:
+                raise BencodeError(f"Unterminated integer at {pos}")
+            if not _INTEGER.fullmatch(data, pos + 1, end):
+                raise BencodeError(f"Bad integer at {pos}")
+            return int(data[pos + 1:end]), end + 1
+        if token == 108: # b"l"
+            items = []
+            pos += 1
+            while pos < self.size and data[pos] != 101: # b"e"
+                item, pos = self.decode(pos, depth + 1)
+                items.append(item)
+            if pos >= self.size:
+                raise BencodeError("Unterminated list")
+            return items, pos + 1
+        if token == 100: # b"d"
+            result = {}
+            pos += 1
+            while pos < self.size and data[pos] != 101:
+                # Keys are always strings: read them inline rather than through decode()
+                colon = data.find(b":", pos)
+                if colon < 0 or not _LENGTH.fullmatch(data, pos, colon):
+                    raise BencodeError(f"Dictionary key at {pos} is not a string")
+                start = colon + 1 + int(data[pos:colon])
+                if start > self.size:
+                    raise BencodeError(f"String at {pos} runs past the end of the data")
+                key = data[colon + 1:start]
+                pos = start
+                result[key], pos = self.decode(pos, depth + 1, lazy=key in self.lazy_keys)
+                if depth == 0 and key in self.span_keys:
+                    self.spans[key] = (start, pos) # Top-level keys only: a nested "info" is something else
+            if pos >= self.size:
+                raise BencodeError("Unterminated dictionary")
+            return result, pos + 1
+        raise BencodeError(f"Unexpected byte {bytes([token])!r} at {pos}")
+
+
+def decode(data: bytes, lazy_keys=frozenset()):
+    """Decodes one bencoded value; trailing bytes are an error."""
+    value, end = _Decoder(data, lazy_keys).decode(0)
+    if end != len(data):
+        raise BencodeError(f"Trailing data after position {end}")
+    return value
+
+
+def encode(value) -> bytes:
+    """Bencodes ints, bytes/str, lists and dicts (keys sorted, as the spec requires)."""
+    parts = []
+    _encode(value, parts)
+    return b"".join(parts)
+
+
+def _encode(value, parts):
+    if isinstance(value, bool) or not isinstance(value, (int, bytes, bytearray, memoryview, str, list, tuple, dict)):
+        raise TypeError(f"Can't bencode {type(value).__name__}")
+    if isinstance(value, int):
+        parts.append(b"i%de" % value)
+    elif isinstance(value, str):
+        _encode(value.encode("utf-8"), parts)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        parts.append(b"%d:" % len(value))
+        parts.append(bytes(value))
+    elif isinstance(value, (list, tuple)):
+        parts.append(b"l")
+        for item in value:
+            _encode(item, parts)
+        parts.append(b"e")
+    else:
+        parts.append(b"d")
+        items = [(key.encode("utf-8") if isinstance(key, str) else bytes(key), item) for key, item in value.items()]
+        for key, item in sorted(items, key=lambda pair: pair[0]):
+            _encode(key, parts)
+            _encode(item, parts)
+        parts.append(b"e")
+
+
+# --- Torrent Metadata --- #
+@dataclass
+class TorrentMetadata:
+    """What a .torrent file says about its content."""
+    name: str = ""
+    info_hash: str = "" # Lowercase hex SHA-1 of the info dict (v1)
+    piece_length: int = 0
+    piece_count: int = 0
+    total_size: int = 0
+    files: list[FileInfo] = field(default_factory=list) # Paths joined with "/", starting with the torrent's folder
+    private: bool = False
+    trackers: list[str] = field(default_factory=list)
+
+    @property
+    def magnet_link(self) -> str:
+        return f"magnet:?xt=urn:btih:{self.info_hash}" if self.info_hash else ""
+
+
+def _text(value) -> str:
+    if isinstance(value, (bytes, memoryview)):
+        return bytes(value).decode("utf-8", errors="replace")
+    return str(value) if value is not None else ""
+
+
+def _file_info(path_parts, length) -> FileInfo:
+    size = length if isinstance(length, int) and length >= 0 else 0
+    name = b"/".join(part if isinstance(part, bytes) else str(part).encode("utf-8") for part in path_parts)
+    return FileInfo(name=name.decode("utf-8", errors="replace"), size_bytes=size, size_str=format_size(size))
+
+
+def _walk_file_tree(tree: dict, prefix: list, files: list):
+    """v2 "file tree": {name: {name: ..., b"": {b"length": n}}}."""
+    for name, node in tree.items():
+        if not isinstance(node, dict):
+            continue
+        leaf = node.get(b"")
+        if isinstance(leaf, dict):
+            files.append(_file_info(prefix + [name], leaf.get(b"length")))
+        else:
+            _walk_file_tree(node, prefix + [name], files)
+
+
+def parse_torrent(data: bytes) -> TorrentMetadata:
+    """Reads the file list, piece size and info hash of a .torrent without
+    copying (or hashing piece by piece) its pieces table."""
+    decoder = _Decoder(data, lazy_keys=frozenset((b"pieces",)), span_keys=frozenset((b"info",)))
+    torrent, _end = decoder.decode(0) # Trailing bytes after the root dict are tolerated, as clients do
+    info = torrent.get(b"info") if isinstance(torrent, dict) else None
+    if not isinstance(info, dict):
+        raise BencodeError("Not a torrent file: no info dictionary")
+    start, end = decoder.spans[b"info"]
+
+    metadata = TorrentMetadata(
+        name=_text(info.get(b"name.utf-8") or info.get(b"name")),
+        info_hash=hashlib.sha1(decoder.view[start:end]).hexdigest(),
+        private=info.get(b"private") == 1)
+    piece_length = info.get(b"piece length")
+    metadata.piece_length = piece_length if isinstance(piece_length, int) else 0
+    pieces = info.get(b"pieces")
+    metadata.piece_count = len(pieces) // 20 if pieces is not None else 0
+
+    files = info.get(b"files")
+    if isinstance(files, list): # Multi-file: paths are relative to the torrent's folder (name)
+        for entry in files:
+            if not isinstance(entry, dict):
+                continue
+            if entry.get(b"attr", b"") and b"p" in bytes(entry[b"attr"]): # BEP 47 padding file
+                continue
+            path = entry.get(b"path.utf-8") or entry.get(b"path") or []
+            metadata.files.append(_file_info([metadata.name, *path], entry.get(b"length")))
+    elif isinstance(info.get(b"file tree"), dict): # v2-only torrent
+        _walk_file_tree(info[b"file tree"], [metadata.name], metadata.files)
+    else: # Single file
+        metadata.files.append(_file_info([metadata.name], info.get(b"length")))
+    metadata.total_size = sum(file_info.size_bytes for file_info in metadata.files)
+
+    announce_list = torrent.get(b"announce-list")
+    if isinstance(announce_list, list):
+        metadata.trackers = [_text(url) for tier in announce_list if isinstance(tier, list) for url in tier]
+    elif torrent.get(b"announce"):
+        metadata.trackers = [_text(torrent[b"announce"])]
+    return metadata
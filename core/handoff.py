@@ -0,0 +1,161 @@
+# core/handoff.py
+"""Hands many torrents to Transmission at once.
+
+The client's info hashes are fetched first (one torrent-get), so torrents it
+already has, or that repeat in the selection, are skipped without a call.
+torrent-add takes one torrent per call, so the rest are split into batches
+that run on a few connections in parallel, each batch back to back over its
+connection's session (TransmissionClient.add_torrents). Adds
+that never got an answer (connection lost, timeout) are retried after the
+others, with a growing pause; adds Transmission rejected are reported as is.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from core.models import magnet_info_hash
+
+MAX_WORKERS = 4 # Parallel connections; Transmission serializes the adds themselves
+BATCH_SIZE = 10 # Adds per batch, sent back to back on one connection
+
+
+@dataclass
+class HandoffItem:
+    """One torrent to send: a magnet link or .torrent URL."""
+    link: str
+    name: str = ""
+    info_hash: str = "" # Lowercase hex; torrents without one can't be checked before sending
+
+    @classmethod
+    def from_magnet(cls, magnet_link: str, name: str = "") -> "HandoffItem":
+        return cls(magnet_link, name, magnet_info_hash(magnet_link))
+
+
+@dataclass
+class HandoffReport:
+    """How a hand-off went."""
+    added: list[HandoffItem] = field(default_factory=list)
+    skipped: list[HandoffItem] = field(default_factory=list) # Client already had them (or repeated in the selection)
+    failed: list[tuple[HandoffItem, str]] = field(default_factory=list) # (item, last error)
+    retries: int = 0
+    seconds: float = 0.0
+
+
+class ClientHandoff:
+    """Sends HandoffItems through TransmissionClients made by client_factory (one per thread)."""
+
+    def __init__(self, client_factory, workers: int = MAX_WORKERS, batch_size: int = BATCH_SIZE,
+                 retries: int = 2, retry_delay: float = 1.0, paused: bool = False, download_dir: str | None = None):
+        self.client_factory = client_factory
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.paused = paused
+        self.download_dir = download_dir
+        self._local = threading.local()
+        self._clients = []
+        self._lock = threading.Lock()
+        self._done = 0
+
+    def run(self, items: list[HandoffItem], on_progress=None, is_cancelled=None) -> HandoffReport:
+        """Sends items; returns the report. on_progress(done, total, item, status) is called from
+        worker threads as each item settles; status is "added", "skipped" or "failed".
+        Raises ConnectionError if Transmission can't be reached at all."""
+        start = time.perf_counter()
+        report = HandoffReport()
+        self._done = 0
+        total = len(items)
+        is_cancelled = is_cancelled or (lambda: False)
+
+        def settle(item, status, error=None):
+            with self._lock:
+                if status == "added":
+                    report.added.append(item)
+                elif status == "skipped":
+                    report.skipped.append(item)
+                else:
+                    report.failed.append((item, error))
+                self._done += 1
+                done = self._done
+            if on_progress:
+                on_progress(done, total, item, status)
+
+        try:
+            known = self._client().hashes()
+            pending = []
+            queued = set()
+            for item in items:
+                key = item.info_hash or item.link
+                if item.info_hash in known or key in queued:
+                    settle(item, "skipped")
+                else:
+                    queued.add(key)
+                    pending.append(item)
+
+            batch_count = -(-len(pending) // self.batch_size)
+            # One pool for every round, so retries reuse the threads' connections
+            with ThreadPoolExecutor(max_workers=max(1, min(self.workers, batch_count)), thread_name_prefix="Handoff") as pool:
+                for attempt in range(self.retries + 1):
+                    if not pending:
+                        break
+                    if attempt:
+                        report.retries += len(pending)
+                        time.sleep(self.retry_delay * 2 ** (attempt - 1))
+                    failures = [] # (item, error), retried next round
+
+                    def handle(item, result, error):
+                        # Called on the batch's thread as each add returns
+                        if error is None:
+                            settle(item, "skipped" if result.duplicate else "added")
+                        elif result is not None:
+                            settle(item, "failed", error) # Transmission refused it; retrying won't help
+                        else:
+                            with self._lock:
+                                failures.append((item, error))
+
+                    batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+                    list(pool.map(lambda batch: self._send_batch(batch, handle, is_cancelled), batches))
+                    pending = [item for item, _error in failures]
+                    if is_cancelled() or attempt == self.retries:
+                        for item, error in failures:
+                            settle(item, "failed", error)
+                        break
+        finally:
+            for client in self._clients:
+                client.close()
+            self._clients = []
+        report.seconds = round(time.perf_counter() - start, 3)
+        return report
+
+    def _client(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.client_factory()
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def _send_batch(self, batch: list[HandoffItem], handle, is_cancelled):
+        """Sends one batch over this thread's connection; handle(item, AddResult, error) per item,
+        with AddResult None when the add never got an answer (connection lost, cancelled)."""
+        if is_cancelled():
+            for item in batch:
+                handle(item, None, "Cancelled")
+            return
+        sent = 0
+
+        def on_result(result):
+            nonlocal sent
+            item = batch[sent]
+            sent += 1
+            handle(item, result, result.error)
+
+        try:
+            self._client().add_torrents([item.link for item in batch], paused=self.paused,
+                                        download_dir=self.download_dir, on_result=on_result)
+        except ConnectionError as e:
+            self._local.client = None # Reconnect for the next batch on this thread
+            for item in batch[sent:]:
+                handle(item, None, str(e))
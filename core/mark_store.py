@@ -0,0 +1,450 @@
+# core/mark_store.py
+import array
+import binascii
+import bisect
+import mmap
+import os
+import re
+import struct
+import threading
+
+from core.models import magnet_info_hash
+
+_VIEW_ID_RE = re.compile(r"/view/(\d+)")
+NO_HASH = b"\0" * 20 # Stored for marks whose info hash isn't known
+
+
+def torrent_id_from_link(link: str) -> int | None:
+    """Numeric Nyaa torrent id from a detail link ('.../view/12345')."""
+    match = _VIEW_ID_RE.search(link or "")
+    return int(match.group(1)) if match else None
+
+
+def info_hash_from_magnet(magnet_link: str) -> bytes | None:
+    """20-byte BitTorrent v1 info hash from a magnet link (hex or base32 form)."""
+    info_hash = magnet_info_hash(magnet_link)
+    return bytes.fromhex(info_hash) if info_hash else None
+
+
+class _Snapshot:
+    """Read-only, memory-mapped view of a marks snapshot file.
+
+    Layout (native byte order, it's a local cache; use export_marks() to move
+    marks between machines): header, then `count` sorted uint32 torrent ids,
+    then `count` 20-byte info hashes in the same order.
+    """
+    HEADER = struct.Struct("=4sII") # magic, version, count
+    MAGIC = b"NYMK"
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.count = 0
+        self.ids = () # Sorted sequence of ints (memoryview when mapped)
+        self.hashes = b""
+        self._mm = None
+        self._views = []
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return # No snapshot yet
+        if size < self.HEADER.size:
+            return
+        try:
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not map marks snapshot {path}: {e}")
+            return
+        magic, version, count = self.HEADER.unpack_from(mm, 0)
+        if magic != self.MAGIC or version != self.VERSION or size != self.HEADER.size + count * 24:
+            print(f"Warning: Ignoring unrecognized marks snapshot {path}.")
+            mm.close()
+            return
+        view = memoryview(mm)
+        ids_end = self.HEADER.size + count * 4
+        self.ids = view[self.HEADER.size:ids_end].cast("I")
+        self.hashes = view[ids_end:]
+        self.count = count
+        self._mm = mm
+        self._views = [self.ids, self.hashes, view]
+
+    def index_of(self, torrent_id: int, lo: int = 0) -> int:
+        """Position of torrent_id, or -1. lo lets sorted batch lookups resume."""
+        i = bisect.bisect_left(self.ids, torrent_id, lo)
+        return i if i < self.count and self.ids[i] == torrent_id else -1
+
+    def hash_at(self, index: int) -> bytes:
+        return bytes(self.hashes[index * 20:index * 20 + 20])
+
+    def close(self):
+        for view in self._views:
+            view.release()
+        self._views = []
+        self.ids, self.hashes, self.count = (), b"", 0
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    @classmethod
+    def write(cls, path: str, entries: dict):
+        """Writes {torrent id: info hash} as a new snapshot via temp file + rename."""
+        ids = array.array("I", sorted(entries))
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(ids)))
+            f.write(ids.tobytes())
+            f.write(b"".join(entries[torrent_id] for torrent_id in ids))
+            f.flush()
+            os.fsync(f.fileno())
+        return temp_path
+
+
+class MarkStore:
+    """Marked torrents keyed by numeric torrent id, with their info hashes.
+
+    The bulk of the marks lives in a sorted, memory-mapped snapshot
+    (<base>.dat), so opening the store costs the same at 100 or 100k marks and
+    lookups are a binary search. Changes since the last snapshot live in a small
+    in-memory overlay and are appended to a journal (<base>.log) by a writer
+    thread, coalescing bursts of toggles. Once the journal is long enough it
+    is folded into a new snapshot (temp file + rename) and truncated.
+
+    Links are accepted wherever a key is needed; marked_flags() answers a whole
+    page of links under one lock.
+    """
+    FLUSH_DELAY = 0.5 # Seconds to let a burst of toggles coalesce into one write
+    COMPACT_MIN_ENTRIES = 1000 # Fold the journal into the snapshot past this many lines
+    ERROR_RETRY_DELAY = 5.0 # Seconds before retrying after a failed write
+    EXPORT_HEADER = "# Nyaa Desktop marked torrents: <torrent id> [<info hash hex>]"
+
+    def __init__(self, base_path: str, flush_delay: float = FLUSH_DELAY):
+        self.snapshot_path = f"{base_path}.dat"
+        self.journal_path = f"{base_path}.log"
+        self.flush_delay = flush_delay
+        self._lock = threading.Lock() # Guards in-memory state
+        self._io_lock = threading.Lock() # Serializes file writes; always taken before _lock
+        self._wake = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._snapshot = _Snapshot(self.snapshot_path)
+        self._overlay = {} # torrent id -> info hash (marked) or None (unmarked), newer than the snapshot
+        self._pending = {} # Same shape, not yet appended to the journal
+        self._hash_index = None # info hash -> torrent id for the snapshot and overlay, built on first use
+        self._journal_entries = 0
+        self._flush_requested = False
+        self._writing = False
+        self._closed = False
+        self._load_journal()
+        self._count = self._recount()
+        print(f"Opened {self._count} marked torrents ({self._snapshot.count} in snapshot, "
+              f"{self._journal_entries} journal entries).")
+        self._thread = threading.Thread(target=self._writer_loop, name="MarkStoreWriter", daemon=True)
+        self._thread.start()
+
+    # --- Lookups ---
+    def __contains__(self, link) -> bool:
+        torrent_id = torrent_id_from_link(link)
+        if torrent_id is None:
+            return False
+        with self._lock:
+            return self._is_marked(torrent_id)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def marked_flags(self, links, info_hashes=None) -> list[bool]:
+        """Marked state for a page of links, in order, under one lock.
+
+        info_hashes (hex, parallel to links, "" when unknown) also counts a
+        link as marked when its torrent was marked under another link.
+        """
+        ids = [torrent_id_from_link(link) for link in links]
+        flags = [False] * len(ids)
+        order = sorted((torrent_id, i) for i, torrent_id in enumerate(ids) if torrent_id is not None)
+        with self._lock:
+            lo = 0
+            for torrent_id, i in order:
+                state = self._overlay.get(torrent_id, False)
+                if state is not False:
+                    flags[i] = state is not None
+                    continue
+                found = bisect.bisect_left(self._snapshot.ids, torrent_id, lo)
+                lo = found # Ids are sorted, so the next search starts here
+                flags[i] = found < self._snapshot.count and self._snapshot.ids[found] == torrent_id
+            if info_hashes is not None:
+                for i, info_hash in enumerate(info_hashes):
+                    if not flags[i] and len(info_hash or "") == 40:
+                        flags[i] = self._hash_marked(bytes.fromhex(info_hash))
+        return flags
+
+    def contains_hash(self, info_hash: bytes) -> bool:
+        """True if a mark with this 20-byte info hash exists (e.g. from another site/mirror)."""
+        if not info_hash or info_hash == NO_HASH:
+            return False
+        with self._lock:
+            return self._hash_marked(info_hash)
+
+    # --- Changes ---
+    def add(self, link: str, magnet_link: str = ""):
+        torrent_id = torrent_id_from_link(link)
+        if torrent_id is None:
+            print(f"Warning: Cannot mark '{link}', it has no torrent id.")
+            return
+        with self._lock:
+            self._set(torrent_id, info_hash_from_magnet(magnet_link) or NO_HASH)
+
+    def discard(self, link: str, magnet_link: str = ""):
+        """Unmarks link, and with magnet_link also the same torrent marked under another link."""
+        torrent_id = torrent_id_from_link(link)
+        info_hash = info_hash_from_magnet(magnet_link)
+        with self._lock:
+            if torrent_id is not None:
+                self._set(torrent_id, None)
+            if info_hash and self._hash_marked(info_hash):
+                self._set(self._hash_index[info_hash], None)
+
+    def update(self, links):
+        """Marks many links at once, straight into a new snapshot."""
+        entries = {}
+        for link in links:
+            torrent_id = torrent_id_from_link(link)
+            if torrent_id is not None:
+                entries[torrent_id] = NO_HASH
+        return self._merge(entries)
+
+    def clear(self):
+        with self._io_lock:
+            with self._lock:
+                self._overlay.clear()
+                self._pending.clear()
+            self._install_snapshot({})
+
+    # --- Import / Export ---
+    def export_marks(self, path: str) -> int:
+        """Writes every mark as '<id> <hash hex>' lines. Returns the count written."""
+        with self._lock:
+            snapshot = self._snapshot
+            ids = list(snapshot.ids)
+            hashes = bytes(snapshot.hashes)
+            overlay = dict(self._overlay)
+        lines = [self.EXPORT_HEADER]
+        for i, torrent_id in enumerate(ids):
+            if torrent_id in overlay:
+                continue
+            lines.append(_export_line(torrent_id, hashes[i * 20:i * 20 + 20]))
+        lines.extend(_export_line(torrent_id, info_hash) for torrent_id, info_hash in overlay.items()
+                     if info_hash is not None)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        print(f"Exported {len(lines) - 1} marked torrents to {path}.")
+        return len(lines) - 1
+
+    def import_marks(self, path: str) -> int:
+        """Adds marks from an export (or a plain list of detail links). Returns the count read."""
+        entries = {}
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if not fields or fields[0].startswith("#"):
+                    continue
+                torrent_id = int(fields[0]) if fields[0].isdigit() else torrent_id_from_link(fields[0])
+                if torrent_id is None:
+                    continue
+                info_hash = NO_HASH
+                if len(fields) > 1 and len(fields[1]) == 40:
+                    try:
+                        info_hash = binascii.unhexlify(fields[1])
+                    except binascii.Error:
+                        pass
+                entries[torrent_id] = info_hash
+        self._merge(entries)
+        print(f"Imported {len(entries)} marked torrents from {path}.")
+        return len(entries)
+
+    # --- Persistence ---
+    def flush(self, timeout: float | None = None) -> bool:
+        """Writes queued changes now and waits for them. Returns False on timeout."""
+        with self._lock:
+            self._flush_requested = True
+            self._wake.notify()
+            return self._idle.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def close(self, timeout: float | None = 5.0):
+        """Flushes and stops the writer thread (call on shutdown)."""
+        self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        self._thread.join(timeout)
+        with self._io_lock, self._lock:
+            self._snapshot.close()
+
+    # --- Internals (callers hold _lock unless noted) ---
+    def _is_marked(self, torrent_id: int) -> bool:
+        state = self._overlay.get(torrent_id, False)
+        if state is not False:
+            return state is not None
+        return self._snapshot.index_of(torrent_id) >= 0
+
+    def _stored_hash(self, torrent_id: int) -> bytes | None:
+        """Info hash the mark for torrent_id carries (maybe NO_HASH), or None if unmarked."""
+        state = self._overlay.get(torrent_id, False)
+        if state is not False:
+            return state
+        index = self._snapshot.index_of(torrent_id)
+        return self._snapshot.hash_at(index) if index >= 0 else None
+
+    def _hash_marked(self, info_hash: bytes) -> bool:
+        if self._hash_index is None:
+            snapshot = self._snapshot
+            self._hash_index = {snapshot.hash_at(i): snapshot.ids[i] for i in range(snapshot.count)}
+            self._hash_index.update((value, torrent_id) for torrent_id, value in self._overlay.items() if value)
+            self._hash_index.pop(NO_HASH, None)
+        torrent_id = self._hash_index.get(info_hash) # Entries can be stale (unmarked since): checked below
+        return torrent_id is not None and self._is_marked(torrent_id)
+
+    def _set(self, torrent_id: int, info_hash: bytes | None):
+        was_marked = self._is_marked(torrent_id)
+        if was_marked == (info_hash is not None):
+            return
+        if info_hash is None and self._hash_index is not None:
+            old_hash = self._stored_hash(torrent_id)
+            if old_hash != NO_HASH and self._hash_index.get(old_hash) == torrent_id:
+                self._hash_index = None # Another mark may share the hash: rebuilt on next use
+        self._count += 1 if info_hash is not None else -1
+        self._overlay[torrent_id] = info_hash
+        if info_hash and self._hash_index is not None:
+            self._hash_index[info_hash] = torrent_id
+        if not self._pending:
+            self._wake.notify() # Only the first change wakes the writer, so bursts coalesce
+        self._pending[torrent_id] = info_hash
+
+    def _recount(self) -> int:
+        count = self._snapshot.count
+        for torrent_id, info_hash in self._overlay.items():
+            in_snapshot = self._snapshot.index_of(torrent_id) >= 0
+            if info_hash is not None and not in_snapshot:
+                count += 1
+            elif info_hash is None and in_snapshot:
+                count -= 1
+        return count
+
+    def _load_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        try:
+            with open(self.journal_path, "r", encoding="ascii") as f:
+                for line in f:
+                    fields = line[1:].split()
+                    if not fields or not fields[0].isdigit() or line[0] not in "+-":
+                        continue
+                    self._journal_entries += 1
+                    torrent_id = int(fields[0])
+                    if line[0] == "-":
+                        self._overlay[torrent_id] = None
+                    else:
+                        info_hash = NO_HASH
+                        if len(fields) > 1:
+                            try:
+                                info_hash = binascii.unhexlify(fields[1])
+                            except binascii.Error:
+                                pass
+                        self._overlay[torrent_id] = info_hash
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Warning: Could not read marks journal {self.journal_path}: {e}")
+
+    def _merge(self, entries: dict) -> int:
+        """Folds entries (plus the overlay) into a new snapshot, bypassing the journal."""
+        if not entries:
+            return 0
+        with self._io_lock:
+            with self._lock:
+                overlay = dict(self._overlay)
+                for torrent_id, info_hash in entries.items():
+                    if info_hash == NO_HASH: # Don't lose a hash already stored for this mark
+                        info_hash = self._stored_hash(torrent_id) or NO_HASH
+                    overlay[torrent_id] = info_hash
+                self._pending.clear() # All of it lands in the snapshot
+            self._compact(overlay)
+        return len(entries)
+
+    def _compact(self, overlay: dict):
+        """Writes snapshot + overlay as the new snapshot. Caller holds _io_lock only."""
+        snapshot = self._snapshot # Only swapped under _io_lock, which we hold
+        merged = {snapshot.ids[i]: snapshot.hash_at(i) for i in range(snapshot.count)}
+        for torrent_id, info_hash in overlay.items():
+            if info_hash is None:
+                merged.pop(torrent_id, None)
+            else:
+                merged[torrent_id] = info_hash
+        self._install_snapshot(merged, overlay)
+
+    def _install_snapshot(self, entries: dict, folded: dict | None = None):
+        """Writes entries as the snapshot, swaps it in and truncates the journal (caller holds _io_lock)."""
+        temp_path = _Snapshot.write(self.snapshot_path, entries)
+        with self._lock:
+            self._snapshot.close() # Windows can't replace a mapped file
+            os.replace(temp_path, self.snapshot_path)
+            self._snapshot = _Snapshot(self.snapshot_path)
+            self._hash_index = None
+            # Keep only overlay entries changed after `folded` was taken
+            for torrent_id, info_hash in (folded or {}).items():
+                if self._overlay.get(torrent_id, False) == info_hash:
+                    del self._overlay[torrent_id]
+            self._count = self._recount()
+        with open(self.journal_path, "w", encoding="ascii"):
+            pass # Everything in it is in the snapshot now
+        self._journal_entries = 0
+        print(f"Wrote marks snapshot with {len(entries)} entries.")
+
+    def _writer_loop(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._wake.wait()
+                if not self._pending:
+                    self._idle.notify_all()
+                    return # Closed with nothing left to write
+                if not (self._closed or self._flush_requested):
+                    self._wake.wait(self.flush_delay) # Let the burst coalesce
+
+            error = None
+            with self._io_lock:
+                with self._lock:
+                    batch, self._pending = self._pending, {}
+                    compact = self._journal_entries + len(batch) > self.COMPACT_MIN_ENTRIES
+                    overlay = dict(self._overlay) if compact else None
+                    self._flush_requested = False
+                    self._writing = True
+                try:
+                    if compact:
+                        self._compact(overlay)
+                    elif batch:
+                        self._append(batch)
+                except OSError as e:
+                    error = e
+                    print(f"Warning: Could not write marks to {self.journal_path}: {e}")
+
+            with self._lock:
+                self._writing = False
+                if error is not None:
+                    # Requeue what wasn't written; anything changed since is newer and wins
+                    for torrent_id, info_hash in batch.items():
+                        self._pending.setdefault(torrent_id, info_hash)
+                self._idle.notify_all()
+                if error is not None and not self._closed:
+                    self._wake.wait(self.ERROR_RETRY_DELAY)
+                if error is not None and self._closed:
+                    return # Don't spin on a broken disk during shutdown
+
+    def _append(self, batch: dict):
+        lines = "".join(f"-{torrent_id}\n" if info_hash is None else f"+{_export_line(torrent_id, info_hash)}\n"
+                        for torrent_id, info_hash in batch.items())
+        with open(self.journal_path, "a", encoding="ascii") as f:
+            f.write(lines)
+        self._journal_entries += len(batch)
+
+
+def _export_line(torrent_id: int, info_hash: bytes) -> str:
+    if info_hash == NO_HASH:
+        return str(torrent_id)
+    return f"{torrent_id} {binascii.hexlify(info_hash).decode('ascii')}"
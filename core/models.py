@@ -0,0 +1,106 @@
+# core/models.py
+"""Plain data passed between the scraper and the UI.
+
+Kept free of network/parsing and Qt imports, so the GUI can load it before
+(or without) the scraper stack.
+"""
+import base64
+import binascii
+import math
+import re
+from dataclasses import dataclass, field
+
+# How much of a details page is parsed up front; the rest is fetched on demand
+DETAIL_COMMENT_LIMIT = 50
+DETAIL_DESCRIPTION_LIMIT = 64 * 1024 # Characters of description HTML
+
+_BTIH_RE = re.compile(r"urn:btih:([0-9A-Za-z]+)")
+
+# --- Helper Functions ---
+def format_size(size_bytes):
+    """Converts bytes to human-readable format."""
+    if size_bytes is None or not isinstance(size_bytes, (int, float)) or size_bytes < 0:
+        return "N/A"
+    if size_bytes == 0:
+        return "0 B"
+    size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+    try:
+        if size_bytes < 1: # Avoid log(0) or log(<1)
+            i = 0
+        else:
+            i = int(math.floor(math.log(size_bytes, 1024)))
+            # Ensure index doesn't exceed tuple length (handles massive sizes)
+            if i >= len(size_name):
+                i = len(size_name) - 1
+        p = math.pow(1024, i)
+        s = round(size_bytes / p, 2) if p > 0 else 0
+        return f"{s} {size_name[i]}"
+    except (ValueError, TypeError):
+        return "N/A"
+
+def normalize_info_hash(value: str) -> str:
+    """A v1 info hash in hex (any case) or base32 form -> 40 lowercase hex digits, '' if invalid."""
+    value = (value or "").strip()
+    try:
+        if len(value) == 40:
+            return binascii.unhexlify(value).hex()
+        if len(value) == 32:
+            return base64.b32decode(value.upper()).hex()
+    except (binascii.Error, ValueError):
+        pass
+    return ""
+
+
+def magnet_info_hash(magnet_link: str) -> str:
+    """Normalized info hash from a magnet link's xt=urn:btih: parameter, '' if it has none."""
+    match = _BTIH_RE.search(magnet_link or "")
+    return normalize_info_hash(match.group(1)) if match else ""
+
+
+# --- Data Classes ---
+@dataclass
+class ScrapeResult:
+    """Holds data for a single torrent entry in search results."""
+    category: str
+    name: str
+    link: str # URL to the torrent's detail page
+    magnet_link: str
+    size: str # Human-readable size string from Nyaa
+    date: str # Date string from Nyaa
+    seeders: int
+    leechers: int
+    downloads: int # Completed downloads count from Nyaa
+    uploader: str = "Anonymous"
+    size_bytes: int = 0 # Add the size in bytes for filtering
+    timestamp: int = 0 # Upload time (Unix seconds) for numeric date sorting
+    info_hash: str = "" # Lowercase hex, from the magnet link; '' if it has none
+
+@dataclass
+class FileInfo:
+    """Holds information about a single file within a torrent."""
+    name: str
+    size_bytes: int = 0
+    size_str: str = "N/A" # Human-readable size string
+
+@dataclass
+class TorrentDetails:
+    """Holds detailed information scraped from a torrent's Nyaa page."""
+    title: str = "N/A"
+    category: str = "N/A"
+    submitter: str = "N/A"
+    date_submitted: str = "N/A"
+    size_str: str = "N/A"
+    seeders: int | None = None
+    leechers: int | None = None
+    completed: int | None = None
+    info_hash: str = "N/A"
+    description: str = "No description available."
+    file_list: list[FileInfo] = field(default_factory=list)
+    information: str = "N/A" # Raw text from the 'Information' field (may overlap with others)
+    magnet_link: str = ""
+    image_urls: list[str] = field(default_factory=list) # List to store image URLs
+    comments: list[dict] = field(default_factory=list) # The first comment_limit comments on the page
+    url: str = "" # Detail page the rest of the description/comments can be fetched from
+    comment_count: int = 0 # Comment divs on the page, including the ones not parsed yet
+    comments_next: int = 0 # Index of the first comment div not parsed yet; more comments are fetched from here
+    description_truncated: bool = False # description holds only the first description_limit characters
@@ -0,0 +1,251 @@
+# core/release_parser.py
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# --- Precompiled Patterns ---
+# Everything here runs once per *distinct* name thanks to the lru_cache on
+# parse_release_name, so result pages that repeat names cost a dict lookup.
+_EXTENSION_RE = re.compile(r'\.(mkv|mp4|avi|m4v|webm|ts|wmv|flac|mp3|zip|rar|7z|cbz|cbr|epub|pdf)$', re.IGNORECASE)
+_LEADING_GROUP_RE = re.compile(r'^\s*[\[【]([^\]】]+)[\]】]\s*')
+_BRACKET_RE = re.compile(r'[\[【(]([^\]】)]*)[\]】)]')
+_CRC_RE = re.compile(r'^[0-9A-Fa-f]{8}$')
+_RESOLUTION_RE = re.compile(r'\b(?:(\d{3,4})[pi]|\d{3,4}x(\d{3,4})|(4k|uhd))\b', re.IGNORECASE)
+_CODEC_RE = re.compile(r'\b(x\.?26[45]|h\.?26[45]|hevc|avc|av1|xvid|vp9)\b', re.IGNORECASE)
+# A bare '-' only counts as a range without spaces ('01-12'); 'Title 7 - 05' is an episode
+_RANGE_RE = re.compile(r'(?:^|[\s\-_(\[])(?:e|ep|episodes?\s*)?(\d{1,4})(?:-|\s*(?:~|to)\s*)(?:e|ep)?(\d{1,4})(?=$|[\s)\]_])', re.IGNORECASE)
+_SEASON_EPISODE_RE = re.compile(r'\bS(\d{1,2})\s*E(\d{1,4})(?:v\d)?\b', re.IGNORECASE)
+_SEASON_RE = re.compile(r'\b(?:S(\d{1,2})|Season\s*(\d{1,2})|(\d{1,2})(?:st|nd|rd|th)\s+Season)\b', re.IGNORECASE)
+_EPISODE_RE = re.compile(r'(?:\s-\s*|\b(?:E|EP|Episode)\s*)(\d{1,4}(?:\.\d)?)(?:v\d)?(?=$|[\s\[(\-_.])', re.IGNORECASE)
+_BATCH_WORD_RE = re.compile(r'\b(batch|complete|bd\s*box|collection)\b', re.IGNORECASE)
+_TRAILING_JUNK_RE = re.compile(r'[\s\-_~|:.]+$')
+_NON_ALNUM_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+_CODEC_NAMES = {
+    "x264": "H.264", "h264": "H.264", "h.264": "H.264", "x.264": "H.264", "avc": "H.264",
+    "x265": "H.265", "h265": "H.265", "h.265": "H.265", "x.265": "H.265", "hevc": "H.265",
+    "av1": "AV1", "xvid": "XviD", "vp9": "VP9",
+}
+
+
+# --- Data Classes ---
+@dataclass(frozen=True)
+class ReleaseInfo:
+    """Structured view of a release name like '[Group] Title - 07 (1080p) [ABCD1234].mkv'."""
+    group: str = ""
+    title: str = ""
+    season: int | None = None
+    episode_start: float | None = None # Single episode: start == end
+    episode_end: float | None = None
+    is_batch: bool = False
+    resolution: str = "" # Normalized, e.g. '1080p'
+    codec: str = "" # Normalized, e.g. 'H.265'
+    crc: str = "" # Upper-case CRC32 tag if present
+    series_key: str = "" # Casefolded title (+ season) used for grouping
+
+    @property
+    def episode_label(self) -> str:
+        """Human-readable episode / range label ('07', '01-12', 'Batch' or '')."""
+        if self.episode_start is None:
+            return "Batch" if self.is_batch else ""
+        start = _format_episode(self.episode_start)
+        if self.episode_end is not None and self.episode_end != self.episode_start:
+            return f"{start}-{_format_episode(self.episode_end)}"
+        return start
+
+
+def _format_episode(value: float) -> str:
+    return f"{int(value):02d}" if float(value).is_integer() else str(value)
+
+
+def _normalize_resolution(match: re.Match) -> str:
+    progressive, height, uhd = match.groups()
+    if uhd:
+        return "2160p"
+    return f"{progressive or height}p"
+
+
+def _clean_title(text: str) -> str:
+    # Names without spaces use '.' or '_' as separators
+    if ' ' not in text:
+        text = text.replace('_', ' ').replace('.', ' ')
+    text = _TRAILING_JUNK_RE.sub('', text.strip())
+    return re.sub(r'\s{2,}', ' ', text)
+
+
+def make_series_key(title: str, season: int | None = None) -> str:
+    """Normalizes a title for grouping (casefold, punctuation collapsed)."""
+    key = _NON_ALNUM_RE.sub(' ', title.casefold()).strip()
+    if season is not None and season > 1:
+        key = f"{key} s{season}"
+    return key
+
+
+# --- Tokenizer ---
+@lru_cache(maxsize=16384)
+def parse_release_name(name: str) -> ReleaseInfo:
+    """Tokenizes a Nyaa release name. Results are memoized per distinct name."""
+    if not name:
+        return ReleaseInfo()
+
+    text = name.strip()
+    text = _EXTENSION_RE.sub('', text)
+
+    group = ""
+    group_match = _LEADING_GROUP_RE.match(text)
+    if group_match:
+        group = group_match.group(1).strip()
+        text = text[group_match.end():]
+
+    resolution = ""
+    codec = ""
+    crc = ""
+    season = None
+    tag_is_batch = False
+    episode_start = None
+    episode_end = None
+
+    # Bracketed tags carry most of the metadata ([1080p], (HEVC x265 10bit), [ABCD1234], (01-12))
+    for tag_match in _BRACKET_RE.finditer(text):
+        tag = tag_match.group(1).strip()
+        if _CRC_RE.match(tag):
+            crc = tag.upper()
+            continue
+        if not resolution:
+            res_match = _RESOLUTION_RE.search(tag)
+            if res_match:
+                resolution = _normalize_resolution(res_match)
+        if not codec:
+            codec_match = _CODEC_RE.search(tag)
+            if codec_match:
+                codec = _CODEC_NAMES.get(codec_match.group(1).lower(), codec_match.group(1))
+        if season is None:
+            season_match = _SEASON_RE.search(tag)
+            if season_match:
+                season = int(next(g for g in season_match.groups() if g))
+        if not tag_is_batch and _BATCH_WORD_RE.search(tag):
+            tag_is_batch = True
+        if episode_start is None:
+            range_match = _RANGE_RE.search(tag)
+            if range_match and not _RESOLUTION_RE.search(tag):
+                episode_start, episode_end = float(range_match.group(1)), float(range_match.group(2))
+
+    core = _BRACKET_RE.sub(' ', text)
+    # Tags may also appear unbracketed (common in dotted scene-style names)
+    if not resolution:
+        res_match = _RESOLUTION_RE.search(core)
+        if res_match:
+            resolution = _normalize_resolution(res_match)
+    if not codec:
+        codec_match = _CODEC_RE.search(core)
+        if codec_match:
+            codec = _CODEC_NAMES.get(codec_match.group(1).lower(), codec_match.group(1))
+
+    title_end = len(core)
+
+    se_match = _SEASON_EPISODE_RE.search(core)
+    if se_match:
+        season = int(se_match.group(1))
+        if episode_start is None:
+            episode_start = episode_end = float(se_match.group(2))
+        title_end = min(title_end, se_match.start())
+    else:
+        season_match = _SEASON_RE.search(core)
+        if season_match:
+            season = int(next(g for g in season_match.groups() if g))
+            title_end = min(title_end, season_match.start())
+
+    range_match = _RANGE_RE.search(core)
+    if range_match and episode_start is None:
+        episode_start, episode_end = float(range_match.group(1)), float(range_match.group(2))
+    if range_match:
+        title_end = min(title_end, range_match.start())
+    else:
+        episode_match = _EPISODE_RE.search(core)
+        if episode_match:
+            if episode_start is None:
+                episode_start = episode_end = float(episode_match.group(1))
+            title_end = min(title_end, episode_match.start())
+
+    # Resolution/codec tokens left in the title area (dotted names) end the title too
+    for token_re in (_RESOLUTION_RE, _CODEC_RE):
+        token_match = token_re.search(core, 0, title_end)
+        if token_match:
+            title_end = min(title_end, token_match.start())
+
+    batch_match = _BATCH_WORD_RE.search(core)
+    is_batch = tag_is_batch or bool(batch_match) or (episode_start is not None and episode_end is not None and episode_end > episode_start)
+    if batch_match:
+        title_end = min(title_end, batch_match.start())
+
+    title = _clean_title(core[:title_end]) or _clean_title(core) or name.strip()
+
+    return ReleaseInfo(
+        group=group, title=title, season=season,
+        episode_start=episode_start, episode_end=episode_end, is_batch=is_batch,
+        resolution=resolution, codec=codec, crc=crc,
+        series_key=make_series_key(title, season),
+    )
+
+
+# --- Series Index ---
+@dataclass
+class SeriesGroup:
+    """A run of results that belong to the same series."""
+    key: str
+    title: str
+    rows: list[int] = field(default_factory=list) # Indices into the indexed result list
+
+
+class SeriesIndex:
+    """Groups result rows by series key. Build is O(n) over memoized parses.
+
+    Rows are positions in the list that was indexed (e.g. MainWindow.current_results);
+    groups keep the order in which each series first appeared.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._infos: list[ReleaseInfo] = []
+        self._groups: dict[str, SeriesGroup] = {}
+
+    def build(self, names) -> "SeriesIndex":
+        """Rebuilds the index from an iterable of release names."""
+        self.clear()
+        self.extend(names)
+        return self
+
+    def extend(self, names):
+        """Appends more rows (e.g. the next page) without re-parsing existing ones."""
+        groups = self._groups
+        infos = self._infos
+        for name in names:
+            info = parse_release_name(name)
+            row = len(infos)
+            infos.append(info)
+            group = groups.get(info.series_key)
+            if group is None:
+                group = groups[info.series_key] = SeriesGroup(info.series_key, info.title)
+            group.rows.append(row)
+
+    def __len__(self):
+        return len(self._infos)
+
+    def info(self, row: int) -> ReleaseInfo:
+        return self._infos[row]
+
+    def key_for_row(self, row: int) -> str:
+        return self._infos[row].series_key
+
+    def group(self, key: str) -> SeriesGroup | None:
+        return self._groups.get(key)
+
+    def groups(self) -> list[SeriesGroup]:
+        """Groups in order of first appearance."""
+        return list(self._groups.values())
+
+    def grouped_order(self) -> list[int]:
+        """Row order that places every series contiguously (stable within a series)."""
+        return [row for group in self._groups.values() for row in group.rows]
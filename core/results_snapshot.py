@@ -0,0 +1,80 @@
+# core/results_snapshot.py
+"""The last displayed results page, kept between sessions for an instant warm start."""
+import json
+import os
+import time
+from dataclasses import dataclass, field, fields
+
+from core.models import ScrapeResult, magnet_info_hash
+
+SNAPSHOT_VERSION = 1
+_RESULT_FIELDS = [f.name for f in fields(ScrapeResult)]
+
+
+@dataclass
+class ResultsSnapshot:
+    """A search (query, filters, page, sort) and the rows it showed when it was saved."""
+    query: str = ""
+    category: str = "0_0"
+    sort_by: str = "date"
+    page: int = 1
+    last_page_reached: bool = False # Nyaa sent a short page, so there is no next one
+    trusted_only: bool = False
+    uploader: str = ""
+    local_sort_column: int = -1 # -1 if the rows were in Nyaa's order
+    local_sort_ascending: bool = False
+    saved_at: float = 0.0 # Unix seconds
+    results: list[ScrapeResult] = field(default_factory=list)
+
+    def age_text(self, now: float | None = None) -> str:
+        """'3 min ago' style age for the stale banner."""
+        seconds = max(0, int((now if now is not None else time.time()) - self.saved_at))
+        if seconds < 60:
+            return "just now"
+        for unit_seconds, unit in ((86400, "day"), (3600, "hour"), (60, "min")):
+            if seconds >= unit_seconds:
+                count = seconds // unit_seconds
+                return f"{count} {unit}{'s' if count != 1 and unit != 'min' else ''} ago"
+
+
+def save_snapshot(path: str, snapshot: ResultsSnapshot):
+    """Writes the snapshot atomically. Rows are stored as value lists under one shared
+    field list, which keeps a 75-row page around 30 KB."""
+    document = {
+        "version": SNAPSHOT_VERSION,
+        "search": {key: getattr(snapshot, key) for key in (
+            "query", "category", "sort_by", "page", "last_page_reached", "trusted_only", "uploader",
+            "local_sort_column", "local_sort_ascending")},
+        "saved_at": snapshot.saved_at or time.time(),
+        "fields": _RESULT_FIELDS,
+        "rows": [[getattr(result, name) for name in _RESULT_FIELDS] for result in snapshot.results],
+    }
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+
+def load_snapshot(path: str) -> ResultsSnapshot | None:
+    """Reads a snapshot written by save_snapshot. None if there is none or it can't be used."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read results snapshot {path}: {e}")
+        return None
+    if not isinstance(document, dict) or document.get("version") != SNAPSHOT_VERSION:
+        print(f"Warning: Ignoring results snapshot {path} (unknown format).")
+        return None
+    try:
+        names = document["fields"]
+        results = [ScrapeResult(**dict(zip(names, row))) for row in document["rows"]]
+        if "info_hash" not in names: # Saved before results carried their hash
+            for result in results:
+                result.info_hash = magnet_info_hash(result.magnet_link)
+        return ResultsSnapshot(saved_at=float(document["saved_at"]), results=results, **document["search"])
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Warning: Ignoring results snapshot {path} (invalid data: {e}).")
+        return None
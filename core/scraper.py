@@ -1,76 +1,26 @@
 # core/scraper.py
 import requests
-from bs4 import BeautifulSoup
-from dataclasses import dataclass, field
+from bs4 import BeautifulSoup, SoupStrainer
 import cloudscraper
 import re
-import math
 import traceback
-from PySide6.QtCore import QSize
-
-# --- Helper Functions ---
-def format_size(size_bytes):
-    """Converts bytes to human-readable format."""
-    if size_bytes is None or not isinstance(size_bytes, (int, float)) or size_bytes < 0:
-        return "N/A"
-    if size_bytes == 0:
-        return "0 B"
-    size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-    try:
-        if size_bytes < 1: # Avoid log(0) or log(<1)
-            i = 0
-        else:
-            i = int(math.floor(math.log(size_bytes, 1024)))
-            # Ensure index doesn't exceed tuple length (handles massive sizes)
-            if i >= len(size_name):
-                i = len(size_name) - 1
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2) if p > 0 else 0
-        return f"{s} {size_name[i]}"
-    except (ValueError, TypeError):
-        return "N/A"
-
-# --- Data Classes ---
-@dataclass
-class ScrapeResult:
-    """Holds data for a single torrent entry in search results."""
-    category: str
-    name: str
-    link: str # URL to the torrent's detail page
-    magnet_link: str
-    size: str # Human-readable size string from Nyaa
-    date: str # Date string from Nyaa
-    seeders: int
-    leechers: int
-    downloads: int # Completed downloads count from Nyaa
-    uploader: str = "Anonymous"
-    size_bytes: int = 0 # Add the size in bytes for filtering
-
-@dataclass
-class FileInfo:
-    """Holds information about a single file within a torrent."""
-    name: str
-    size_bytes: int = 0
-    size_str: str = "N/A" # Human-readable size string
-
-@dataclass
-class TorrentDetails:
-    """Holds detailed information scraped from a torrent's Nyaa page."""
-    title: str = "N/A"
-    category: str = "N/A"
-    submitter: str = "N/A"
-    date_submitted: str = "N/A"
-    size_str: str = "N/A"
-    seeders: int | None = None
-    leechers: int | None = None
-    completed: int | None = None
-    info_hash: str = "N/A"
-    description: str = "No description available."
-    file_list: list[FileInfo] = field(default_factory=list)
-    information: str = "N/A" # Raw text from the 'Information' field (may overlap with others)
-    magnet_link: str = ""
-    image_urls: list[str] = field(default_factory=list) # List to store image URLs
-    comments: list[dict] = field(default_factory=list)
+from datetime import datetime, timezone
+
+# Data classes live in core.models (no third-party imports); re-exported here for existing callers
+from core.models import (format_size, magnet_info_hash, ScrapeResult, FileInfo, TorrentDetails,
+                         DETAIL_COMMENT_LIMIT, DETAIL_DESCRIPTION_LIMIT)
+from core.bencode import BencodeError, TorrentMetadata, parse_torrent
+
+# --- Detail Page Patterns --- #
+_COL_MD_CLASS = re.compile(r'col-md-\d+')
+_USER_LINK = re.compile(r'/user/')
+_MARKDOWN_IMAGE = re.compile(r'!\[.*?\]\((.*?)\)')
+_FILE_NAME_WITH_SIZE = re.compile(r'^(.*?)\s*\([\d.,]+\s*[KMGTPEZY]?I?B\)$')
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+_COMMENTS_CONTAINER = re.compile(r'<div\s(?:[^>]*\s)?id\s*=\s*["\']?comments[\s"\'>]', re.IGNORECASE)
+# A div whose class list has the token "comment" (not "comment-content"), as _comment_divs selects them
+_COMMENT_DIV = re.compile(r'<div\s(?:[^>]*\s)?class\s*=\s*["\']?(?:[^"\'>]*\s)?comment[\s"\'>]', re.IGNORECASE)
+_TORRENT_ID = re.compile(r'/(?:view|download)/(\d+)(?:\.torrent)?/?$')
 
 # --- Scraper Class ---
 class NyaaScraper:
@@ -82,10 +32,15 @@ class NyaaScraper:
         "seeders": "seeders",
         "leechers": "leechers",
         "size": "size",
-        "name": "name"
+        "name": "name",
+        "downloads": "downloads"
     }
     SORT_DEFAULT = "id"
     ORDER_DEFAULT = "desc"
+    # How much of a details page is parsed up front; the rest is fetched on demand
+    DETAIL_COMMENT_LIMIT = DETAIL_COMMENT_LIMIT
+    DETAIL_DESCRIPTION_LIMIT = DETAIL_DESCRIPTION_LIMIT # Characters of description HTML
+    IMAGE_LIMIT = 10
 
     # --- Modified __init__ with Proxy Support ---
     def __init__(self, cloudflare_delay=10, proxy_config: dict = None):
@@ -211,6 +166,15 @@ class NyaaScraper:
         exponent = units.get(unit, 0) # Default to 0 (Bytes) if unit is missing or unknown
         return int(num * (1024 ** exponent))
 
+    def _parse_timestamp(self, timestamp_attr, date_str: str) -> int:
+        """Uses the cell's data-timestamp, falling back to the 'YYYY-MM-DD HH:MM' text (UTC)."""
+        if timestamp_attr and str(timestamp_attr).isdigit():
+            return int(timestamp_attr)
+        try:
+            return int(datetime.strptime(date_str, "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc).timestamp())
+        except (ValueError, TypeError):
+            return 0
+
     def _parse_results(self, html_content: str) -> list[ScrapeResult]:
         """Parses the HTML of a Nyaa search results page."""
         soup = BeautifulSoup(html_content, 'html.parser')
@@ -268,6 +232,7 @@ class NyaaScraper:
 
                 date_tag = cols[4]
                 date_str = date_tag.get_text(strip=True)
+                timestamp = self._parse_timestamp(date_tag.get('data-timestamp'), date_str)
 
                 seeders = int(cols[5].get_text(strip=True))
                 leechers = int(cols[6].get_text(strip=True))
@@ -293,7 +258,7 @@ class NyaaScraper:
                     category=category, name=name, link=link, magnet_link=magnet_link,
                     size=size, date=date_str, seeders=seeders, leechers=leechers,
                     downloads=downloads, uploader=uploader,
-                    size_bytes=size_bytes
+                    size_bytes=size_bytes, timestamp=timestamp, info_hash=magnet_info_hash(magnet_link)
                 ))
             except (AttributeError, IndexError, ValueError, TypeError) as e:
                 print(f"Parser ERROR: Skipping row {row_index+1} due to error: {type(e).__name__} - {e}")
@@ -364,11 +329,25 @@ class NyaaScraper:
             traceback.print_exc()
             raise RuntimeError(f"Scraping failed due to an unexpected error.") from e
 
-    def _parse_details(self, html_content: str, url: str) -> TorrentDetails:
-        """Parses the HTML of a Nyaa torrent details page with enhanced debugging."""
+    def _parse_details(self, html_content: str, url: str, comment_limit: int | None = None,
+                       description_limit: int | None = None) -> TorrentDetails:
+        """Parses the HTML of a Nyaa torrent details page with enhanced debugging.
+
+        The page is parsed into one tree and each section is taken from it once.
+        Only the first comment_limit comments and description_limit characters
+        of description HTML are kept (None keeps everything); the rest can be
+        fetched later with get_torrent_comments() / get_full_description().
+        """
         print(f"\n--- Starting Detailed Parse for: {url} ---") # Debug Start
-        soup = BeautifulSoup(html_content, 'html.parser')
-        details = TorrentDetails() # Initialize details object
+        # Comments past the cap are cut off before parsing: building their subtree is most of their cost
+        kept_html, comment_total = self._cut_comments(html_content, comment_limit)
+        soup = BeautifulSoup(kept_html, 'html.parser')
+        comment_divs = self._comment_divs(soup)
+        if comment_total is not None and len(comment_divs) != comment_limit:
+            print("Parser (Details) WARNING: Comment markup not as expected, parsing the whole page.")
+            soup, comment_total = BeautifulSoup(html_content, 'html.parser'), None
+            comment_divs = self._comment_divs(soup)
+        details = TorrentDetails(url=url) # Initialize details object
 
         # Check for Cloudflare challenge indicators first
         if "Checking your browser" in html_content or "DDoS protection by Cloudflare" in html_content:
@@ -398,7 +377,7 @@ class NyaaScraper:
 
         for row_index, row in enumerate(rows):
             # Find all 'col-md-*' divs directly within this row
-            cols = row.find_all('div', class_=re.compile(r'col-md-\d+'), recursive=False)
+            cols = row.find_all('div', class_=_COL_MD_CLASS, recursive=False)
 
             i = 0
             while i < len(cols) - 1:
@@ -470,71 +449,41 @@ class NyaaScraper:
 
         # --- Find Description ---
         desc_tag = soup.select_one('#torrent-description')
-        details.description = str(desc_tag) if desc_tag else "No description found."
-        print(f"DEBUG (Details): Found Description: {'Yes' if desc_tag else 'No'}")
-
-        # --- Extract Image URLs ---
-        image_limit = 10
-        found_urls = set()
-        details.image_urls = [] # Ensure list is initialized here
-
-        # 1. Find Markdown image links: ![alt text](URL)
-        # Use raw description text for regex
-        raw_description_text = desc_tag.get_text() if desc_tag else ""
-        markdown_matches = re.findall(r'!\[.*?\]\((.*?)\)', raw_description_text)
-        for md_url in markdown_matches:
-            if md_url and md_url not in found_urls:
-                abs_md_url = requests.compat.urljoin(url, md_url.strip())
-                if abs_md_url.startswith('http'):
-                    details.image_urls.append(abs_md_url)
-                    found_urls.add(md_url) # Add original found URL to prevent duplicates from other methods
-                    if len(details.image_urls) >= image_limit: break
-
-        # 2. Find <img> tags (if limit not reached)
-        if len(details.image_urls) < image_limit:
-            desc_soup = BeautifulSoup(details.description, 'html.parser')
-            for img_tag in desc_soup.find_all('img', limit=image_limit - len(details.image_urls)):
-                src = img_tag.get('src')
-                if src and src not in found_urls:
-                    abs_src = requests.compat.urljoin(url, src)
-                    if abs_src.startswith('http'):
-                        details.image_urls.append(abs_src)
-                        found_urls.add(src)
-                        if len(details.image_urls) >= image_limit: break
-
-        # 3. Find <a> tags linking directly to images (if limit not reached)
-        if len(details.image_urls) < image_limit:
-            # Re-initialize desc_soup if not already done
-            if 'desc_soup' not in locals():
-                desc_soup = BeautifulSoup(details.description, 'html.parser')
-            for a_tag in desc_soup.find_all('a', limit=(image_limit - len(details.image_urls)) * 2):
-                href = a_tag.get('href')
-                if href and any(href.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']) and href not in found_urls:
-                    abs_href = requests.compat.urljoin(url, href)
-                    if abs_href.startswith('http'):
-                        details.image_urls.append(abs_href)
-                        found_urls.add(href)
-                        if len(details.image_urls) >= image_limit: break
+        if desc_tag:
+            details.description, details.description_truncated = self._cap_description(str(desc_tag), description_limit)
+        else:
+            details.description = "No description found."
+        print(f"DEBUG (Details): Found Description: {'Yes' if desc_tag else 'No'}"
+              f"{' (truncated)' if details.description_truncated else ''}")
 
+        # --- Extract Image URLs (from the description subtree, not a re-parse of its HTML) ---
+        details.image_urls = self._extract_image_urls(desc_tag, url) if desc_tag else []
         print(f"DEBUG (Details): Found {len(details.image_urls)} potential image URLs.")
 
         # --- Find File List ---
         file_list_container = soup.select_one('div.torrent-file-list')
         print(f"DEBUG (Details): Found File List Container: {'Yes' if file_list_container else 'No'}")
         if file_list_container:
-             file_items = file_list_container.select('ul > li')
+             file_items = [li for li in file_list_container.find_all('li') if li.parent.name == 'ul']
              print(f"DEBUG (Details): Found {len(file_items)} file items in list.")
              for item in file_items:
                  file_name = "N/A"
-                 link_tag = item.find('a')
+                 # First <a> and first span.file-size below the item, in one walk (find() per tag is slow on big batches)
+                 link_tag = size_span = None
+                 for node in item.descendants:
+                     if node.name == 'a' and link_tag is None:
+                         link_tag = node
+                     elif node.name == 'span' and size_span is None and 'file-size' in node.get('class', ()):
+                         size_span = node
+                     if link_tag is not None and size_span is not None:
+                         break
                  if link_tag:
                      file_name = link_tag.get_text(strip=True)
                  else:
                      full_text = item.get_text(strip=True)
-                     match = re.match(r'^(.*?)\s*\([\d.,]+\s*[KMGTPEZY]?I?B\)$', full_text)
+                     match = _FILE_NAME_WITH_SIZE.match(full_text)
                      file_name = match.group(1).strip() if match else full_text
 
-                 size_span = item.find('span', class_='file-size')
                  size_str = "0 B"
                  if size_span: size_str = size_span.get_text(strip=True).replace('(', '').replace(')', '')
                  size_bytes = self._parse_size_to_bytes(size_str)
@@ -561,83 +510,194 @@ class NyaaScraper:
         print(f"----------------------------------------------\n")
 
         # --- Find Comments --- #
-        comments_container = soup.select_one('#comments')
-        print(f"DEBUG (Details): Found Comments Container: {'Yes' if comments_container else 'No'}")
-        if comments_container:
-            comment_divs = comments_container.find_all('div', class_='comment', recursive=False)
-            print(f"DEBUG (Details): Found {len(comment_divs)} comment divs.")
-            for comment_div in comment_divs:
-                comment_data = {'author': 'N/A', 'date': 'N/A', 'content_html': ''}
-
-                # Find Author and Date (usually in panel-heading)
-                heading = comment_div.select_one('.panel-heading')
-                if heading:
-                    # Author might be in a link or direct text
-                    author_tag = heading.find('a', href=re.compile(r'/user/'))
-                    if author_tag: comment_data['author'] = author_tag.get_text(strip=True)
-                    else: # Fallback if no link (e.g., deleted user?)
-                        # Try getting text before the date span
-                        heading_text_parts = heading.find_all(string=True, recursive=False)
-                        if heading_text_parts:
-                            comment_data['author'] = heading_text_parts[0].strip()
-
-                    # Date is usually in a span with a timestamp data attribute
-                    date_span = heading.find('span', attrs={'data-timestamp': True})
-                    if date_span: comment_data['date'] = date_span.get_text(strip=True)
-
-                # Find Comment Content (in panel-body)
-                body = comment_div.select_one('.panel-body .comment-content')
-                if body:
-                    # Preserve basic HTML within the comment body
-                    comment_data['content_html'] = str(body).strip()
-
-                # Only add if we found some content
-                if comment_data['content_html']:
-                    details.comments.append(comment_data)
-
-            print(f"DEBUG (Details): Parsed {len(details.comments)} comments.")
+        details.comment_count = len(comment_divs) if comment_total is None else comment_total
+        details.comments = self._parse_comments(comment_divs[:comment_limit])
+        # Counted in divs, not parsed comments: _parse_comments skips divs without content
+        details.comments_next = len(comment_divs) if comment_limit is None else min(comment_limit, len(comment_divs))
+        print(f"DEBUG (Details): Parsed {len(details.comments)} comments from {details.comments_next} of {details.comment_count} comment divs.")
 
         return details
 
-    def get_torrent_details(self, url: str, timeout=25) -> TorrentDetails:
+    def _cut_comments(self, html_content: str, comment_limit: int | None) -> tuple[str, int | None]:
+        """Cuts html_content at the comment div after the first comment_limit ones.
+
+        Returns the html to parse and the page's comment div count, or the page
+        unchanged and None when nothing needs cutting.
+        """
+        container = _COMMENTS_CONTAINER.search(html_content) if comment_limit is not None else None
+        if not container:
+            return html_content, None
+        starts = [match.start() for match in _COMMENT_DIV.finditer(html_content, container.end())]
+        if len(starts) <= comment_limit:
+            return html_content, None
+        return html_content[:starts[comment_limit]], len(starts)
+
+    def _cap_description(self, description_html: str, limit: int | None) -> tuple[str, bool]:
+        """Cuts description HTML to at most limit characters, at a tag or line boundary when possible."""
+        if limit is None or len(description_html) <= limit:
+            return description_html, False
+        cut = max(description_html.rfind('>', 0, limit) + 1, description_html.rfind('\n', 0, limit))
+        return description_html[:cut if cut > limit // 2 else limit], True
+
+    def _extract_image_urls(self, desc_tag, url: str) -> list[str]:
+        """Image URLs from a description: markdown images, then <img> tags, then links to image files."""
+        image_urls = []
+        found_urls = set()
+
+        def add(candidate, absolute):
+            if candidate and candidate not in found_urls and absolute.startswith('http'):
+                image_urls.append(absolute)
+                found_urls.add(candidate) # Original found URL, to skip duplicates from the other sources
+            return len(image_urls) >= self.IMAGE_LIMIT
+
+        # 1. Markdown image links: ![alt text](URL), from the raw description text
+        for md_url in _MARKDOWN_IMAGE.findall(desc_tag.get_text()):
+            if md_url and add(md_url, requests.compat.urljoin(url, md_url.strip())):
+                return image_urls
+        # 2. <img> tags
+        for img_tag in desc_tag.find_all('img', limit=self.IMAGE_LIMIT - len(image_urls)):
+            src = img_tag.get('src')
+            if src and add(src, requests.compat.urljoin(url, src)):
+                return image_urls
+        # 3. <a> tags linking directly to images
+        for a_tag in desc_tag.find_all('a', limit=(self.IMAGE_LIMIT - len(image_urls)) * 2):
+            href = a_tag.get('href')
+            if href and href.lower().endswith(_IMAGE_EXTENSIONS) and add(href, requests.compat.urljoin(url, href)):
+                return image_urls
+        return image_urls
+
+    def _comment_divs(self, soup) -> list:
+        comments_container = soup.select_one('#comments')
+        print(f"DEBUG (Details): Found Comments Container: {'Yes' if comments_container else 'No'}")
+        if not comments_container:
+            return []
+        return comments_container.find_all('div', class_='comment', recursive=False)
+
+    def _parse_comments(self, comment_divs) -> list[dict]:
+        comments = []
+        for comment_div in comment_divs:
+            comment_data = {'author': 'N/A', 'date': 'N/A', 'content_html': ''}
+
+            # Find Author and Date (usually in panel-heading)
+            heading = comment_div.select_one('.panel-heading')
+            if heading:
+                # Author might be in a link or direct text
+                author_tag = heading.find('a', href=_USER_LINK)
+                if author_tag: comment_data['author'] = author_tag.get_text(strip=True)
+                else: # Fallback if no link (e.g., deleted user?)
+                    # Try getting text before the date span
+                    heading_text_parts = heading.find_all(string=True, recursive=False)
+                    if heading_text_parts:
+                        comment_data['author'] = heading_text_parts[0].strip()
+
+                # Date is usually in a span with a timestamp data attribute
+                date_span = heading.find('span', attrs={'data-timestamp': True})
+                if date_span: comment_data['date'] = date_span.get_text(strip=True)
+
+            # Find Comment Content (in panel-body)
+            body = comment_div.select_one('.panel-body .comment-content')
+            if body:
+                # Preserve basic HTML within the comment body
+                comment_data['content_html'] = str(body).strip()
+
+            # Only add if we found some content
+            if comment_data['content_html']:
+                comments.append(comment_data)
+        return comments
+
+    def get_torrent_details(self, url: str, timeout=25, comment_limit: int | None = DETAIL_COMMENT_LIMIT,
+                            description_limit: int | None = DETAIL_DESCRIPTION_LIMIT) -> TorrentDetails:
         """Fetches and parses the details page of a specific torrent."""
+        return self._fetch_details_page(
+            url, timeout, lambda html: self._parse_details(html, url, comment_limit, description_limit))
+
+    def get_full_description(self, url: str, timeout=25) -> str:
+        """Fetches a details page again and returns its whole description HTML."""
+        def parse(html_content):
+            soup = BeautifulSoup(html_content, 'html.parser', parse_only=SoupStrainer(id='torrent-description'))
+            desc_tag = soup.find(id='torrent-description')
+            return str(desc_tag) if desc_tag else "No description found."
+        return self._fetch_details_page(url, timeout, parse)
+
+    def get_torrent_comments(self, url: str, start: int, count: int | None = None,
+                             timeout=25) -> tuple[list[dict], int]:
+        """Fetches a details page again and parses count of its comment divs, starting at div start.
+        Returns the comments and the index of the next div (TorrentDetails.comments_next)."""
+        def parse(html_content):
+            soup = BeautifulSoup(html_content, 'html.parser', parse_only=SoupStrainer(id='comments'))
+            comment_divs = self._comment_divs(soup)
+            end = len(comment_divs) if count is None else min(start + count, len(comment_divs))
+            return self._parse_comments(comment_divs[start:end]), max(start, end)
+        return self._fetch_details_page(url, timeout, parse)
+
+    def get_torrent_metadata(self, url: str, timeout=25) -> TorrentMetadata:
+        """Downloads a torrent's .torrent file and reads its file list, piece size and info hash.
+
+        Much cheaper than get_torrent_details when only the files are needed:
+        there is no page to parse, no description and no comments.
+        """
+        torrent_url = self.torrent_file_url(url)
+
+        def parse(response):
+            if response.content[:1] == b"<": # An HTML page where the .torrent should be
+                raise ConnectionError(f"Cloudflare challenge likely blocked the torrent file request for {torrent_url}.")
+            try:
+                return parse_torrent(response.content)
+            except BencodeError as e:
+                raise RuntimeError(f"{torrent_url} is not a valid torrent file: {e}") from e
+        return self._request_page(torrent_url, timeout, parse, "torrent file")
+
+    def torrent_file_url(self, url: str) -> str:
+        """.torrent download URL for a details page (or download) URL."""
+        match = _TORRENT_ID.search(url or "") if (url or "").startswith(self.BASE_URL + "/") else None
+        if not match:
+            raise ValueError("Invalid Nyaa.si view URL provided.")
+        return f"{self.BASE_URL}/download/{match.group(1)}.torrent"
+
+    def _fetch_details_page(self, url: str, timeout, parse):
+        """Requests a details page and returns parse(html), mapping failures to the usual exceptions."""
         if not url or not url.startswith(self.BASE_URL + "/view/"):
             raise ValueError("Invalid Nyaa.si view URL provided.")
+        return self._request_page(url, timeout, lambda response: parse(response.text), "details")
+
+    def _request_page(self, url: str, timeout, parse, what: str):
+        """Requests url and returns parse(response), mapping failures to the usual exceptions."""
         try:
             self.session.headers.update({'Referer': self.BASE_URL})
-            print(f"Scraper: Requesting details URL: {url}, timeout={timeout}s")
+            print(f"Scraper: Requesting {what} URL: {url}, timeout={timeout}s")
             response = self.session.get(url, timeout=timeout)
-            print(f"Scraper: Received details response status: {response.status_code}")
+            print(f"Scraper: Received {what} response status: {response.status_code}")
             response.raise_for_status()
             if "cf_clearance" in self.session.cookies:
-                print("Scraper: Cloudflare clearance cookie active for details request.")
+                print(f"Scraper: Cloudflare clearance cookie active for {what} request.")
 
             # Normal path (without saving HTML unless error)
-            return self._parse_details(response.text, url)
+            return parse(response)
 
         except requests.exceptions.Timeout as e:
-            print(f"Scraper ERROR: Request timed out fetching details: {e}")
-            raise ConnectionError(f"Connection timed out getting details from {url}.") from e
+            print(f"Scraper ERROR: Request timed out fetching {what}: {e}")
+            raise ConnectionError(f"Connection timed out getting {what} from {url}.") from e
         except requests.exceptions.HTTPError as e:
              status_code = e.response.status_code
-             print(f"Scraper ERROR: HTTP Error {status_code} fetching details from {url}")
+             print(f"Scraper ERROR: HTTP Error {status_code} fetching {what} from {url}")
              if status_code == 404:
                  raise FileNotFoundError(f"Torrent not found at {url} (404).")
              else:
-                 raise ConnectionError(f"Nyaa.si returned HTTP error {status_code} for details page.") from e
+                 raise ConnectionError(f"Nyaa.si returned HTTP error {status_code} for {what} page.") from e
         except requests.exceptions.RequestException as e:
-            print(f"Scraper ERROR: Request failed fetching details: {e} - URL: {url}")
+            print(f"Scraper ERROR: Request failed fetching {what}: {e} - URL: {url}")
             if e.response is not None and ("Checking your browser" in e.response.text or "Cloudflare" in e.response.text):
-                 raise ConnectionError(f"Cloudflare challenge likely blocked the details request for {url}.") from e
-            raise ConnectionError(f"Failed to connect to Nyaa.si for details: {e}") from e
+                 raise ConnectionError(f"Cloudflare challenge likely blocked the {what} request for {url}.") from e
+            raise ConnectionError(f"Failed to connect to Nyaa.si for {what}: {e}") from e
         except (FileNotFoundError, ConnectionError, RuntimeError) as e:
-             print(f"Scraper ERROR: Failed to get details due to: {type(e).__name__} - {e}")
+             print(f"Scraper ERROR: Failed to get {what} due to: {type(e).__name__} - {e}")
              raise e
         except Exception as e:
-            print(f"Scraper FATAL: An unexpected error occurred getting details: {type(e).__name__} - {e}")
+            print(f"Scraper FATAL: An unexpected error occurred getting {what}: {type(e).__name__} - {e}")
             traceback.print_exc()
             # Save HTML for inspection on unexpected errors during parsing
-            print(f"ERROR during parsing, saving HTML to 'debug_page.html': {e}")
-            with open("debug_page.html", "w", encoding="utf-8") as f:
-                f.write(response.text if 'response' in locals() else "Response object not available.")
-            raise RuntimeError(f"Parsing details failed unexpectedly for {url}") from e
\ No newline at end of file
+            if 'response' in locals() and response.content[:1] == b"<":
+                print(f"ERROR during parsing, saving HTML to 'debug_page.html': {e}")
+                with open("debug_page.html", "w", encoding="utf-8") as f:
+                    f.write(response.text)
+            raise RuntimeError(f"Parsing {what} failed unexpectedly for {url}") from e
@@ -0,0 +1,153 @@
+# core/search_history.py
+import math
+import sqlite3
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queries (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE,
+    folded TEXT NOT NULL,
+    use_count INTEGER NOT NULL DEFAULT 0,
+    last_used REAL NOT NULL,
+    rank REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS queries_folded ON queries(folded, rank);
+DROP INDEX IF EXISTS queries_rank;
+CREATE INDEX IF NOT EXISTS queries_rank_folded ON queries(rank, folded); -- Covers the walk in suggest()
+CREATE INDEX IF NOT EXISTS queries_last_used ON queries(last_used);
+"""
+
+# Substring matches come from an FTS5 trigram index kept in sync by triggers
+_TRIGRAM_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS queries_trigrams USING fts5(
+    folded, content='queries', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS queries_ai AFTER INSERT ON queries BEGIN
+    INSERT INTO queries_trigrams(rowid, folded) VALUES (new.id, new.folded);
+END;
+CREATE TRIGGER IF NOT EXISTS queries_ad AFTER DELETE ON queries BEGIN
+    INSERT INTO queries_trigrams(queries_trigrams, rowid, folded) VALUES ('delete', old.id, old.folded);
+END;
+"""
+
+_PREFIX_END = "\U0010ffff" # Sorts after any character that can follow a prefix
+
+
+class SearchHistory:
+    """Unbounded search history in SQLite, ranked by frecency.
+
+    Each use adds exp(DECAY * t) to a query's score. The stored rank is the log
+    of that sum, so ranks never need re-aging and older ranks stay comparable.
+    suggest() serves as-you-type completion from the best-ranked queries,
+    falling back to the (folded, rank) prefix index and, for substring
+    matches, an FTS5 trigram index when SQLite has FTS5 (most builds do).
+    """
+    HALF_LIFE_DAYS = 30.0 # A use this old counts half as much as one now
+    DECAY = math.log(2) / (HALF_LIFE_DAYS * 86400.0)
+    RANK_WINDOW = 500 # Best-ranked queries checked directly before any index lookup
+    DEFAULT_LIMIT = 10
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL") # Cheap commits; readers never block the writer
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        try:
+            self._db.executescript(_TRIGRAM_SCHEMA)
+            self.has_trigrams = True
+        except sqlite3.OperationalError as e:
+            print(f"Warning: SQLite has no FTS5 trigram support ({e}). History completion will match prefixes only.")
+            self.has_trigrams = False
+        self._db.commit()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM queries").fetchone()[0]
+
+    def add(self, term: str, used_at: float | None = None):
+        """Records one use of term."""
+        term = term.strip()
+        if not term:
+            return
+        used_at = time.time() if used_at is None else used_at
+        self._record(term, used_at)
+        self._db.commit()
+
+    def import_terms(self, terms: list[str]):
+        """Adds terms (most recent first, like the old settings list) in one transaction."""
+        now = time.time()
+        for age, term in enumerate(terms):
+            if isinstance(term, str) and term.strip():
+                self._record(term.strip(), now - age) # Keep their relative order
+        self._db.commit()
+
+    def recent(self, limit: int) -> list[str]:
+        rows = self._db.execute("SELECT term FROM queries ORDER BY last_used DESC LIMIT ?", (limit,))
+        return [term for (term,) in rows]
+
+    def suggest(self, text: str, limit: int = DEFAULT_LIMIT, use_trigrams: bool = True) -> list[str]:
+        """Best-ranked past queries starting with text, then (3+ chars) containing it.
+
+        With use_trigrams False, substring matches come only from the best-ranked
+        RANK_WINDOW queries. The list may then be short, but it is never out of
+        order, so it can be shown per keystroke and completed after a pause.
+        """
+        folded = text.strip().casefold()
+        if not folded:
+            return []
+        bounds = (folded, folded + _PREFIX_END)
+        substrings = len(folded) >= 3 and self.has_trigrams # Without FTS5, completion matches prefixes only
+
+        # Walk the RANK_WINDOW best-ranked queries first. Matches found there outrank every
+        # match outside it, so when there are enough of them they are the exact answer.
+        match = "instr(folded, ?)" if substrings else "folded >= ? AND folded < ?"
+        rows = self._db.execute(
+            "SELECT q.term, w.folded >= ? AND w.folded < ? AS is_prefix FROM ("
+            "SELECT id, folded, rank FROM queries INDEXED BY queries_rank_folded ORDER BY rank DESC LIMIT ?) w "
+            f"JOIN queries q ON q.id = w.id WHERE {match.replace('folded', 'w.folded')} "
+            "ORDER BY is_prefix DESC, w.rank DESC LIMIT ?",
+            (*bounds, self.RANK_WINDOW, *((folded,) if substrings else bounds), 2 * limit)).fetchall()
+        suggestions = [term for term, is_prefix in rows if is_prefix]
+        if len(suggestions) >= limit:
+            return suggestions[:limit]
+
+        # Few prefix matches rank that high, so there are few overall: the prefix index finds them all
+        suggestions = [term for (term,) in self._db.execute(
+            "SELECT term FROM queries INDEXED BY queries_folded "
+            "WHERE folded >= ? AND folded < ? ORDER BY rank DESC LIMIT ?", (*bounds, limit))]
+        if not substrings or len(suggestions) == limit:
+            return suggestions
+        wanted = limit - len(suggestions)
+        window_substrings = [term for term, is_prefix in rows if not is_prefix]
+        if len(window_substrings) >= wanted or not use_trigrams:
+            return suggestions + window_substrings[:wanted]
+
+        # Rare substring: the trigram index narrows it to a few rows
+        phrase = '"' + folded.replace('"', '""') + '"'
+        suggestions.extend(term for (term,) in self._db.execute(
+            "SELECT q.term FROM queries_trigrams t JOIN queries q ON q.id = t.rowid "
+            "WHERE queries_trigrams MATCH ? AND NOT (q.folded >= ? AND q.folded < ?) "
+            "ORDER BY q.rank DESC LIMIT ?", (phrase, *bounds, wanted)))
+        return suggestions
+
+    def clear(self):
+        self._db.execute("DELETE FROM queries")
+        if self.has_trigrams:
+            self._db.execute("INSERT INTO queries_trigrams(queries_trigrams) VALUES ('delete-all')")
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def _record(self, term: str, used_at: float):
+        use_rank = self.DECAY * used_at
+        row = self._db.execute("SELECT rank FROM queries WHERE term = ?", (term,)).fetchone()
+        if row is None:
+            self._db.execute("INSERT INTO queries (term, folded, use_count, last_used, rank) VALUES (?, ?, 1, ?, ?)",
+                             (term, term.casefold(), used_at, use_rank))
+        else:
+            # log(exp(a) + exp(b)) without overflowing
+            high, low = max(row[0], use_rank), min(row[0], use_rank)
+            rank = high + math.log1p(math.exp(low - high))
+            self._db.execute("UPDATE queries SET use_count = use_count + 1, last_used = MAX(last_used, ?), rank = ? "
+                             "WHERE term = ?", (used_at, rank, term))
@@ -0,0 +1,126 @@
+# core/settings_store.py
+import copy
+import json
+import os
+import threading
+import time
+
+
+class SettingsStore:
+    """Debounced, atomic writer for the flat settings.json document.
+
+    submit() only records the latest settings dict, which is cheap enough for
+    the UI thread. A writer thread waits for a burst of submits to settle. It
+    then re-serializes only the top-level sections whose value changed since
+    the last write, reusing the cached JSON text for the rest. The file is
+    written to a temp file and renamed over settings.json. Nothing is written
+    when no section changed.
+
+    io_seconds / write_count / skipped_count measure the time spent on
+    settings I/O.
+    """
+    DEBOUNCE_DELAY = 0.5 # Seconds to wait for more changes before writing
+
+    def __init__(self, path: str, debounce_delay: float = DEBOUNCE_DELAY, on_error=None):
+        self.path = path
+        self.debounce_delay = debounce_delay
+        self.on_error = on_error # Called with a message from the writer thread
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._pending = None # Latest submitted settings dict
+        self._flush_requested = False
+        self._writing = False
+        self._closed = False
+        self._written_values = {} # section -> value as last written
+        self._section_text = {} # section -> cached '"key": value' JSON fragment
+        # --- Metrics ---
+        self.io_seconds = 0.0 # Serialization + disk time, summed over writes
+        self.write_count = 0
+        self.skipped_count = 0 # Submits that changed nothing on disk
+        self.last_write_ms = 0.0
+        self._thread = threading.Thread(target=self._writer_loop, name="SettingsWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, settings_data: dict):
+        """Queues settings_data to be written (replacing anything not yet written)."""
+        snapshot = copy.deepcopy(settings_data) # The UI may keep mutating its lists
+        with self._lock:
+            if self._pending is None:
+                self._wake.notify()
+            self._pending = snapshot
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Writes the pending settings now and waits. Returns False on timeout."""
+        with self._lock:
+            self._flush_requested = True
+            self._wake.notify()
+            return self._idle.wait_for(lambda: self._pending is None and not self._writing, timeout)
+
+    def close(self, timeout: float | None = 5.0):
+        self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        self._thread.join(timeout)
+        print(f"Settings I/O: {self.write_count} writes, {self.skipped_count} skipped, {self.io_seconds * 1000:.1f} ms total.")
+
+    def _writer_loop(self):
+        while True:
+            with self._lock:
+                while self._pending is None and not self._closed:
+                    self._wake.wait()
+                if self._pending is None:
+                    self._idle.notify_all()
+                    return
+                if not (self._closed or self._flush_requested):
+                    self._wake.wait(self.debounce_delay) # Coalesce the burst
+                settings_data, self._pending = self._pending, None
+                self._flush_requested = False
+                self._writing = True
+
+            try:
+                self._write(settings_data)
+            except (OSError, TypeError, ValueError) as e:
+                message = f"Could not save settings to {self.path}: {e}"
+                if self.on_error:
+                    self.on_error(message)
+                else:
+                    print(f"ERROR: {message}")
+
+            with self._lock:
+                self._writing = False
+                self._idle.notify_all()
+
+    def _write(self, settings_data: dict):
+        start = time.perf_counter()
+        changed = [key for key, value in settings_data.items()
+                   if key not in self._written_values or self._written_values[key] != value]
+        removed = [key for key in self._section_text if key not in settings_data]
+        if not changed and not removed:
+            self.skipped_count += 1
+            return
+
+        section_text = dict(self._section_text)
+        for key in removed:
+            section_text.pop(key)
+        for key in changed:
+            value_text = json.dumps(settings_data[key], indent=4).replace("\n", "\n    ")
+            section_text[key] = f"    {json.dumps(key)}: {value_text}"
+        document = "{\n" + ",\n".join(section_text[key] for key in settings_data) + "\n}\n"
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(document)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        # Only remember what actually reached the disk
+        self._section_text = section_text
+        self._written_values = settings_data
+        elapsed = time.perf_counter() - start
+        self.io_seconds += elapsed
+        self.write_count += 1
+        self.last_write_ms = elapsed * 1000
+        print(f"Settings saved to {self.path} ({len(changed) + len(removed)} changed sections, {self.last_write_ms:.1f} ms)")
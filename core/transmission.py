@@ -0,0 +1,201 @@
+# core/transmission.py
+"""Client for Transmission's RPC interface (the one its web UI uses).
+
+One requests session with a single pooled connection is kept open, and the
+X-Transmission-Session-Id is reused until Transmission rotates it (a 409
+answer carries the new one). Polling asks for "recently-active" torrents only,
+so a refresh transfers the torrents that changed in the last minute instead of
+all of them.
+"""
+import time
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SESSION_ID_HEADER = "X-Transmission-Session-Id"
+
+
+class TransmissionError(RuntimeError):
+    """Transmission answered, but the call failed (its "result" wasn't "success")."""
+
+
+@dataclass
+class TorrentChanges:
+    """What a poll found changed since the previous one."""
+    added: list[dict] = field(default_factory=list) # Torrents not seen before, all fields
+    changed: dict[int, dict] = field(default_factory=dict) # id -> only the fields whose value changed
+    removed: list[int] = field(default_factory=list) # ids no longer in the client
+    full: bool = False # This poll listed every torrent (first poll or resync)
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+
+@dataclass
+class AddResult:
+    """Outcome of one torrent-add."""
+    link: str
+    id: int | None = None
+    hash: str = ""
+    name: str = ""
+    duplicate: bool = False # The client already had it
+    error: str | None = None
+
+
+class TransmissionClient:
+    """Talks to one Transmission daemon. Not thread-safe: use it from one thread at a time."""
+    DEFAULT_PORT = 9091
+    DEFAULT_PATH = "/transmission/rpc"
+    # Fields the downloads view shows; every poll asks for these
+    TORRENT_FIELDS = ["id", "hashString", "name", "status", "percentDone", "rateDownload", "rateUpload",
+                      "eta", "sizeWhenDone", "leftUntilDone", "uploadedEver", "uploadRatio",
+                      "peersConnected", "error", "errorString", "addedDate", "downloadDir", "queuePosition"]
+    # Transmission counts a torrent as recently active for 60 s; a longer gap between polls needs a full one
+    RECENTLY_ACTIVE_WINDOW = 60.0
+    FULL_POLL_EVERY = 30 # Polls between full resyncs, in case a delta was missed
+
+    def __init__(self, host="localhost", port=DEFAULT_PORT, path=DEFAULT_PATH, username="", password="",
+                 https=False, timeout=10):
+        self.url = f"{'https' if https else 'http'}://{host}:{port}{path}"
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1) # One keep-alive connection
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if username:
+            self.session.auth = (username, password)
+        self.session_id = None
+        self.rpc_version = None
+        self.torrents: dict[int, dict] = {} # id -> fields as of the last poll
+        self._last_poll = 0.0 # time.monotonic() of the last successful poll
+        self._polls_since_full = 0
+        # --- Metrics ---
+        self.request_count = 0
+        self.bytes_received = 0
+
+    def close(self):
+        self.session.close()
+
+    # --- RPC ---
+    def call(self, method: str, arguments: dict | None = None) -> dict:
+        """Runs one RPC method and returns its arguments. Raises ConnectionError if
+        Transmission can't be reached or refuses the login, TransmissionError if the call fails."""
+        payload = {"method": method, "arguments": arguments or {}}
+        for _attempt in range(2): # The second try carries the session id a 409 handed out
+            headers = {SESSION_ID_HEADER: self.session_id} if self.session_id else {}
+            try:
+                response = self.session.post(self.url, json=payload, headers=headers, timeout=self.timeout)
+            except requests.exceptions.Timeout as e:
+                raise ConnectionError(f"Transmission did not answer within {self.timeout}s.") from e
+            except requests.exceptions.ConnectionError as e:
+                raise ConnectionError(f"Could not reach Transmission at {self.url}. Is it running, with remote access enabled?") from e
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"Could not reach Transmission at {self.url}: {e}") from e
+            self.request_count += 1
+            self.bytes_received += len(response.content)
+            if response.status_code == 409 and SESSION_ID_HEADER in response.headers:
+                self.session_id = response.headers[SESSION_ID_HEADER]
+                continue
+            if response.status_code == 401:
+                raise ConnectionError("Transmission rejected the username or password.")
+            if response.status_code != 200:
+                raise ConnectionError(f"Transmission returned HTTP {response.status_code}.")
+            try:
+                body = response.json()
+            except ValueError as e:
+                raise TransmissionError(f"Invalid response to {method}.") from e
+            if body.get("result") != "success":
+                raise TransmissionError(f"{method} failed: {body.get('result')}")
+            return body.get("arguments", {})
+        raise ConnectionError("Transmission kept rejecting the session id.")
+
+    def connect(self) -> dict:
+        """Checks the connection (and fetches the session id); returns session-get's arguments."""
+        session = self.call("session-get", {"fields": ["version", "rpc-version", "download-dir"]})
+        self.rpc_version = session.get("rpc-version")
+        return session
+
+    # --- Polling ---
+    def poll(self, full: bool = False) -> TorrentChanges:
+        """Fetches what changed since the last poll and updates self.torrents.
+
+        Uses ids="recently-active" (changed or active torrents plus the ids removed)
+        unless this is the first poll, the last one is older than Transmission's
+        window, a periodic resync is due, or full is True.
+        """
+        now = time.monotonic()
+        full = (full or not self._last_poll or now - self._last_poll > self.RECENTLY_ACTIVE_WINDOW
+                or self._polls_since_full >= self.FULL_POLL_EVERY)
+        arguments = {"fields": self.TORRENT_FIELDS}
+        if not full:
+            arguments["ids"] = "recently-active"
+        result = self.call("torrent-get", arguments)
+        self._last_poll = now
+        self._polls_since_full = 0 if full else self._polls_since_full + 1
+
+        changes = TorrentChanges(full=full)
+        seen = set()
+        for torrent in result.get("torrents", []):
+            torrent_id = torrent["id"]
+            seen.add(torrent_id)
+            known = self.torrents.get(torrent_id)
+            if known is None:
+                self.torrents[torrent_id] = torrent
+                changes.added.append(torrent)
+                continue
+            delta = {key: value for key, value in torrent.items() if known.get(key) != value}
+            if delta:
+                known.update(delta)
+                changes.changed[torrent_id] = delta
+        if full:
+            removed = [torrent_id for torrent_id in self.torrents if torrent_id not in seen]
+        else:
+            removed = [torrent_id for torrent_id in result.get("removed", []) if torrent_id in self.torrents]
+        for torrent_id in removed:
+            del self.torrents[torrent_id]
+        changes.removed = removed
+        return changes
+
+    def hashes(self) -> set[str]:
+        """Info hashes (lowercase hex) of every torrent in the client."""
+        result = self.call("torrent-get", {"fields": ["hashString"]})
+        return {torrent["hashString"].lower() for torrent in result.get("torrents", [])}
+
+    # --- Actions ---
+    def add_torrents(self, links: list[str], paused: bool = False, download_dir: str | None = None,
+                     on_result=None) -> list[AddResult]:
+        """Adds magnet links / torrent URLs back to back over the one connection.
+
+        Transmission's torrent-add takes a single torrent, so a batch is a run of
+        calls sharing the session id and connection rather than one request. A
+        failed add is reported in its AddResult and the rest still go through;
+        only losing the connection stops the batch. on_result(AddResult) is
+        called after each add.
+        """
+        results = []
+        for link in links:
+            arguments = {"filename": link, "paused": paused}
+            if download_dir:
+                arguments["download-dir"] = download_dir
+            try:
+                added = self.call("torrent-add", arguments)
+            except TransmissionError as e:
+                result = AddResult(link, error=str(e))
+            else:
+                torrent = added.get("torrent-added") or added.get("torrent-duplicate") or {}
+                result = AddResult(link, id=torrent.get("id"), hash=torrent.get("hashString", "").lower(),
+                                   name=torrent.get("name", ""), duplicate="torrent-duplicate" in added)
+            results.append(result)
+            if on_result:
+                on_result(result)
+        return results
+
+    def start(self, ids: list[int]):
+        self.call("torrent-start", {"ids": ids})
+
+    def stop(self, ids: list[int]):
+        self.call("torrent-stop", {"ids": ids})
+
+    def remove(self, ids: list[int], delete_data: bool = False):
+        self.call("torrent-remove", {"ids": ids, "delete-local-data": delete_data})
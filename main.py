@@ -1,16 +1,16 @@
-# main.py
 import sys
 import os
-# Import QApplication from PySide6, not PyQt6
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-from ui.main_window import MainWindow
 
 # Set environment variable for Qt (can help with some rendering issues)
 # Consider if this is truly necessary for PySide6, often it's not.
 # os.environ['QT_API'] = 'pyside6' # Keep if needed, otherwise remove
 
-if __name__ == "__main__":
+def run_gui():
+    # Import QApplication from PySide6, not PyQt6 (here, so the command line mode never loads Qt)
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+    from ui.main_window import MainWindow
+
     # Set application attribute for HiDPI scaling before QApplication init
     if hasattr(QApplication, 'setAttribute'):
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
@@ -44,4 +44,11 @@ if __name__ == "__main__":
 
     window = MainWindow()
     window.showMaximized()
-    sys.exit(app.exec())
+    return app.exec()
+
+if __name__ == "__main__":
+    # `python main.py search ...` / `details ...` run headless (see core/cli.py)
+    if len(sys.argv) > 1 and not sys.argv[1].startswith("-") or sys.argv[1:2] in (["-h"], ["--help"]):
+        from core import cli
+        sys.exit(cli.main(sys.argv[1:]))
+    sys.exit(run_gui())
@@ -0,0 +1,122 @@
+# tools/check_transmission.py
+"""Checks TransmissionClient's protocol handling against the stub daemon.
+
+Covers what polling and sending torrents rely on: the 409 session-id
+handshake (and a rotated id), deltas from ids="recently-active" including
+its "removed" list, torrent-add reporting torrent-duplicate, and the errors
+raised for a refused login or a failed call. Any failure raises
+AssertionError (exit status 1).
+
+Run from the repository root:
+    python tools/check_transmission.py
+"""
+import base64
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.transmission import TransmissionClient, TransmissionError
+from tools.transmission_stub import StubServer
+
+NEW_HASH = "00112233445566778899aabbccddeeff00112233"
+
+
+def check_session_handshake(server):
+    client = TransmissionClient("127.0.0.1", server.port)
+    handler = server.httpd.RequestHandlerClass
+    handshakes = server.state.handshakes
+    client.connect()
+    assert client.session_id == handler.session_id, "session id from the 409 answer not kept"
+    assert server.state.handshakes == handshakes + 1, "expected exactly one 409 handshake"
+    assert client.request_count == 2, f"handshake took {client.request_count} requests, expected 2"
+
+    client.call("session-get")
+    assert server.state.handshakes == handshakes + 1, "session id not reused on the next call"
+
+    handler.session_id = "rotated-session-id" # Transmission hands out a new id (e.g. after a restart)
+    client.call("session-get")
+    assert client.session_id == "rotated-session-id", "rotated session id not picked up"
+    assert server.state.handshakes == handshakes + 2, "expected one more 409 after the rotation"
+    client.close()
+
+
+def check_recently_active(server):
+    client = TransmissionClient("127.0.0.1", server.port)
+    first = client.poll()
+    assert first.full and len(first.added) == len(server.state.torrents), "first poll must list every torrent"
+
+    removed_id, stopped_id = sorted(client.torrents)[:2]
+    client.remove([removed_id])
+    client.stop([stopped_id])
+    changes = client.poll()
+    assert not changes.full, "second poll within the window should use recently-active"
+    assert changes.removed == [removed_id], f"removed ids {changes.removed}, expected [{removed_id}]"
+    assert removed_id not in client.torrents, "removed torrent still listed"
+    assert changes.changed.get(stopped_id, {}).get("status") == 0, "stopped torrent's status change missed"
+
+    changes = client.poll()
+    assert removed_id not in changes.removed, "a removal already applied was reported again"
+    assert client.poll(full=True).removed == [], "full resync disagrees with the deltas"
+    client.close()
+
+
+def check_duplicate_add(server):
+    client = TransmissionClient("127.0.0.1", server.port)
+    existing = next(iter(server.state.torrents.values()))
+    base32 = base64.b32encode(bytes.fromhex(NEW_HASH)).decode()
+    links = [f"magnet:?xt=urn:btih:{existing['hashString']}&dn=Existing",
+             f"magnet:?xt=urn:btih:{NEW_HASH}&dn=New",
+             f"magnet:?xt=urn:btih:{base32}&dn=New%20again", # Same torrent, base32 form
+             ""] # Rejected by torrent-add
+    reported = []
+    results = client.add_torrents(links, on_result=reported.append)
+    assert reported == results, "on_result not called once per add, in order"
+
+    duplicate, added, added_again, failed = results
+    assert duplicate.duplicate and duplicate.id == existing["id"], "existing torrent not reported as torrent-duplicate"
+    assert not added.duplicate and added.hash == NEW_HASH and added.id is not None, "new torrent not added"
+    assert added_again.duplicate and added_again.id == added.id, "second add of the same hash not a duplicate"
+    assert failed.error and failed.id is None, "failed add not reported in its AddResult"
+    assert NEW_HASH in client.hashes(), "added torrent missing from hashes()"
+    client.close()
+
+
+def check_errors(server, auth_server):
+    client = TransmissionClient("127.0.0.1", server.port)
+    try:
+        client.call("no-such-method")
+    except TransmissionError:
+        pass
+    else:
+        raise AssertionError("a failed result must raise TransmissionError")
+    client.close()
+
+    for password, should_work in (("wrong", False), ("secret", True)):
+        client = TransmissionClient("127.0.0.1", auth_server.port, username="user", password=password)
+        try:
+            client.connect()
+            worked = True
+        except ConnectionError:
+            worked = False
+        assert worked == should_work, f"login with password '{password}' {'failed' if should_work else 'accepted'}"
+        client.close()
+
+
+def main():
+    server = StubServer(torrents=20, active_share=0.2).start()
+    auth_server = StubServer(torrents=1, username="user", password="secret").start()
+    try:
+        for name, check in (("session handshake", lambda: check_session_handshake(server)),
+                            ("recently-active deltas", lambda: check_recently_active(server)),
+                            ("duplicate adds", lambda: check_duplicate_add(server)),
+                            ("errors", lambda: check_errors(server, auth_server))):
+            check()
+            print(f"ok: {name}")
+    finally:
+        server.stop()
+        auth_server.stop()
+
+
+if __name__ == "__main__":
+    main()
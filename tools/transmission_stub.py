@@ -0,0 +1,257 @@
+# tools/transmission_stub.py
+"""A stand-in Transmission daemon for developing and measuring the RPC client.
+
+Speaks the parts of the RPC the app uses: the 409 session-id handshake,
+optional basic auth, session-get, torrent-get (including ids="recently-active"
+and its "removed" list), torrent-add, torrent-start/stop/remove. A share of the
+torrents download as time passes, so there is something to poll. The extra
+method "stub-stats" reports connections, requests and bytes sent.
+
+Run from the repository root:
+    python tools/transmission_stub.py --port 9091 --torrents 500 --active 0.05
+"""
+import argparse
+import base64
+import hashlib
+import json
+import random
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+RPC_PATH = "/transmission/rpc"
+SESSION_ID_HEADER = "X-Transmission-Session-Id"
+RECENTLY_ACTIVE_WINDOW = 60.0 # Seconds, as in Transmission
+STATUS_STOPPED, STATUS_DOWNLOAD, STATUS_SEED = 0, 4, 6
+
+
+class StubState:
+    """The stub's torrents and counters, shared by all request threads."""
+
+    def __init__(self, torrent_count=200, active_share=0.05, seed=1):
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        self.torrents = {} # id -> fields
+        self.changed_at = {} # id -> time.monotonic() of the last change
+        self.removed = {} # id -> time.monotonic() of removal
+        self.next_id = 1
+        self.active_share = active_share
+        self.last_tick = time.monotonic()
+        self.connections = 0
+        self.requests = 0
+        self.bytes_sent = 0
+        self.handshakes = 0 # 409 answers
+        for index in range(torrent_count):
+            self.add(f"Stub Torrent {index:05d} [1080p].mkv", hashlib.sha1(f"stub-{index}".encode()).hexdigest(),
+                     downloading=self.random.random() < active_share)
+
+    def add(self, name: str, info_hash: str, downloading=True, paused=False) -> dict:
+        torrent_id = self.next_id
+        self.next_id += 1
+        size = self.random.randint(200, 4000) * 1024 * 1024
+        done = 0.0 if downloading else 1.0
+        torrent = {
+            "id": torrent_id, "hashString": info_hash, "name": name,
+            "status": STATUS_STOPPED if paused else (STATUS_DOWNLOAD if downloading else STATUS_SEED),
+            "percentDone": done, "rateDownload": 0, "rateUpload": 0, "eta": -1,
+            "sizeWhenDone": size, "leftUntilDone": int(size * (1 - done)), "uploadedEver": 0,
+            "uploadRatio": 0.0, "peersConnected": 0, "error": 0, "errorString": "",
+            "addedDate": int(time.time()), "downloadDir": "/downloads", "queuePosition": torrent_id - 1,
+        }
+        self.torrents[torrent_id] = torrent
+        self.changed_at[torrent_id] = time.monotonic()
+        return torrent
+
+    def tick(self):
+        """Advances the downloading torrents by the time since the last tick."""
+        now = time.monotonic()
+        elapsed = now - self.last_tick
+        if elapsed < 0.05:
+            return
+        self.last_tick = now
+        for torrent_id, torrent in self.torrents.items():
+            if torrent["status"] != STATUS_DOWNLOAD:
+                continue
+            rate = self.random.randint(200, 5000) * 1024
+            left = max(0, torrent["leftUntilDone"] - int(rate * elapsed))
+            torrent.update(rateDownload=rate, leftUntilDone=left, peersConnected=self.random.randint(1, 40),
+                           percentDone=round(1 - left / torrent["sizeWhenDone"], 4),
+                           eta=int(left / rate) if rate else -1)
+            if not left:
+                torrent.update(status=STATUS_SEED, rateDownload=0, eta=-1)
+            self.changed_at[torrent_id] = now
+        for torrent_id in [t for t, removed_at in self.removed.items() if now - removed_at > RECENTLY_ACTIVE_WINDOW]:
+            del self.removed[torrent_id]
+
+    def select(self, ids):
+        if ids is None:
+            return list(self.torrents.values())
+        if ids == "recently-active":
+            now = time.monotonic()
+            return [self.torrents[t] for t, changed_at in self.changed_at.items()
+                    if t in self.torrents and now - changed_at <= RECENTLY_ACTIVE_WINDOW]
+        if isinstance(ids, (int, str)):
+            ids = [ids]
+        by_hash = {torrent["hashString"]: torrent for torrent in self.torrents.values()}
+        return [self.torrents.get(i) if isinstance(i, int) else by_hash.get(i) for i in ids if
+                (self.torrents.get(i) if isinstance(i, int) else by_hash.get(i)) is not None]
+
+    def touch(self, torrents):
+        now = time.monotonic()
+        for torrent in torrents:
+            self.changed_at[torrent["id"]] = now
+
+
+def _magnet_hash_and_name(link: str) -> tuple[str, str]:
+    query = parse_qs(urlsplit(link).query)
+    name = query.get("dn", ["Unnamed"])[0]
+    for topic in query.get("xt", []):
+        if topic.lower().startswith("urn:btih:"):
+            value = topic[9:]
+            if len(value) == 32: # Base32 form
+                value = base64.b32decode(value.upper()).hex()
+            return value.lower(), name
+    return hashlib.sha1(link.encode()).hexdigest(), name
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # Keep-alive, like Transmission
+    disable_nagle_algorithm = True # Headers and body are separate writes; Nagle would hold the body back
+    state: StubState = None
+    session_id = secrets.token_urlsafe(24)
+    credentials = None # "user:pass" if auth is required
+    latency = 0.0 # Seconds added to every answer
+
+    def setup(self):
+        super().setup()
+        with self.state.lock:
+            self.state.connections += 1
+
+    def log_message(self, format, *args):
+        pass # Quiet; stub-stats has the numbers
+
+    def _send(self, status: int, body: bytes, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        with self.state.lock:
+            self.state.requests += 1
+            self.state.bytes_sent += len(body)
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path != RPC_PATH:
+            self._send(404, b"")
+            return
+        if self.credentials:
+            expected = "Basic " + base64.b64encode(self.credentials.encode()).decode()
+            if self.headers.get("Authorization") != expected:
+                self._send(401, b"", {"WWW-Authenticate": 'Basic realm="Transmission"'})
+                return
+        if self.headers.get(SESSION_ID_HEADER) != self.session_id:
+            with self.state.lock:
+                self.state.handshakes += 1
+            self._send(409, b"", {SESSION_ID_HEADER: self.session_id})
+            return
+        if self.latency:
+            time.sleep(self.latency)
+        request = json.loads(body or b"{}")
+        with self.state.lock:
+            self.state.tick()
+            result, arguments = self._dispatch(request.get("method"), request.get("arguments") or {})
+        self._send(200, json.dumps({"result": result, "arguments": arguments}).encode())
+
+    def _dispatch(self, method, arguments):
+        state = self.state
+        if method == "session-get":
+            return "success", {"version": "4.0.5 (stub)", "rpc-version": 17, "download-dir": "/downloads"}
+        if method == "torrent-get":
+            torrents = state.select(arguments.get("ids"))
+            fields = arguments.get("fields") or ["id"]
+            reply = {"torrents": [{key: torrent[key] for key in fields if key in torrent} for torrent in torrents]}
+            if arguments.get("ids") == "recently-active":
+                reply["removed"] = list(state.removed)
+            return "success", reply
+        if method == "torrent-add":
+            link = arguments.get("filename") or ""
+            if not link:
+                return "no filename or metainfo", {}
+            info_hash, name = _magnet_hash_and_name(link)
+            for torrent in state.torrents.values():
+                if torrent["hashString"] == info_hash:
+                    return "success", {"torrent-duplicate": {key: torrent[key] for key in ("id", "name", "hashString")}}
+            torrent = state.add(name, info_hash, paused=bool(arguments.get("paused")))
+            return "success", {"torrent-added": {key: torrent[key] for key in ("id", "name", "hashString")}}
+        if method in ("torrent-start", "torrent-stop"):
+            torrents = state.select(arguments.get("ids"))
+            for torrent in torrents:
+                if method == "torrent-stop":
+                    torrent.update(status=STATUS_STOPPED, rateDownload=0, rateUpload=0, eta=-1)
+                else:
+                    torrent["status"] = STATUS_DOWNLOAD if torrent["leftUntilDone"] else STATUS_SEED
+            state.touch(torrents)
+            return "success", {}
+        if method == "torrent-remove":
+            now = time.monotonic()
+            for torrent in state.select(arguments.get("ids")):
+                del state.torrents[torrent["id"]]
+                state.changed_at.pop(torrent["id"], None)
+                state.removed[torrent["id"]] = now
+            return "success", {}
+        if method == "stub-stats":
+            return "success", {"connections": state.connections, "requests": state.requests,
+                               "bytes-sent": state.bytes_sent, "handshakes": state.handshakes}
+        return "method name not recognized", {}
+
+
+class StubServer:
+    """Runs the stub on a background thread; port 0 picks a free one."""
+
+    def __init__(self, port=0, torrents=200, active_share=0.05, username="", password="", latency=0.0):
+        handler = type("Handler", (StubHandler,), {
+            "state": StubState(torrents, active_share),
+            "credentials": f"{username}:{password}" if username else None,
+            "latency": latency,
+        })
+        self.state = handler.state
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="TransmissionStub", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in Transmission RPC server.")
+    parser.add_argument("--port", type=int, default=9091)
+    parser.add_argument("--torrents", type=int, default=200, help="Torrents to start with")
+    parser.add_argument("--active", type=float, default=0.05, help="Share of them downloading")
+    parser.add_argument("--username", default="")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every answer")
+    args = parser.parse_args()
+    server = StubServer(args.port, args.torrents, args.active, args.username, args.password, args.latency)
+    print(f"Transmission stub on http://127.0.0.1:{server.port}{RPC_PATH} with {args.torrents} torrents (Ctrl+C stops)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# ui/category_icons.py
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon
+
+
+def _normalize(category_name: str) -> str:
+    return category_name.lower().strip()
+
+
+class CategoryIconCache:
+    """Maps Nyaa category names to pre-rendered icons.
+
+    Matching (exact name first, then keyword) runs once per distinct category
+    name. qtawesome icons redraw their font glyph on every paint, so each
+    (icon, color) pair is rendered to a pixmap once per device pixel ratio and
+    wrapped in a plain QIcon. A lookup after that is a single dict access.
+    """
+    ICON_SIZE = 16 # Matches the table's default small icon size
+
+    def __init__(self, icon_map: dict, icon_size: int = ICON_SIZE):
+        self._icon_size = icon_size
+        self._default_spec = icon_map["default"]
+        # Normalized once instead of lower()-ing every key on every call
+        self._exact_specs = {_normalize(key): spec for key, spec in icon_map.items() if key != "default"}
+        self._keyword_specs = [(_normalize(key), spec) for key, spec in icon_map.items() if key != "default"]
+        self._specs = {} # raw category name -> (icon name, color)
+        self._rendered = {} # ((icon name, color), dpr) -> QIcon
+        self._icons = {} # (raw category name, dpr) -> QIcon
+
+    def spec_for(self, category_name: str) -> tuple:
+        """(icon name, color) for a category, memoized per raw name."""
+        spec = self._specs.get(category_name)
+        if spec is None:
+            norm_category_name = _normalize(category_name)
+            spec = self._exact_specs.get(norm_category_name)
+            if spec is None:
+                # Fallback to keyword matching (map order decides ties, as before)
+                spec = next((spec for keyword, spec in self._keyword_specs if keyword in norm_category_name),
+                            self._default_spec)
+            self._specs[category_name] = spec
+        return spec
+
+    def icon(self, category_name: str, device_pixel_ratio: float = 1.0) -> QIcon:
+        icon = self._icons.get((category_name, device_pixel_ratio))
+        if icon is None:
+            icon = self._render(self.spec_for(category_name), device_pixel_ratio)
+            self._icons[(category_name, device_pixel_ratio)] = icon
+        return icon
+
+    def warm(self, category_names, device_pixel_ratio: float = 1.0):
+        """Renders icons up front (e.g. every known category at startup)."""
+        for category_name in category_names:
+            self.icon(category_name, device_pixel_ratio)
+
+    def clear(self):
+        self._rendered.clear()
+        self._icons.clear()
+
+    def _render(self, spec: tuple, device_pixel_ratio: float) -> QIcon:
+        icon = self._rendered.get((spec, device_pixel_ratio))
+        if icon is None:
+            icon_name, color = spec
+            size = QSize(self._icon_size, self._icon_size)
+            import qtawesome as qta # Imported on first render, so it stays off the startup path
+            try:
+                pixmap = qta.icon(icon_name, color=color).pixmap(size, device_pixel_ratio)
+            except Exception as e: # Icon names differ between qtawesome font versions
+                print(f"Warning: Could not render category icon '{icon_name}': {e}. Using default icon.")
+                if spec == self._default_spec:
+                    raise
+                icon = self._rendered[(spec, device_pixel_ratio)] = self._render(self._default_spec, device_pixel_ratio)
+                return icon
+            icon = self._rendered[(spec, device_pixel_ratio)] = QIcon(pixmap)
+        return icon
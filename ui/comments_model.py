@@ -0,0 +1,133 @@
+# ui/comments_model.py
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QEvent, QSize, QRect, QPointF, QUrl, Signal
+from PySide6.QtGui import QTextDocument, QAbstractTextDocumentLayout, QPalette, QColor, QPen
+from PySide6.QtWidgets import QStyledItemDelegate
+
+CommentRole = Qt.UserRole + 1 # The comment dict behind a row
+
+
+class CommentsModel(QAbstractListModel):
+    """List model over a details page's comments, exposed PAGE_SIZE rows at a time.
+
+    Rows are handed to the view through fetchMore as it scrolls to the end, so
+    only the first page is laid out when the dialog opens, however many
+    comments were loaded.
+    """
+    PAGE_SIZE = 20
+
+    def __init__(self, comments: list[dict], parent=None):
+        super().__init__(parent)
+        self._comments = list(comments)
+        self._shown = min(self.PAGE_SIZE, len(self._comments))
+
+    def __len__(self):
+        return len(self._comments)
+
+    def add_comments(self, comments: list[dict]):
+        """Adds comments fetched later; the first page of them shows right away if nothing was pending."""
+        all_shown = self._shown == len(self._comments)
+        self._comments.extend(comments)
+        if all_shown:
+            self.fetchMore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._shown
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._shown < len(self._comments)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self._comments) - self._shown)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._shown, self._shown + count - 1)
+        self._shown += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < self._shown):
+            return None
+        comment = self._comments[index.row()]
+        if role == CommentRole:
+            return comment
+        if role == Qt.DisplayRole:
+            return f"{comment.get('author', 'N/A')} - {comment.get('date', 'N/A')}"
+        return None
+
+
+class CommentDelegate(QStyledItemDelegate):
+    """Paints a comment as a bordered block of rich text (header line, then the comment's HTML).
+
+    Documents are built for rows as they are painted or measured, and only the
+    most recent MAX_CACHED_DOCUMENTS are kept. Clicking a link emits
+    link_activated instead of opening it.
+    """
+    MAX_CACHED_DOCUMENTS = 100
+    PADDING = 8
+    SPACING = 10 # Gap between comment blocks
+    BORDER_COLOR = QColor("#444")
+
+    link_activated = Signal(QUrl)
+
+    def __init__(self, view, parent=None):
+        super().__init__(parent)
+        self._view = view # Its viewport width is the text width
+        self._documents = OrderedDict() # id(comment) -> (comment, QTextDocument)
+
+    def _document(self, index, width: int) -> QTextDocument:
+        comment = index.data(CommentRole)
+        key = id(comment)
+        cached = self._documents.get(key)
+        if cached is not None and cached[0] is comment:
+            self._documents.move_to_end(key)
+            document = cached[1]
+        else:
+            document = QTextDocument()
+            document.setDocumentMargin(0)
+            document.setDefaultStyleSheet("p { margin: 0; padding: 0; }")
+            document.setHtml(
+                f"<div style='font-size: 9pt; color: grey;'><b>{comment.get('author', 'N/A')}</b> - "
+                f"{comment.get('date', 'N/A')}</div>"
+                f"<div>{comment.get('content_html', '[No Content]')}</div>")
+            self._documents[key] = (comment, document)
+            if len(self._documents) > self.MAX_CACHED_DOCUMENTS:
+                self._documents.popitem(last=False)
+        text_width = max(50, width - 2 * self.PADDING)
+        if document.textWidth() != text_width:
+            document.setTextWidth(text_width)
+        return document
+
+    def _text_width(self) -> int:
+        return self._view.viewport().width() - 1 # Room for the right border
+
+    def sizeHint(self, option, index):
+        document = self._document(index, self._text_width())
+        return QSize(self._text_width(), int(document.size().height()) + 2 * self.PADDING + self.SPACING)
+
+    def paint(self, painter, option, index):
+        block = QRect(option.rect.adjusted(0, 0, -1, -self.SPACING))
+        document = self._document(index, self._text_width()) # Same width as sizeHint, so no re-layout
+        painter.save()
+        painter.setPen(QPen(self.BORDER_COLOR))
+        painter.drawRoundedRect(block, 4, 4)
+        painter.translate(block.left() + self.PADDING, block.top() + self.PADDING)
+        context = QAbstractTextDocumentLayout.PaintContext()
+        context.palette.setColor(QPalette.Text, option.palette.color(QPalette.Text))
+        document.documentLayout().draw(painter, context)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            block = option.rect.adjusted(0, 0, -1, -self.SPACING)
+            document = self._document(index, self._text_width())
+            position = QPointF(event.position().x() - block.left() - self.PADDING,
+                               event.position().y() - block.top() - self.PADDING)
+            anchor = document.documentLayout().anchorAt(position)
+            if anchor:
+                self.link_activated.emit(QUrl(anchor))
+                return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,270 @@
+# ui/downloads_model.py
+import time
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionProgressBar, QStyleOptionViewItem, QApplication
+
+from core.models import format_size
+
+# --- Custom Roles ---
+TorrentIdRole = Qt.UserRole + 1 # Transmission id of the row's torrent
+SortRole = Qt.UserRole + 2 # Raw value used for sorting
+
+# Transmission's torrent status codes
+STATUS_STOPPED, STATUS_CHECK_WAIT, STATUS_CHECK, STATUS_DOWNLOAD_WAIT, STATUS_DOWNLOAD, STATUS_SEED_WAIT, STATUS_SEED = range(7)
+STATUS_NAMES = {
+    STATUS_STOPPED: "Paused", STATUS_CHECK_WAIT: "Queued to verify", STATUS_CHECK: "Verifying",
+    STATUS_DOWNLOAD_WAIT: "Queued", STATUS_DOWNLOAD: "Downloading", STATUS_SEED_WAIT: "Queued to seed",
+    STATUS_SEED: "Seeding",
+}
+
+
+def format_eta(seconds) -> str:
+    """Transmission's eta (-1 unknown, -2 unbounded) -> '2h 05m'."""
+    if not isinstance(seconds, int) or seconds < 0:
+        return ""
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    if seconds < 86400:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    return f"{seconds // 86400}d {seconds % 86400 // 3600}h"
+
+
+def is_active(torrent: dict) -> bool:
+    """Transferring or verifying: what makes a faster refresh worth it."""
+    return bool(torrent.get("rateDownload") or torrent.get("rateUpload")
+                or torrent.get("status") in (STATUS_CHECK, STATUS_DOWNLOAD))
+
+
+class DownloadsTableModel(QAbstractTableModel):
+    """The client's torrents, kept current from TorrentChanges deltas: a poll that
+    changed three torrents' speeds repaints those three rows' speed cells and
+    nothing else. Rows keep their position, so selection and scrolling survive."""
+    HEADERS = ["Name", "Size", "Progress", "Status", "Down", "Up", "ETA", "Ratio", "Peers", "Added"]
+    NAME_COLUMN = 0
+    SIZE_COLUMN = 1
+    PROGRESS_COLUMN = 2
+    STATUS_COLUMN = 3
+    DOWN_COLUMN = 4
+    UP_COLUMN = 5
+    ETA_COLUMN = 6
+    RATIO_COLUMN = 7
+    PEERS_COLUMN = 8
+    ADDED_COLUMN = 9
+    # Torrent field -> the columns showing it
+    FIELD_COLUMNS = {
+        "name": (NAME_COLUMN,), "downloadDir": (NAME_COLUMN,),
+        "sizeWhenDone": (SIZE_COLUMN,),
+        "percentDone": (PROGRESS_COLUMN,), "leftUntilDone": (PROGRESS_COLUMN,),
+        "status": (STATUS_COLUMN,), "error": (STATUS_COLUMN,), "errorString": (STATUS_COLUMN,),
+        "rateDownload": (DOWN_COLUMN,), "rateUpload": (UP_COLUMN,),
+        "eta": (ETA_COLUMN,), "uploadRatio": (RATIO_COLUMN,), "uploadedEver": (RATIO_COLUMN,),
+        "peersConnected": (PEERS_COLUMN,), "addedDate": (ADDED_COLUMN,),
+    }
+    CENTERED_COLUMNS = (RATIO_COLUMN, PEERS_COLUMN)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._torrents: list[dict] = [] # Row order = order first seen
+        self._rows: dict[int, int] = {} # torrent id -> row
+        self._hashes: dict[str, int] = {} # lowercase info hash -> torrent id
+        self._active: set[int] = set() # ids for which is_active() holds
+        self._error_color = QColor("tomato")
+        self._paused_color = QColor(Qt.gray)
+        # --- Metrics ---
+        self.cells_updated = 0 # Cells covered by dataChanged since the last reset
+
+    # --- Store Access ---
+    def set_torrents(self, torrents: list[dict]):
+        """Replaces every row (first poll / reconnect)."""
+        self.beginResetModel()
+        self._torrents = [dict(torrent) for torrent in torrents]
+        self._reindex(0)
+        self._hashes = {torrent.get("hashString", "").lower(): torrent["id"] for torrent in self._torrents}
+        self._active = {torrent["id"] for torrent in self._torrents if is_active(torrent)}
+        self.cells_updated = 0
+        self.endResetModel()
+
+    def clear(self):
+        self.set_torrents([])
+
+    def apply_changes(self, changes):
+        """Applies a TorrentChanges: removals, then field deltas, then new torrents."""
+        self._remove_ids(changes.removed)
+
+        last_column = len(self.HEADERS) - 1
+        for torrent_id, delta in changes.changed.items():
+            row = self._rows.get(torrent_id)
+            if row is None:
+                continue
+            torrent = self._torrents[row]
+            torrent.update(delta)
+            if is_active(torrent):
+                self._active.add(torrent_id)
+            else:
+                self._active.discard(torrent_id)
+            columns = [column for key in delta for column in self.FIELD_COLUMNS.get(key, ())]
+            if not columns:
+                continue
+            first, last = min(columns), max(columns)
+            self.cells_updated += last - first + 1
+            self.dataChanged.emit(self.index(row, first), self.index(row, last))
+
+        new_torrents = []
+        for torrent in changes.added:
+            row = self._rows.get(torrent["id"])
+            if row is None:
+                new_torrents.append(dict(torrent))
+                continue
+            self._torrents[row].update(torrent) # Already shown (e.g. after a resync): refresh it
+            self.cells_updated += last_column + 1
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+        if new_torrents:
+            first = len(self._torrents)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_torrents) - 1)
+            self._torrents.extend(new_torrents)
+            self._reindex(first)
+            self._hashes.update((torrent.get("hashString", "").lower(), torrent["id"]) for torrent in new_torrents)
+            self.endInsertRows()
+        for torrent in changes.added:
+            if is_active(torrent):
+                self._active.add(torrent["id"])
+
+    def _remove_ids(self, ids):
+        rows = sorted(self._rows[torrent_id] for torrent_id in ids if torrent_id in self._rows)
+        if not rows:
+            return
+        # One beginRemoveRows per run of consecutive rows, bottom-up so earlier rows keep their numbers
+        index = len(rows) - 1
+        while index >= 0:
+            end = rows[index]
+            while index > 0 and rows[index - 1] == rows[index] - 1:
+                index -= 1
+            start = rows[index]
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._torrents[start:end + 1]
+            self.endRemoveRows()
+            index -= 1
+        removed = set(ids)
+        for torrent_id in ids:
+            self._rows.pop(torrent_id, None)
+            self._active.discard(torrent_id)
+        self._hashes = {info_hash: torrent_id for info_hash, torrent_id in self._hashes.items() if torrent_id not in removed}
+        self._reindex(rows[0])
+
+    def _reindex(self, first_row: int):
+        if first_row == 0:
+            self._rows = {}
+        for row in range(first_row, len(self._torrents)):
+            self._rows[self._torrents[row]["id"]] = row
+
+    def torrent_at(self, row: int) -> dict | None:
+        if 0 <= row < len(self._torrents):
+            return self._torrents[row]
+        return None
+
+    def torrent_ids(self, rows) -> list[int]:
+        return [self._torrents[row]["id"] for row in rows if 0 <= row < len(self._torrents)]
+
+    def active_count(self) -> int:
+        return len(self._active)
+
+    def contains_hash(self, info_hash: str) -> bool:
+        """True if the client has a torrent with this lowercase hex info hash."""
+        return bool(info_hash) and info_hash in self._hashes
+
+    # --- QAbstractTableModel Interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._torrents)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._torrents):
+            return None
+        torrent = self._torrents[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self.NAME_COLUMN: return torrent.get("name", "")
+            if column == self.SIZE_COLUMN: return format_size(torrent.get("sizeWhenDone"))
+            if column == self.PROGRESS_COLUMN: return f"{torrent.get('percentDone', 0) * 100:.1f}%"
+            if column == self.STATUS_COLUMN:
+                if torrent.get("error"):
+                    return "Error"
+                return STATUS_NAMES.get(torrent.get("status"), "Unknown")
+            if column == self.DOWN_COLUMN:
+                rate = torrent.get("rateDownload")
+                return f"{format_size(rate)}/s" if rate else ""
+            if column == self.UP_COLUMN:
+                rate = torrent.get("rateUpload")
+                return f"{format_size(rate)}/s" if rate else ""
+            if column == self.ETA_COLUMN: return format_eta(torrent.get("eta"))
+            if column == self.RATIO_COLUMN:
+                ratio = torrent.get("uploadRatio", -1)
+                return f"{ratio:.2f}" if isinstance(ratio, (int, float)) and ratio >= 0 else ""
+            if column == self.PEERS_COLUMN: return str(torrent.get("peersConnected", 0))
+            if column == self.ADDED_COLUMN:
+                added = torrent.get("addedDate")
+                return time.strftime("%Y-%m-%d %H:%M", time.localtime(added)) if added else ""
+            return None
+        if role == Qt.ToolTipRole:
+            if column == self.NAME_COLUMN:
+                return f"{torrent.get('name', '')}\n{torrent.get('downloadDir', '')}"
+            if column == self.STATUS_COLUMN and torrent.get("error"):
+                return torrent.get("errorString", "")
+            return None
+        if role == Qt.ForegroundRole:
+            if torrent.get("error"):
+                return self._error_color
+            return self._paused_color if torrent.get("status") == STATUS_STOPPED else None
+        if role == Qt.TextAlignmentRole and column in self.CENTERED_COLUMNS:
+            return int(Qt.AlignCenter)
+        if role == TorrentIdRole:
+            return torrent["id"]
+        if role == SortRole:
+            if column == self.NAME_COLUMN: return torrent.get("name", "").casefold()
+            if column == self.SIZE_COLUMN: return torrent.get("sizeWhenDone", 0)
+            if column == self.PROGRESS_COLUMN: return torrent.get("percentDone", 0)
+            if column == self.STATUS_COLUMN: return -1 if torrent.get("error") else torrent.get("status", 0)
+            if column == self.DOWN_COLUMN: return torrent.get("rateDownload", 0)
+            if column == self.UP_COLUMN: return torrent.get("rateUpload", 0)
+            if column == self.ETA_COLUMN:
+                eta = torrent.get("eta", -1)
+                return eta if eta >= 0 else float("inf")
+            if column == self.RATIO_COLUMN: return torrent.get("uploadRatio", 0)
+            if column == self.PEERS_COLUMN: return torrent.get("peersConnected", 0)
+            if column == self.ADDED_COLUMN: return torrent.get("addedDate", 0)
+            return None
+        return None
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """Paints the Progress column as a progress bar."""
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        background = QStyleOptionViewItem(option)
+        self.initStyleOption(background, index)
+        background.text = "" # The bar draws the percentage
+        style.drawControl(QStyle.CE_ItemViewItem, background, painter, widget) # Selection/alternating background
+        progress = index.data(SortRole) or 0
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(2, 3, -2, -3)
+        bar.minimum = 0
+        bar.maximum = 1000
+        bar.progress = int(progress * 1000)
+        bar.text = index.data(Qt.DisplayRole)
+        bar.textVisible = True
+        bar.state = option.state
+        style.drawControl(QStyle.CE_ProgressBar, bar, painter, widget)
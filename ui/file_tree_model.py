@@ -0,0 +1,210 @@
+# ui/file_tree_model.py
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex
+
+from core.models import FileInfo, format_size
+
+
+class _PathNode:
+    """One file or folder of a torrent's path trie. Folders have a children list, files None.
+
+    A folder's file nodes are only created when it is fetched; until then its
+    FileInfos wait in _files.
+    """
+    __slots__ = ("name", "size", "parent", "row", "children", "fetched", "_subfolders", "_files")
+
+    def __init__(self, name: str, parent, is_folder: bool, size=0):
+        self.name = name
+        self.size = size
+        self.parent = parent
+        self.row = 0 # Position under parent in the current sort order (valid once fetched)
+        self.children = [] if is_folder else None
+        self.fetched = False # Children exposed to the view yet
+        self._subfolders = {} if is_folder else None # name -> folder, only while building
+        self._files = [] if is_folder else None
+
+    def path(self) -> str:
+        parts = []
+        node = self
+        while node.parent is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "/".join(reversed(parts))
+
+
+def build_path_trie(file_list: list[FileInfo]) -> _PathNode:
+    """Builds the folder trie for a file list, then sums folder sizes in one bottom-up pass."""
+    root = _PathNode("", None, True)
+    folders_by_path = {"": root} # Directory path -> folder, so each file costs one lookup, not one per level
+    folders = [] # In creation order, so every parent comes before its children
+    for file_info in file_list:
+        directory = file_info.name.replace("\\", "/").rpartition("/")[0]
+        folder = folders_by_path.get(directory)
+        if folder is None:
+            folder = root
+            for component in directory.split("/"):
+                if not component:
+                    continue
+                child = folder._subfolders.get(component)
+                if child is None:
+                    child = _PathNode(component, folder, True)
+                    folder._subfolders[component] = child
+                    folder.children.append(child)
+                    folders.append(child)
+                folder = child
+            folders_by_path[directory] = folder
+        folder._files.append(file_info)
+        folder.size += file_info.size_bytes or 0
+    for folder in reversed(folders):
+        folder.parent.size += folder.size
+        folder._subfolders = None # Only needed while building
+    root._subfolders = None
+    return root
+
+
+class FileTreeModel(QAbstractItemModel):
+    """Read-only Name/Size tree over a torrent's file list.
+
+    Only the folders of the path trie are built up front. A folder's rows (and
+    its file nodes) are created when it is first expanded (fetchMore), and
+    text, icons and tooltips are produced per painted cell, so opening a
+    20k-file batch costs little more than opening a 20-file one.
+    """
+    HEADERS = ["Name", "Size"]
+    NAME_COLUMN = 0
+    SIZE_COLUMN = 1
+    EMPTY_TEXT = "No file information available."
+
+    def __init__(self, file_list: list[FileInfo], icon_for_name, parent=None):
+        super().__init__(parent)
+        self._icon_for_name = icon_for_name # filename -> QIcon (TorrentDetailDialog.get_file_type_icon)
+        self._icons = {} # extension -> QIcon, one qtawesome lookup per file type
+        self._folder_icon = None
+        self._sort_column = self.NAME_COLUMN
+        self._sort_order = Qt.AscendingOrder
+        self._root = build_path_trie(file_list)
+        if not file_list:
+            self._root.children.append(_PathNode(self.EMPTY_TEXT, self._root, False, None))
+        self._fetch(self._root)
+
+    # --- Structure ---
+    def _node(self, index: QModelIndex) -> _PathNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if not node.fetched or not (0 <= row < len(node.children)) or not (0 <= column < len(self.HEADERS)):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = self._node(parent)
+        return len(node.children) if node.fetched else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        return node.children is not None and bool(node.children or node._files) and parent.column() <= 0
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return node.children is not None and not node.fetched
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if node.children is None or node.fetched:
+            return
+        count = len(node.children) + len(node._files)
+        if not count:
+            node.fetched = True
+            return
+        self.beginInsertRows(parent, 0, count - 1)
+        self._fetch(node)
+        self.endInsertRows()
+
+    def _fetch(self, node: _PathNode):
+        for file_info in node._files:
+            filename = file_info.name.replace("\\", "/").rpartition("/")[2]
+            node.children.append(_PathNode(filename, node, False, file_info.size_bytes or 0))
+        node._files = None
+        self._sort_children(node)
+        node.fetched = True
+
+    # --- Data ---
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == self.NAME_COLUMN:
+                return node.name
+            return format_size(node.size) if node.size is not None else ""
+        if role == Qt.DecorationRole and column == self.NAME_COLUMN and node.size is not None:
+            return self._icon(node)
+        if role == Qt.ToolTipRole and node.size is not None:
+            return node.path() if column == self.NAME_COLUMN else f"{node.size:,} bytes"
+        if role == Qt.TextAlignmentRole and column == self.SIZE_COLUMN:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == Qt.UserRole: # Sort key, as the old QTreeWidget items stored it
+            return node.name.lower() if column == self.NAME_COLUMN else node.size
+        return None
+
+    def _icon(self, node: _PathNode):
+        if node.children is not None:
+            if self._folder_icon is None:
+                import qtawesome as qta
+                self._folder_icon = qta.icon('mdi.folder-outline', color='#87CEFA')
+            return self._folder_icon
+        extension = node.name.rsplit('.', 1)[-1].lower() if '.' in node.name else ""
+        icon = self._icons.get(extension)
+        if icon is None:
+            icon = self._icons[extension] = self._icon_for_name(node.name)
+        return icon
+
+    # --- Sorting ---
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Re-sorts the folders the view has already fetched; the rest sort when expanded."""
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column, self._sort_order = column, order
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            if node.fetched:
+                self._sort_children(node)
+                pending.extend(child for child in node.children if child.children is not None)
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.createIndex(index.internalPointer().row, index.column(), index.internalPointer())
+                       for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _sort_children(self, node: _PathNode):
+        if self._sort_column == self.SIZE_COLUMN:
+            key = lambda child: (child.size or 0, child.name.casefold())
+        else:
+            key = lambda child: child.name.casefold()
+        node.children.sort(key=key, reverse=self._sort_order == Qt.DescendingOrder)
+        for row, child in enumerate(node.children):
+            child.row = row
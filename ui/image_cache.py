@@ -0,0 +1,290 @@
+# ui/image_cache.py
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import time
+
+from PySide6.QtCore import QObject, QTimer, QUrl, QByteArray, QBuffer, QIODevice, Qt, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+
+def decode_thumbnail(data: bytes, size: int) -> QImage:
+    """Decodes image bytes straight to at most size x size (null QImage on failure).
+
+    QImageReader is told the target size up front, so formats that can decode
+    scaled (JPEG) never build the full-size image. Safe to call off the GUI thread.
+    """
+    buffer = QBuffer()
+    buffer.setData(data)
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    reader.setAutoTransform(True)
+    original_size = reader.size()
+    if original_size.isValid() and (original_size.width() > size or original_size.height() > size):
+        reader.setScaledSize(original_size.scaled(size, size, Qt.KeepAspectRatio))
+    image = reader.read()
+    if not image.isNull() and (image.width() > size or image.height() > size):
+        # Reader couldn't tell the size up front; scale what it decoded
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+class _ThumbnailJobSignals(QObject):
+    finished = Signal(str, QImage, int) # url, thumbnail (null on failure), bytes written to disk
+
+
+class _ThumbnailJob(QRunnable):
+    """Decodes a downloaded image to a thumbnail and writes the cache entry, on a pool thread."""
+
+    def __init__(self, cache, key: str, url: str, data: bytes, meta: dict):
+        super().__init__()
+        self.signals = _ThumbnailJobSignals()
+        self._cache, self._key, self._url, self._data, self._meta = cache, key, url, data, meta
+
+    def run(self):
+        thumbnail = decode_thumbnail(self._data, self._cache.THUMBNAIL_SIZE)
+        written = 0
+        if not thumbnail.isNull():
+            thumb_bytes = QByteArray()
+            buffer = QBuffer(thumb_bytes)
+            buffer.open(QIODevice.WriteOnly)
+            thumbnail.save(buffer, "PNG")
+            buffer.close()
+            try:
+                self._cache._write_file(self._key, ".orig", self._data)
+                self._cache._write_file(self._key, ".thumb.png", thumb_bytes.data())
+                self._cache._write_file(self._key, ".json", json.dumps(self._meta).encode("utf-8")) # Last: marks the entry complete
+                written = len(self._data) + thumb_bytes.size()
+            except OSError as e:
+                print(f"Warning: Could not cache image {self._url}: {e}")
+        self.signals.finished.emit(self._url, thumbnail, written)
+
+
+class ImagePreviewCache(QObject):
+    """Shared disk cache for description image previews.
+
+    For each URL it keeps the original bytes (<key>.orig), a thumbnail
+    pre-scaled to THUMBNAIL_SIZE (<key>.thumb.png) and the response validators
+    (<key>.json). A cached thumbnail is handed out straight from disk. Entries
+    older than REVALIDATE_AFTER are re-checked with If-None-Match /
+    If-Modified-Since, and a 304 only refreshes the timestamp. The directory is
+    kept under MAX_CACHE_BYTES by dropping the least recently used entries.
+    All downloads go through one QNetworkAccessManager. Decoding, scaling and
+    the disk writes of new images run on a small thread pool. Only the final
+    150px QImage -> QPixmap conversion happens on the GUI thread.
+
+    Downloads wait in a priority queue (lower first) and at most
+    MAX_CONCURRENT_DOWNLOADS run at once. When every requester of an image
+    cancels, it is dropped from the queue or its download is aborted.
+    """
+    THUMBNAIL_SIZE = 150 # Matches the preview labels in TorrentDetailDialog
+    MAX_CACHE_BYTES = 200 * 1024 * 1024
+    REVALIDATE_AFTER = 24 * 3600 # Seconds before a cached image is checked with the server again
+    DECODE_THREADS = 2 # Leaves the remaining cores to the GUI and network
+    MAX_CONCURRENT_DOWNLOADS = 2 # Previews shouldn't starve searches/details of bandwidth
+
+    def __init__(self, cache_dir: str, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.network_manager = QNetworkAccessManager(self)
+        self._waiting = {} # url -> [(owner, callback)], queued or downloading, one download per URL
+        self._queue = [] # heap of (priority, sequence, url, cached meta or None)
+        self._sequence = itertools.count() # FIFO among equal priorities
+        self._replies = {} # url -> QNetworkReply in flight
+        self._total_bytes = None # Computed on first store
+        self._decode_pool = QThreadPool(self)
+        self._decode_pool.setMaxThreadCount(self.DECODE_THREADS)
+        self._jobs = {} # url -> (job signals, callbacks) while decoding
+
+    # --- Public API ---
+    def fetch(self, url: str, owner, callback, priority: int = 0):
+        """Calls callback(url, thumbnail QPixmap or None, error message or None).
+
+        A disk hit calls back before returning. If the image is then found to
+        have changed on the server, callback runs again with the new thumbnail.
+        Downloads with a lower priority value start first.
+        """
+        key = self._key(url)
+        meta = self._read_meta(key)
+        thumbnail = QPixmap(self._path(key, ".thumb.png")) if meta else QPixmap()
+        if not thumbnail.isNull():
+            self._touch(key)
+            callback(url, thumbnail, None)
+            if time.time() - meta.get("validated_at", 0) < self.REVALIDATE_AFTER:
+                return
+        else:
+            meta = None # Thumbnail missing/corrupt: download again unconditionally
+
+        # Already downloading or decoding: wait for that instead of a second request
+        if url in self._jobs:
+            self._jobs[url][1].append((owner, callback))
+            return
+        if url in self._waiting:
+            self._waiting[url].append((owner, callback))
+            if url not in self._replies:
+                # Still queued: a more urgent request moves it up (the old entry is skipped)
+                heapq.heappush(self._queue, (priority, next(self._sequence), url, meta))
+            return
+        self._waiting[url] = [(owner, callback)]
+        heapq.heappush(self._queue, (priority, next(self._sequence), url, meta))
+        self._start_downloads()
+
+    def cancel(self, owner):
+        """Forgets callbacks registered by owner (e.g. a closing dialog) and drops downloads nobody wants."""
+        for _signals, callbacks in self._jobs.values():
+            callbacks[:] = [(o, cb) for o, cb in callbacks if o is not owner]
+        for url, callbacks in list(self._waiting.items()):
+            callbacks[:] = [(o, cb) for o, cb in callbacks if o is not owner]
+            if callbacks:
+                continue
+            reply = self._replies.get(url)
+            if reply is not None:
+                print(f"Aborting image download: {url}")
+                reply.abort() # finished() cleans up and starts the next download
+            else:
+                del self._waiting[url] # Its queue entry is skipped when popped
+
+    def original_path(self, url: str) -> str | None:
+        """Local file with the original image bytes, if cached."""
+        path = self._path(self._key(url), ".orig")
+        return path if os.path.exists(path) else None
+
+    # --- Network ---
+    def _start_downloads(self):
+        while self._queue and len(self._replies) < self.MAX_CONCURRENT_DOWNLOADS:
+            _priority, _sequence, url, meta = heapq.heappop(self._queue)
+            if url not in self._waiting or url in self._replies:
+                continue # Cancelled, or a duplicate entry of one already started
+            request = QNetworkRequest(QUrl(url))
+            if meta and meta.get("etag"):
+                request.setRawHeader(b"If-None-Match", meta["etag"].encode("latin-1"))
+            if meta and meta.get("last_modified"):
+                request.setRawHeader(b"If-Modified-Since", meta["last_modified"].encode("latin-1"))
+            reply = self.network_manager.get(request)
+            reply.setProperty("image_url", url)
+            reply.setProperty("revalidating", meta is not None)
+            reply.finished.connect(self._on_reply_finished)
+            self._replies[url] = reply
+            print(f"{'Revalidating' if meta else 'Downloading'} image: {url}")
+
+    def _on_reply_finished(self):
+        reply = self.sender()
+        if not reply:
+            return
+        reply.deleteLater()
+        url = reply.property("image_url")
+        revalidating = reply.property("revalidating")
+        self._replies.pop(url, None)
+        callbacks = self._waiting.pop(url, [])
+        QTimer.singleShot(0, self._start_downloads) # Next in line, after this reply is handled
+        key = self._key(url)
+
+        if reply.error() == QNetworkReply.NetworkError.OperationCanceledError:
+            return # Aborted by cancel()
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            print(f"Network error downloading {url}: {reply.errorString()}")
+            if not revalidating: # A stale thumbnail is already on screen otherwise
+                for _owner, callback in callbacks:
+                    callback(url, None, f"Net Error: {reply.error()}")
+            return
+
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        if status == 304:
+            meta = self._read_meta(key) or {"url": url}
+            meta["validated_at"] = time.time()
+            try:
+                self._write_file(key, ".json", json.dumps(meta).encode("utf-8"))
+            except OSError as e: # The cached copy is still good; it's just revalidated again next time
+                print(f"Warning: Could not update cache entry for {url}: {e}")
+            print(f"Image unchanged on server: {url}")
+            return
+
+        meta = {
+            "url": url,
+            "etag": reply.rawHeader("ETag").data().decode("latin-1"),
+            "last_modified": reply.rawHeader("Last-Modified").data().decode("latin-1"),
+            "validated_at": time.time(),
+        }
+        job = _ThumbnailJob(self, key, url, reply.readAll().data(), meta)
+        job.signals.finished.connect(self._on_thumbnail_decoded) # Queued back to the GUI thread
+        self._jobs[url] = (job.signals, callbacks) # Keeps the signals object alive until delivery
+        self._decode_pool.start(job)
+
+    def _on_thumbnail_decoded(self, url: str, image: QImage, written: int):
+        _job, callbacks = self._jobs.pop(url, (None, []))
+        if written:
+            self._account(written)
+        if image.isNull():
+            print(f"Failed to load image data for: {url}")
+            thumbnail = None
+        else:
+            thumbnail = QPixmap.fromImage(image) # Small (150px), so cheap on the GUI thread
+        for _owner, callback in callbacks:
+            callback(url, thumbnail, None if thumbnail is not None else "Load Failed")
+
+    # --- Disk ---
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, key + suffix)
+
+    def _read_meta(self, key: str) -> dict | None:
+        try:
+            with open(self._path(key, ".json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_file(self, key: str, suffix: str, data: bytes):
+        path = self._path(key, suffix)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+    def _touch(self, key: str):
+        try:
+            os.utime(self._path(key, ".json")) # mtime of the .json is the entry's last use
+        except OSError:
+            pass
+
+    def _account(self, added_bytes: int):
+        if self._total_bytes is None:
+            self._total_bytes = sum(entry.stat().st_size for entry in os.scandir(self.cache_dir) if entry.is_file())
+        else:
+            self._total_bytes += added_bytes
+        if self._total_bytes > self.MAX_CACHE_BYTES:
+            self._evict()
+
+    def _evict(self):
+        """Deletes least recently used entries until the cache is at 90% of its limit."""
+        entries = {} # key -> [last used, bytes]
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_file():
+                continue
+            key, _, suffix = entry.name.partition(".")
+            stat = entry.stat()
+            record = entries.setdefault(key, [0.0, 0])
+            record[1] += stat.st_size
+            if suffix == "json":
+                record[0] = stat.st_mtime
+        total = sum(size for _last_used, size in entries.values())
+        target = self.MAX_CACHE_BYTES * 0.9
+        for key, (_last_used, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+            if total <= target:
+                break
+            for suffix in (".json", ".thumb.png", ".orig"):
+                try:
+                    os.remove(self._path(key, suffix))
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Warning: Could not evict cached image {key}: {e}")
+            total -= size
+        self._total_bytes = total
+        print(f"Image cache trimmed to {total / (1024 * 1024):.1f} MiB.")
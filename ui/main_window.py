@@ -1,25 +1,41 @@
 import sys
 import os
-import webbrowser  
-import pyperclip   
 import json        
 import re
+import time
+import queue
+import threading
+from collections import deque
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+                               QLineEdit, QPushButton, QTableWidget, QTableView, QAbstractItemView,
                                QHeaderView, QLabel, QTabWidget, QComboBox, QStatusBar, QGroupBox, QGridLayout,
                                QSizePolicy, # Keep QSizePolicy
                                QSpinBox, # Keep QSpinBox
                                QFileDialog, QMessageBox, QDialog, QRadioButton, QButtonGroup,
-                               QDateEdit, QFrame, QScrollArea, QCheckBox, QMenu) # REMOVE QDateEdit, ADD QCheckBox, QMenu
-from PySide6.QtCore import Qt, QThread, Signal, QCoreApplication, QSettings, QDate, QTimer, QUrl, QSize, QObject, QEvent, QByteArray # REMOVE QDate, ADD QObject, QEvent, QByteArray
+                               QDateEdit, QFrame, QScrollArea, QCheckBox, QMenu, QCompleter) # REMOVE QDateEdit, ADD QCheckBox, QMenu
+from PySide6.QtCore import Qt, QThread, Signal, QCoreApplication, QSettings, QDate, QTimer, QUrl, QSize, QObject, QEvent, QByteArray, QStringListModel, QSortFilterProxyModel # REMOVE QDate, ADD QObject, QEvent, QByteArray
 from PySide6.QtGui import QIcon, QAction, QDesktopServices, QPixmap, QColor, QPalette, QClipboard, QKeySequence, QShortcut # Added QAction, QClipboard, QKeySequence, QShortcut
-import qtawesome as qta
 
 # Core component imports (Scraper remains, TorrentManager removed)
-from core.scraper import NyaaScraper, ScrapeResult, TorrentDetails, format_size
-from ui.torrent_detail_dialog import TorrentDetailDialog
-from ui.filter_dialog import FilterDialog # Import the new dialog
+# Only what the first frame needs is imported here. The scraper stack (cloudscraper,
+# requests, bs4), qtawesome, the dialogs and the image cache load on first use.
+from core.models import ScrapeResult, TorrentDetails, format_size, DETAIL_COMMENT_LIMIT, DETAIL_DESCRIPTION_LIMIT
+from core.release_parser import SeriesIndex
+from core.mark_store import MarkStore
+from core.settings_store import SettingsStore
+from core.search_history import SearchHistory
+from core.results_snapshot import ResultsSnapshot, save_snapshot, load_snapshot
+from core.handoff import HandoffItem
 from .settings_widget import SettingsWidget # Import the new widget
+from .results_model import ResultsTableModel, ResultsFilterProxyModel, ResultActionsDelegate
+from .category_icons import CategoryIconCache
+from .downloads_model import DownloadsTableModel, ProgressBarDelegate, SortRole as DownloadsSortRole
+
+
+def copy_to_clipboard(text: str):
+    """pyperclip.copy, imported on first use."""
+    import pyperclip
+    pyperclip.copy(text)
 
 # --- Worker Thread for Scraping Search Results (Keep) ---
 class ScraperWorker(QThread):
@@ -37,13 +53,13 @@ class ScraperWorker(QThread):
         self.proxy_config = proxy_config
         self.trusted_only = trusted_only # Store trusted filter state
         self.uploader = uploader # Store uploader filter state
-        # Initializing scraper here means a new session for each search.
-        # Consider initializing it once in MainWindow and passing it if session reuse is desired.
-        # However, re-initializing might be safer if sessions expire or have issues.
-        self.scraper = NyaaScraper(cloudflare_delay=self.delay, proxy_config=self.proxy_config)
 
     def run(self):
         try:
+            # Built here, on the worker thread: a new session for each search, and the
+            # scraper stack is imported off the UI thread the first time
+            from core.scraper import NyaaScraper
+            self.scraper = NyaaScraper(cloudflare_delay=self.delay, proxy_config=self.proxy_config)
             print(f"Worker starting scrape: Q='{self.query}', Cat='{self.category}', Sort='{self.sort_by}', Page={self.page}, Delay={self.delay}s, Timeout={self.timeout}s, Trusted={self.trusted_only}, Uploader='{self.uploader}'")
             results = self.scraper.search(
                 self.query,
@@ -76,18 +92,22 @@ class DetailScraperWorker(QThread):
     details_ready = Signal(TorrentDetails)
     error_occurred = Signal(str)
 
-    def __init__(self, url, delay, timeout, proxy_config):
+    def __init__(self, url, delay, timeout, proxy_config, comment_limit=None, description_limit=None):
         super().__init__()
         self.url = url
         self.delay = delay
         self.timeout = timeout
         self.proxy_config = proxy_config
-        self.scraper = NyaaScraper(cloudflare_delay=self.delay, proxy_config=self.proxy_config)
+        self.comment_limit = comment_limit
+        self.description_limit = description_limit
 
     def run(self):
         try:
+            from core.scraper import NyaaScraper
+            self.scraper = NyaaScraper(cloudflare_delay=self.delay, proxy_config=self.proxy_config)
             print(f"Detail Worker starting scrape for: {self.url}, Delay={self.delay}s, Timeout={self.timeout}s")
-            details = self.scraper.get_torrent_details(self.url, timeout=self.timeout)
+            details = self.scraper.get_torrent_details(self.url, timeout=self.timeout, comment_limit=self.comment_limit,
+                                                       description_limit=self.description_limit)
             self.details_ready.emit(details)
         except FileNotFoundError as e:
             print(f"Detail scraper error: {e}")
@@ -107,16 +127,181 @@ class DetailScraperWorker(QThread):
             traceback.print_exc()
             self.error_occurred.emit(f"An unexpected error occurred fetching details: {e}")
 
+class DetailPartWorker(QThread):
+    """Fetches the part of a details page left out by the caps: the full description or more comments."""
+    description_ready = Signal(str)
+    comments_ready = Signal(list, int) # Comments, index of the next comment div
+    error_occurred = Signal(str)
+
+    def __init__(self, url, delay, timeout, proxy_config, comments_start=None, comment_limit=None):
+        super().__init__()
+        self.url = url
+        self.timeout = timeout
+        self.comments_start = comments_start # None fetches the description instead
+        self.comment_limit = comment_limit
+        self.delay = delay
+        self.proxy_config = proxy_config
+
+    def run(self):
+        try:
+            from core.scraper import NyaaScraper
+            self.scraper = NyaaScraper(cloudflare_delay=self.delay, proxy_config=self.proxy_config)
+            if self.comments_start is None:
+                print(f"Detail Part Worker fetching full description for: {self.url}")
+                self.description_ready.emit(self.scraper.get_full_description(self.url, timeout=self.timeout))
+            else:
+                print(f"Detail Part Worker fetching comments from #{self.comments_start + 1} for: {self.url}")
+                self.comments_ready.emit(*self.scraper.get_torrent_comments(
+                    self.url, self.comments_start, self.comment_limit, timeout=self.timeout))
+        except Exception as e:
+            print(f"Detail part error: {type(e).__name__} - {e}")
+            self.error_occurred.emit(f"{e}")
+
+# --- Worker Thread for the Transmission Connection ---
+class TransmissionWorker(QThread):
+    """Owns the TransmissionClient (one connection, one session id) and runs its calls
+    in order. The UI queues polls and actions; a poll already waiting isn't queued twice."""
+    connected = Signal(dict) # session-get arguments
+    changes_ready = Signal(object) # TorrentChanges
+    connection_lost = Signal(str)
+    action_failed = Signal(str)
+
+    def __init__(self, host, port, username, password):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self._commands = queue.Queue()
+        self._poll_lock = threading.Lock()
+        self._poll_queued = False
+
+    def request_poll(self, full=False):
+        with self._poll_lock:
+            if self._poll_queued:
+                return
+            self._poll_queued = True
+        self._commands.put(("poll", full))
+
+    def request_action(self, action, ids, delete_data=False):
+        """action: "start", "stop" or "remove"."""
+        self._commands.put((action, ids, delete_data))
+
+    def request_stop(self):
+        self._commands.put(None)
+
+    def run(self):
+        from core.transmission import TransmissionClient, TorrentChanges, TransmissionError
+        client = TransmissionClient(self.host, self.port, username=self.username, password=self.password)
+        try:
+            print(f"Transmission worker connecting to {client.url}")
+            self.connected.emit(client.connect())
+            while True:
+                command = self._commands.get()
+                if command is None:
+                    break
+                try:
+                    if command[0] == "poll":
+                        with self._poll_lock:
+                            self._poll_queued = False
+                        changes = client.poll(full=command[1])
+                        if changes:
+                            # Copies: the client keeps updating its own dicts on this thread
+                            self.changes_ready.emit(TorrentChanges([dict(torrent) for torrent in changes.added],
+                                                                   changes.changed, changes.removed, changes.full))
+                        continue
+                    action, ids, delete_data = command
+                    if action == "start":
+                        client.start(ids)
+                    elif action == "stop":
+                        client.stop(ids)
+                    elif action == "remove":
+                        client.remove(ids, delete_data=delete_data)
+                    self.request_poll() # Show the result without waiting for the next tick
+                except TransmissionError as e:
+                    print(f"Transmission error: {e}")
+                    self.action_failed.emit(str(e))
+        except (ConnectionError, TransmissionError) as e:
+            print(f"Transmission connection error: {e}")
+            self.connection_lost.emit(str(e))
+        except Exception as e:
+            import traceback
+            print(f"Transmission worker error: {type(e).__name__} - {e}")
+            traceback.print_exc()
+            self.connection_lost.emit(f"Unexpected error: {e}")
+        finally:
+            client.close()
+
+# --- Worker Thread for Sending Torrents to Transmission ---
+class ClientHandoffWorker(QThread):
+    """Runs a ClientHandoff: skips what Transmission already has, adds the rest over a few connections."""
+    progress = Signal(int, int, str) # done, total, torrent name
+    report_ready = Signal(object) # HandoffReport
+    error_occurred = Signal(str)
+
+    def __init__(self, items, host, port, username, password):
+        super().__init__()
+        self.items = items
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True # Batches not yet started are skipped
+
+    def run(self):
+        from core.handoff import ClientHandoff
+        from core.transmission import TransmissionClient, TransmissionError
+        handoff = ClientHandoff(lambda: TransmissionClient(self.host, self.port, username=self.username, password=self.password))
+        print(f"Handoff worker sending {len(self.items)} torrents to Transmission at {self.host}:{self.port}")
+        try:
+            report = handoff.run(self.items, is_cancelled=lambda: self._cancelled,
+                                 on_progress=lambda done, total, item, status: self.progress.emit(done, total, item.name or item.link))
+        except (ConnectionError, TransmissionError) as e:
+            print(f"Handoff error: {e}")
+            self.error_occurred.emit(str(e))
+            return
+        print(f"Handoff finished: {len(report.added)} added, {len(report.skipped)} skipped, "
+              f"{len(report.failed)} failed, {report.retries} retries in {report.seconds}s")
+        self.report_ready.emit(report)
+
 # --- Main Application Window ---
 class MainWindow(QMainWindow):
+    settings_write_failed = Signal(str) # Emitted from the settings writer thread
+
     # --- Constants ---
     DEFAULT_SCRAPER_DELAY = 10 # Default delay value
     APP_NAME = "NyaaDesktopClient" # Define once
     ORG_NAME = "YourOrgName" # Optional: For QSettings
 
     SETTINGS_FILE_NAME = "settings.json" # Use .json extension
+    MARKS_FILE_NAME = "marks" # Base name of the marks snapshot (.dat) and journal (.log)
+    LEGACY_MARKS_JOURNAL_NAME = "marks.journal" # Link-keyed journal used before MarkStore
+    HISTORY_FILE_NAME = "history.sqlite3" # Ranked search history with a prefix/trigram index
+    HISTORY_SUGGESTION_LIMIT = 10 # Completions shown under the search box
+    IMAGE_CACHE_DIR_NAME = "image_cache" # Original preview images + thumbnails
+    RESULTS_SNAPSHOT_FILE_NAME = "last_results.json" # Last page shown, rendered instantly on the next launch
+
+    NAME_FILTER_DEBOUNCE_MS = 150 # Pause in typing before the live name filter runs
+
+    # --- Infinite Scroll ---
+    RESULTS_PER_PAGE = 75 # Nyaa's page size; a shorter page is the last one
+    INFINITE_SCROLL_MAX_PAGES = 20 # Pages kept in memory before the oldest is evicted
+    INFINITE_SCROLL_MIN_INTERVAL_MS = 2000 # Minimum gap between page fetches
+    INFINITE_SCROLL_THRESHOLD_ROWS = 15 # Fetch when fewer rows than this remain below the viewport
+
+    # --- Downloads (Transmission) Refresh --- #
+    # Each poll only transfers recently active torrents, so its cost grows with the active count
+    DOWNLOAD_REFRESH_ACTIVE_MS = 1000 # Downloads tab on screen, torrents transferring
+    DOWNLOAD_REFRESH_PER_ACTIVE_MS = 10 # Added per active torrent, up to the idle interval
+    DOWNLOAD_REFRESH_IDLE_MS = 5000 # Downloads tab on screen, nothing transferring
+    DOWNLOAD_REFRESH_BACKGROUND_MS = 15000 # Another tab is shown
+    DOWNLOAD_REFRESH_HIDDEN_MS = 45000 # Minimized; under Transmission's 60 s "recently active" window
 
     def __init__(self):
+        self._startup_finished = False # Set before super().__init__: event() runs from there on
         super().__init__()
         self.setWindowTitle(f"{self.APP_NAME}")
         self.setGeometry(100, 100, 1200, 700)
@@ -135,10 +320,11 @@ class MainWindow(QMainWindow):
         self.saved_download_path = os.path.expanduser("~") # Default to user's home dir initially
         self.detail_worker = None
         self.scraper_worker = None # Track search worker too
+        self.page_fetch_worker = None # Background next-page fetch (infinite scroll)
 
         # --- Corrected Mappings for UI Columns ---
-        # UI Columns: [Mark(0), Cat(1), Name(2), Size(3), Date(4), S(5), L(6), Uploader(7), Actions(8)]
-        # Nyaa Sort Keys: name, size, id (for date), seeders, leechers
+        # UI Columns: [Mark(0), Cat(1), Name(2), Size(3), Date(4), S(5), L(6), D(7), Uploader(8), Actions(9)]
+        # Nyaa Sort Keys: name, size, id (for date), seeders, leechers, downloads
 
         # Map API sort key -> UI Column Index
         self.sort_key_to_column_map = {
@@ -147,6 +333,7 @@ class MainWindow(QMainWindow):
             "date": 4,  # Represents sorting by date
             "seeders": 5,
             "leechers": 6,
+            "downloads": 7,
             "id": 4     # Nyaa API uses 'id' for date sorting, map it to the same UI column
         }
 
@@ -156,27 +343,48 @@ class MainWindow(QMainWindow):
             3: "size",
             4: "date",    # Clicking UI Date column (4) should sort by 'date'
             5: "seeders",
-            6: "leechers"
+            6: "leechers",
+            7: "downloads"
         }
-        # Note: We don't need a reverse mapping for UI Col 1 (Cat), 7 (Uploader), 8 (Actions) as they aren't sorted via header click
+        # Note: We don't need a reverse mapping for UI Col 1 (Cat), 8 (Uploader), 9 (Actions) as they aren't sorted via header click
 
         # Initialize current sort based on default ('date')
         self.current_sort_by = "date" # Default sort key (used by dropdown and worker)
         self.current_sort_column = self.sort_key_to_column_map.get(self.current_sort_by, 3) # Should map to 4 (Date column)
         self.current_sort_order = Qt.DescendingOrder
+        # Local sort: header clicks reorder the loaded rows instead of re-querying Nyaa
+        self.sort_locally = False
+        self.local_sort_column = -1 # -1 = server order
+        self.local_sort_order = Qt.DescendingOrder
+        # Infinite scroll: scrolling near the bottom appends the next page
+        self.infinite_scroll = False
+        self._loaded_pages = deque() # (page number, rows kept from it), oldest first
+        self._last_page_reached = False
+        self._search_generation = 0 # Bumped per search so late page fetches are dropped
+        self._last_page_fetch_time = 0.0
+        self._page_fetch_timer = QTimer(self)
+        self._page_fetch_timer.setSingleShot(True)
+        self._page_fetch_timer.timeout.connect(self._check_infinite_scroll)
 
         # --- State Variables ---
         self.scraper_delay = self.DEFAULT_SCRAPER_DELAY
-        self.search_history = []
-        self.max_history_items = 25 # Default, will be loaded from settings
+        self.search_history = [] # Most recent terms, as shown in history_combo
+        self.max_history_items = 25 # Default, will be loaded from settings (size of the dropdown only)
         # Filter States
         self.min_size_bytes = 0
         self.max_size_bytes = 0 # 0 means no upper limit
         self.min_seeders = 0
         self.filter_trusted_only = False # Add state for trusted filter
         self.filter_uploader = "" # Add state for uploader filter
-        self.current_results = [] # Store the currently displayed results for context menu
+        self.current_results = [] # The result store shown by results_model (source rows index into it)
+        # --- Series Grouping State --- #
+        self.series_index = SeriesIndex() # Rebuilt once per results update, not per keystroke
+        self._series_index_stale = False
+        self.group_by_series = False
         self.network_timeout = 30 # Default seconds, loaded from settings
+        self.detail_comment_limit = DETAIL_COMMENT_LIMIT # Comments parsed with a details page; more on request
+        self._detail_part_workers = set() # DetailPartWorkers in flight
+        self.detail_description_limit = DETAIL_DESCRIPTION_LIMIT # Characters of description HTML, likewise
         self.default_download_path = os.path.expanduser("~") # Default to user's home dir
         # self.start_date = None # Remove date filters
         # _initial_load_done = False # Flag no longer needed with this approach
@@ -188,8 +396,39 @@ class MainWindow(QMainWindow):
         self.proxy_username = ""
         self.proxy_password = ""
 
+        # --- Transmission State --- #
+        self.transmission_enabled = False
+        self.transmission_host = "localhost"
+        self.transmission_port = 9091
+        self.transmission_username = ""
+        self.transmission_password = ""
+        self.transmission_worker = None # TransmissionWorker while connecting/connected
+        self._retired_transmission_workers = set() # Replaced workers finishing their last call
+        self.handoff_worker = None # ClientHandoffWorker sending torrents to Transmission
+        self.handoff_progress_dialog = None
+        self._transmission_connected = False
+        self.download_refresh_interval_ms = self.DOWNLOAD_REFRESH_IDLE_MS
+
+        # --- Settings Store --- #
+        # save_settings() only hands a snapshot to this; it writes on its own thread
+        self.settings_write_failed.connect(self.show_error_message) # Queued onto the UI thread
+        self.settings_store = SettingsStore(self.get_settings_path(), on_error=self.settings_write_failed.emit)
+
         # --- Mark As State --- #
-        self.marked_torrents = set() # Store links of marked torrents
+        # Marks keyed by torrent id, persisted by their own snapshot + journal (not settings.json)
+        self.marked_torrents = MarkStore(os.path.join(os.path.dirname(self.get_settings_path()), self.MARKS_FILE_NAME))
+        self._migrate_legacy_marks()
+
+        # --- Search History --- #
+        # Every search is kept; the dropdown shows the latest, the completer the best ranked
+        self.history_store = SearchHistory(os.path.join(os.path.dirname(self.get_settings_path()), self.HISTORY_FILE_NAME))
+        self._migrate_legacy_history()
+
+        # --- Image Previews --- #
+        # One disk cache + network manager shared by every details dialog, created with the first one
+        self._image_cache = None
+
+        self._stale_snapshot = None # ResultsSnapshot on screen until the first search result arrives
 
         # Map Nyaa category strings to Material Design Icons and colors
         # Using keywords allows flexibility
@@ -213,6 +452,8 @@ class MainWindow(QMainWindow):
             "Software - Games": ("mdi.gamepad-variant-outline", "tomato"),
             "default": ("mdi.help-circle-outline", "grey")
         }
+        # Resolved and rendered once; every known category is warmed right after the first frame
+        self.category_icons = CategoryIconCache(self.category_icon_map)
 
         # --- Directly Apply Dark Theme Here ---
         self._apply_dark_theme_stylesheet()
@@ -220,23 +461,22 @@ class MainWindow(QMainWindow):
         # --- Initialize UI ---
         self.init_ui()
 
-        # --- Initialize Filter Dialog --- #
-        self.filter_dialog = FilterDialog(self)
-        self.filter_dialog.filters_applied.connect(self._apply_filters_from_dialog)
-        self.filter_dialog.filters_cleared.connect(self._clear_filters_from_dialog)
+        # --- Warm Start --- #
+        # The last session's page is shown (marked stale) until the initial search refreshes it
+        self._restore_results_snapshot()
+
+        # --- Filter Dialog --- #
+        self.filter_dialog = None # Built the first time the Filters button is clicked
 
         # --- Final Setup after UI and Settings --- #
         # Connect signals that might trigger unwanted searches during init/load
         self.category_combo.currentIndexChanged.connect(self.on_category_changed)
         self.sort_combo.currentIndexChanged.connect(self.on_sort_changed)
 
-        # Connect item changed signal for checkbox handling
-        self.results_table.itemChanged.connect(self._handle_item_marked_state_changed)
-
-        # Trigger initial search after everything is set up
-        print("DEBUG: Triggering initial search after __init__.")
-        QTimer.singleShot(0, self._trigger_initial_search) # Use timer
+        # Connect mark checkbox handling
+        self.results_model.mark_toggled.connect(self._handle_mark_toggled)
 
+        # Icons and the initial search wait for the first frame (see event())
         # --- Setup Global Shortcuts ---
         self._setup_shortcuts()
 
@@ -264,70 +504,158 @@ class MainWindow(QMainWindow):
         else:
             print("Error: Could not get QApplication instance to apply stylesheet.")
 
+    # --- Transmission --- #
     def _attempt_initial_transmission_connect(self):
-        """Tries to connect to Transmission on startup and start the timer if successful."""
-        print("Attempting initial connection to Transmission...")
-        try:
-            # Try getting status as a connection test
-            self.transmission_manager.get_torrents_status()
-            self._transmission_connected = True
-            print("Initial Transmission connection successful. Starting refresh timer.")
-            self.show_status_message("Connected to Transmission.", 5000)
-            self.download_refresh_timer.start(self.download_refresh_interval_ms)
-            # Trigger an immediate refresh
-            self._refresh_download_list()
-        except ConnectionError as e:
-            self._transmission_connected = False
-            print(f"Initial Transmission connection failed: {e}")
-            self.show_error_message(f"Transmission Connect Failed: {e} - Check Settings tab.")
-            self._show_disconnected_state()
-        except Exception as e:
-            self._transmission_connected = False
-            print(f"Unexpected error during initial Transmission connection: {e}")
-            self.show_error_message(f"Transmission Init Error: {e}")
+        """Connects to Transmission on startup if it's enabled in settings."""
+        if self.transmission_worker:
+            return # Already connecting (settings changed before the first frame)
+        if self.transmission_enabled:
+            print("Attempting initial connection to Transmission...")
+            self._connect_transmission()
+        else:
             self._show_disconnected_state()
 
-    def _show_disconnected_state(self):
+    def _connect_transmission(self):
+        """(Re)starts the Transmission worker; polling starts once it has connected."""
+        self._stop_transmission_worker()
+        if not self.transmission_enabled or not self.transmission_host:
+            self._show_disconnected_state()
+            return
+        self.transmission_status_label.setText(f"Connecting to Transmission at {self.transmission_host}:{self.transmission_port}...")
+        self.connect_button.setEnabled(False)
+        worker = TransmissionWorker(self.transmission_host, self.transmission_port,
+                                    self.transmission_username, self.transmission_password)
+        worker.connected.connect(self._on_transmission_connected)
+        worker.changes_ready.connect(self._apply_download_changes)
+        worker.connection_lost.connect(self._on_transmission_connection_lost)
+        worker.action_failed.connect(lambda message: self.show_status_message(f"Transmission: {message}", 8000))
+        self.transmission_worker = worker
+        worker.start()
+
+    def _stop_transmission_worker(self, wait_ms=0):
+        worker, self.transmission_worker = self.transmission_worker, None
+        if worker is None:
+            return
+        for signal in (worker.connected, worker.changes_ready, worker.connection_lost, worker.action_failed):
+            signal.disconnect() # A late answer from the old connection must not touch the table
+        worker.request_stop()
+        # It finishes its current call (at most the client's timeout) on its own; keep it alive until then
+        self._retired_transmission_workers.add(worker)
+        worker.finished.connect(lambda: self._retired_transmission_workers.discard(worker))
+        if worker.isFinished(): # e.g. it reported the lost connection on its way out
+            self._retired_transmission_workers.discard(worker)
+        if wait_ms and not worker.wait(wait_ms):
+            print("Terminating Transmission worker...")
+            worker.terminate()
+            worker.wait(1000)
+        self.download_refresh_timer.stop()
+        self._transmission_connected = False
+
+    def _on_transmission_connected(self, session: dict):
+        self._transmission_connected = True
+        version = session.get("version", "")
+        print(f"Connected to Transmission {version}. Starting refresh timer.")
+        self.show_status_message("Connected to Transmission.", 5000)
+        self.downloads_model.clear()
+        self._update_download_status_label()
+        self._update_download_buttons()
+        self._update_download_refresh_interval()
+        self.download_refresh_timer.start(self.download_refresh_interval_ms)
+        # Trigger an immediate refresh (the first poll lists every torrent)
+        self._refresh_download_list()
+
+    def _on_transmission_connection_lost(self, message: str):
+        self._stop_transmission_worker()
+        self.show_error_message(f"Transmission Connect Failed: {message} - Check Settings tab.")
+        self._show_disconnected_state(message)
+
+    def _show_disconnected_state(self, message: str = ""):
         """Updates UI elements to reflect a disconnected state from Transmission."""
-        self.downloads_table.clearContents()
-        self.downloads_table.setRowCount(0)
-        # Maybe add a placeholder row?
-        # self.downloads_table.setRowCount(1)
-        # placeholder_item = QTableWidgetItem("Not connected to Transmission. Check Settings.")
-        # placeholder_item.setTextAlignment(Qt.AlignCenter)
-        # self.downloads_table.setItem(0, 0, placeholder_item)
-        # self.downloads_table.setSpan(0, 0, 1, self.downloads_table.columnCount())
-        # Disable buttons
-        self.pause_button.setEnabled(False)
-        self.resume_button.setEnabled(False)
-        self.remove_button.setEnabled(False)
-        self.remove_data_button.setEnabled(False)
-        # Ensure timer is stopped
+        self.downloads_model.clear()
         if self.download_refresh_timer.isActive():
-             print("Stopping download refresh timer due to disconnect.")
-             self.download_refresh_timer.stop()
+            print("Stopping download refresh timer due to disconnect.")
+            self.download_refresh_timer.stop()
         self._transmission_connected = False # Explicitly set flag
-        # Update status bar persistently?
-        self.show_status_message("Error: Disconnected from Transmission. Check Settings.", 0) # timeout 0 for persistent
+        if not self.transmission_enabled:
+            self.transmission_status_label.setText("Transmission is not set up. Enable it in the Settings tab.")
+        else:
+            self.transmission_status_label.setText(f"Not connected to Transmission at {self.transmission_host}:{self.transmission_port}"
+                                                   + (f": {message}" if message else "."))
+        self.connect_button.setEnabled(self.transmission_enabled)
+        self._update_download_buttons()
+
+    def _refresh_download_list(self):
+        if self.transmission_worker and self._transmission_connected:
+            self.transmission_worker.request_poll()
+
+    def _apply_download_changes(self, changes):
+        """Applies one poll's deltas to the table; only the changed cells repaint."""
+        self.downloads_model.apply_changes(changes)
+        self._update_download_status_label()
+        self._update_download_refresh_interval()
+
+    def _update_download_status_label(self):
+        total = self.downloads_model.rowCount()
+        active = self.downloads_model.active_count()
+        self.transmission_status_label.setText(f"Transmission at {self.transmission_host}:{self.transmission_port}: "
+                                               f"{total} torrents, {active} active.")
+        self.connect_button.setEnabled(True)
+
+    def _update_download_refresh_interval(self):
+        """Polls often only while someone can see the list and something is moving."""
+        if not self._transmission_connected:
+            return
+        if not self.isVisible() or self.isMinimized():
+            interval = self.DOWNLOAD_REFRESH_HIDDEN_MS
+        elif self.tabs.currentWidget() is not self.downloads_tab:
+            interval = self.DOWNLOAD_REFRESH_BACKGROUND_MS
+        elif self.downloads_model.active_count():
+            interval = min(self.DOWNLOAD_REFRESH_IDLE_MS, self.DOWNLOAD_REFRESH_ACTIVE_MS
+                           + self.downloads_model.active_count() * self.DOWNLOAD_REFRESH_PER_ACTIVE_MS)
+        else:
+            interval = self.DOWNLOAD_REFRESH_IDLE_MS
+        if interval == self.download_refresh_interval_ms and self.download_refresh_timer.isActive():
+            return
+        sooner = interval < self.download_refresh_interval_ms
+        self.download_refresh_interval_ms = interval
+        if self.download_refresh_timer.isActive():
+            self.download_refresh_timer.start(interval)
+            if sooner:
+                self._refresh_download_list() # e.g. the tab was just opened: don't show a stale list
+
+    def _selected_download_ids(self) -> list[int]:
+        rows = sorted(self.downloads_proxy.mapToSource(index).row() for index in self.downloads_table.selectionModel().selectedRows())
+        return self.downloads_model.torrent_ids(rows)
+
+    def _update_download_buttons(self, *_args):
+        has_selection = self._transmission_connected and bool(self.downloads_table.selectionModel().selectedRows())
+        for button in (self.pause_button, self.resume_button, self.remove_button, self.remove_data_button):
+            button.setEnabled(has_selection)
+
+    def _run_download_action(self, action: str, delete_data: bool = False):
+        """Pauses ("stop"), resumes ("start") or removes the selected torrents."""
+        ids = self._selected_download_ids()
+        if not ids or not self.transmission_worker:
+            return
+        if action == "remove":
+            what = "and delete their downloaded files" if delete_data else "from Transmission (files are kept)"
+            reply = QMessageBox.question(self, "Remove Torrents?", f"Remove {len(ids)} torrent(s) {what}?",
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        self.transmission_worker.request_action(action, ids, delete_data)
 
     def get_category_icon(self, category_name):
-        """Gets a qtawesome icon based on the category name."""
-        # Normalize category name for comparison
-        norm_category_name = category_name.lower().strip()
-        # Prioritize exact matches first
-        if norm_category_name in (key.lower() for key in self.category_icon_map):
-             for key, (icon_name, color) in self.category_icon_map.items():
-                 if key.lower() == norm_category_name:
-                      return qta.icon(icon_name, color=color)
-
-        # Fallback to keyword matching
-        for key, (icon_name, color) in self.category_icon_map.items():
-            if key == "default": continue # Skip default in keyword search
-            # Match if key (as a keyword) is in the category name
-            if key.lower() in norm_category_name:                
-                return qta.icon(icon_name, color=color)
-        # Final fallback
-        return qta.icon(self.category_icon_map["default"][0], color=self.category_icon_map["default"][1])
+        """Gets the (cached, pre-rendered) icon for a category name."""
+        return self.category_icons.icon(category_name, self.devicePixelRatioF())
+
+    def changeEvent(self, event):
+        # Moving to a screen with another scale needs icons rendered for the new ratio
+        if event.type() == QEvent.DevicePixelRatioChange and hasattr(self, 'results_model'):
+            self.results_model.clear_icon_cache()
+        if event.type() == QEvent.WindowStateChange and hasattr(self, 'downloads_model'):
+            self._update_download_refresh_interval() # Minimized: poll rarely; restored: refresh now
+        super().changeEvent(event)
 
     def init_ui(self):
         main_widget = QWidget()
@@ -343,7 +671,8 @@ class MainWindow(QMainWindow):
         search_layout = QVBoxLayout(search_tab)
         search_layout.setContentsMargins(10, 10, 10, 10)
         search_layout.setSpacing(12)
-        self.tabs.addTab(search_tab, qta.icon('mdi.magnify', color='lightblue'), "Search")
+        self.search_tab = search_tab
+        self.tabs.addTab(search_tab, "Search") # Tab and button icons: _install_icons
 
         # -- Top Search Area --
         top_search_layout = QHBoxLayout()
@@ -353,7 +682,24 @@ class MainWindow(QMainWindow):
         self.search_input.setPlaceholderText("Search Nyaa.si...")
         self.search_input.setToolTip("Enter search terms. You can use Nyaa operators like uploader:SomeUser, -exclude, trusted:yes")
         self.search_input.returnPressed.connect(lambda: self.start_search(reset_page=True))
-        self.search_input.textChanged.connect(self._apply_row_visibility_filters) # Connect textChanged to filter method
+        # Debounced: the live filter runs once typing pauses, not on every keystroke
+        self._name_filter_timer = QTimer(self)
+        self._name_filter_timer.setSingleShot(True)
+        self._name_filter_timer.setInterval(self.NAME_FILTER_DEBOUNCE_MS)
+        self._name_filter_timer.timeout.connect(self._apply_row_visibility_filters)
+        self.search_input.textChanged.connect(lambda _text: self._name_filter_timer.start())
+        # History completion (SearchHistory already ranks and filters, so show its list as-is)
+        self.history_completion_model = QStringListModel(self)
+        self.history_completer = QCompleter(self.history_completion_model, self)
+        self.history_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.history_completer.setWidget(self.search_input)
+        self.history_completer.activated.connect(self.search_input.setText)
+        self.search_input.textEdited.connect(self._update_history_completions)
+        # Rare substrings need the slower trigram lookup: done once typing pauses
+        self._history_substring_timer = QTimer(self)
+        self._history_substring_timer.setSingleShot(True)
+        self._history_substring_timer.setInterval(self.NAME_FILTER_DEBOUNCE_MS)
+        self._history_substring_timer.timeout.connect(self._complete_history_substrings)
         top_search_layout.addWidget(self.search_input, 1) # Give search input stretch factor
 
         # -- Category Filter --
@@ -386,7 +732,7 @@ class MainWindow(QMainWindow):
         self.sort_combo = QComboBox()
         self.sort_options = {
             "Date": "date", "Seeders": "seeders", "Leechers": "leechers",
-            "Size": "size", "Name": "name"
+            "Size": "size", "Name": "name", "Downloads": "downloads"
         }
         for name, code in self.sort_options.items():
             self.sort_combo.addItem(name, code)
@@ -415,7 +761,7 @@ class MainWindow(QMainWindow):
         top_search_layout.addSpacing(10) # Add space before Filters button
 
         # --- Filters Button --- #
-        self.filters_button = QPushButton(qta.icon('mdi.filter-variant'), "Filters")
+        self.filters_button = QPushButton("Filters")
         self.filters_button.setToolTip("Set additional search filters (size, seeders, etc.)")
         self.filters_button.setCheckable(False) # We'll manage style manually
         self.filters_button.setObjectName("FiltersButton") # For QSS styling
@@ -424,9 +770,9 @@ class MainWindow(QMainWindow):
         top_search_layout.addSpacing(10) # Space before search button
 
         # Keep Search button at the end
-        search_button = QPushButton(qta.icon('mdi.magnify', color='white'), "Search")
-        search_button.clicked.connect(lambda: self.start_search(reset_page=True))
-        top_search_layout.addWidget(search_button)
+        self.search_button = QPushButton("Search")
+        self.search_button.clicked.connect(lambda: self.start_search(reset_page=True))
+        top_search_layout.addWidget(self.search_button)
 
         # -- Search History Area --
         history_layout = QHBoxLayout()
@@ -436,51 +782,80 @@ class MainWindow(QMainWindow):
         self.history_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.history_combo.setEditable(False)
         self.history_combo.activated.connect(self._use_search_history)
+        self._update_history_combo()
         history_layout.addWidget(self.history_combo, 1) # Give stretch        
+        history_layout.addSpacing(10)
+        self.group_series_checkbox = QCheckBox("Group by Series")
+        self.group_series_checkbox.setToolTip("Group results of the same series together.\nClick a series name to expand or collapse it.")
+        self.group_series_checkbox.stateChanged.connect(self._on_group_by_series_changed)
+        history_layout.addWidget(self.group_series_checkbox)
+        self.sort_locally_checkbox = QCheckBox("Sort Locally")
+        self.sort_locally_checkbox.setToolTip("Column header clicks reorder the loaded results instantly instead of running a new search.\nClick the sorted column again to switch between descending and ascending.")
+        self.sort_locally_checkbox.stateChanged.connect(self._on_sort_locally_changed)
+        history_layout.addWidget(self.sort_locally_checkbox)
         search_layout.addLayout(history_layout)
 
         # -- Loading Indicator --
-        self.loading_indicator_label = QLabel()
-        loading_icon = qta.icon('mdi.loading', animation=qta.Spin(self), color='grey') # Use mdi.loading
-        self.loading_indicator_label.setPixmap(loading_icon.pixmap(QSize(32, 32))) # Use pixmap
+        self.loading_indicator_label = QLabel() # Spinner pixmap set in _install_icons
         self.loading_indicator_label.setAlignment(Qt.AlignCenter)
         self.loading_indicator_label.hide() # Initially hidden
         search_layout.addWidget(self.loading_indicator_label)
 
+        # -- Stale Results Banner -- (shown while the rows are the last session's)
+        self.stale_results_label = QLabel()
+        self.stale_results_label.setObjectName("StaleResultsLabel")
+        self.stale_results_label.setStyleSheet("color: #d8b45a; font-style: italic;")
+        self.stale_results_label.hide()
+        search_layout.addWidget(self.stale_results_label)
+
         # -- Results Table --
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(9)
-        self.results_table.setHorizontalHeaderLabels(["Mark", "Cat", "Name", "Size", "Date", "S", "L", "Uploader", "Actions"])
-        self.mark_column_index = 0 # Store index for later use
-        self.results_table.horizontalHeader().setSectionResizeMode(self.mark_column_index, QHeaderView.ResizeToContents) # Mark column
-        self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch) # Stretch Name column (index shifted)
-        self.results_table.horizontalHeader().setSectionResizeMode(8, QHeaderView.ResizeToContents) # Actions column size fixed (index shifted)
-        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.results_table.setSelectionMode(QTableWidget.ExtendedSelection) # Enable multi-selection
+        # Model/view: rows are painted on demand, so thousands of results cost about as much as 75
+        self.results_model = ResultsTableModel(self.marked_torrents, self.get_category_icon, self)
+        self.results_proxy = ResultsFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
+        self.actions_delegate = ResultActionsDelegate(self.results_table)
+        self.actions_delegate.magnet_clicked.connect(self._on_magnet_button_clicked)
+        self.actions_delegate.details_clicked.connect(self._on_details_button_clicked)
+        self.results_table.setItemDelegateForColumn(ResultsTableModel.ACTIONS_COLUMN, self.actions_delegate)
+        self.mark_column_index = ResultsTableModel.MARK_COLUMN # Store index for later use
+        header = self.results_table.horizontalHeader()
+        # Fixed widths: ResizeToContents would measure rows on every model reset
+        header.setSectionResizeMode(self.mark_column_index, QHeaderView.Fixed) # Mark column
+        header.resizeSection(self.mark_column_index, 44)
+        header.setSectionResizeMode(ResultsTableModel.NAME_COLUMN, QHeaderView.Stretch) # Stretch Name column
+        header.setSectionResizeMode(ResultsTableModel.ACTIONS_COLUMN, QHeaderView.Fixed) # Actions column size fixed
+        header.resizeSection(ResultsTableModel.ACTIONS_COLUMN, self.actions_delegate.sizeHint(None, None).width())
+        self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results_table.setSelectionMode(QAbstractItemView.ExtendedSelection) # Enable multi-selection
         self.results_table.verticalHeader().setVisible(False)
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed) # Uniform rows, no per-row measuring
+        self.results_table.verticalHeader().setDefaultSectionSize(self.actions_delegate.sizeHint(None, None).height() + 2)
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setSortingEnabled(False) # Disable Qt's sorting
+        self.results_table.setWordWrap(False)
         # Enable custom context menu
         self.results_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.results_table.customContextMenuRequested.connect(self._show_table_context_menu)
         # Connect header click signal AFTER UI setup
-        self.results_table.horizontalHeader().sectionClicked.connect(self.handle_header_click)
-        self.results_table.horizontalHeader().setSectionsMovable(True)
-        self.results_table.horizontalHeader().setContextMenuPolicy(Qt.CustomContextMenu)
-        self.results_table.horizontalHeader().customContextMenuRequested.connect(self._show_header_context_menu)
+        header.sectionClicked.connect(self.handle_header_click)
+        header.setSectionsMovable(True)
+        header.setContextMenuPolicy(Qt.CustomContextMenu)
+        header.customContextMenuRequested.connect(self._show_header_context_menu)
+        self.results_table.clicked.connect(self._handle_series_cell_clicked)
         search_layout.addWidget(self.results_table)
 
         # -- Pagination Controls --
         pagination_layout = QHBoxLayout()
         search_layout.addLayout(pagination_layout)
-        self.prev_button = QPushButton(qta.icon('mdi.arrow-left'), "Previous")
+        self.prev_button = QPushButton("Previous")
         self.prev_button.clicked.connect(self.prev_page)
         self.prev_button.setEnabled(False)
         self.page_label = QLabel("Page 1")
         self.page_label.setAlignment(Qt.AlignCenter)
-        self.next_button = QPushButton("Next", icon=qta.icon('mdi.arrow-right'))
-        self.next_button.setIcon(qta.icon('mdi.arrow-right')) # Set icon properly
+        self.next_button = QPushButton("Next")
         self.next_button.setLayoutDirection(Qt.RightToLeft) # Move icon to right
         self.next_button.clicked.connect(self.next_page)
         self.next_button.setEnabled(False)
@@ -488,17 +863,73 @@ class MainWindow(QMainWindow):
         pagination_layout.addStretch()
         pagination_layout.addWidget(self.page_label)
         pagination_layout.addStretch()
+        self.infinite_scroll_checkbox = QCheckBox("Infinite Scroll")
+        self.infinite_scroll_checkbox.setToolTip(f"Load the next page automatically when scrolling near the bottom.\nOnly the latest {self.INFINITE_SCROLL_MAX_PAGES} pages are kept.")
+        self.infinite_scroll_checkbox.stateChanged.connect(self._on_infinite_scroll_changed)
+        pagination_layout.addWidget(self.infinite_scroll_checkbox)
         pagination_layout.addWidget(self.next_button)
+        self.results_table.verticalScrollBar().valueChanged.connect(self._on_results_scrolled)
 
-        # --- Download Folder Tab (Simplified) ---
+        # --- Downloads Tab ---
         downloads_tab = QWidget(objectName="DownloadsTabWidget")
         downloads_layout = QVBoxLayout(downloads_tab)
         downloads_layout.setContentsMargins(10, 10, 10, 10)
         downloads_layout.setSpacing(10)
-        self.tabs.addTab(downloads_tab, qta.icon('mdi.folder-open-outline', color='lightgoldenrodyellow'), "External Client Path")
+        self.downloads_tab = downloads_tab
+        self.tabs.addTab(downloads_tab, "Downloads")
+
+        # -- Transmission Controls --
+        download_actions_layout = QHBoxLayout()
+        self.transmission_status_label = QLabel("Transmission is not set up. Enable it in the Settings tab.")
+        self.transmission_status_label.setWordWrap(True)
+        download_actions_layout.addWidget(self.transmission_status_label, 1)
+        self.connect_button = QPushButton("Connect")
+        self.connect_button.setToolTip("Connect to Transmission with the address from the Settings tab.")
+        self.connect_button.clicked.connect(self._connect_transmission)
+        self.pause_button = QPushButton("Pause")
+        self.pause_button.clicked.connect(lambda: self._run_download_action("stop"))
+        self.resume_button = QPushButton("Resume")
+        self.resume_button.clicked.connect(lambda: self._run_download_action("start"))
+        self.remove_button = QPushButton("Remove")
+        self.remove_button.setToolTip("Remove the selected torrents from Transmission, keeping the downloaded files.")
+        self.remove_button.clicked.connect(lambda: self._run_download_action("remove"))
+        self.remove_data_button = QPushButton("Remove && Delete Data")
+        self.remove_data_button.setToolTip("Remove the selected torrents and delete their downloaded files.")
+        self.remove_data_button.clicked.connect(lambda: self._run_download_action("remove", delete_data=True))
+        for button in (self.connect_button, self.pause_button, self.resume_button, self.remove_button, self.remove_data_button):
+            download_actions_layout.addWidget(button)
+        downloads_layout.addLayout(download_actions_layout)
+
+        # -- Downloads Table -- (rows change in place from the client's deltas, see DownloadsTableModel)
+        self.downloads_model = DownloadsTableModel(self)
+        self.downloads_proxy = QSortFilterProxyModel(self)
+        self.downloads_proxy.setSourceModel(self.downloads_model)
+        self.downloads_proxy.setSortRole(DownloadsSortRole)
+        self.downloads_table = QTableView()
+        self.downloads_table.setModel(self.downloads_proxy)
+        self.downloads_table.setItemDelegateForColumn(DownloadsTableModel.PROGRESS_COLUMN, ProgressBarDelegate(self.downloads_table))
+        downloads_header = self.downloads_table.horizontalHeader()
+        downloads_header.setSectionResizeMode(DownloadsTableModel.NAME_COLUMN, QHeaderView.Stretch)
+        downloads_header.resizeSection(DownloadsTableModel.PROGRESS_COLUMN, 140)
+        self.downloads_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.downloads_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.downloads_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.downloads_table.verticalHeader().setVisible(False)
+        self.downloads_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.downloads_table.setAlternatingRowColors(True)
+        self.downloads_table.setWordWrap(False)
+        self.downloads_table.setSortingEnabled(True)
+        self.downloads_table.sortByColumn(-1, Qt.AscendingOrder) # Client order until a header is clicked
+        self.downloads_table.selectionModel().selectionChanged.connect(self._update_download_buttons)
+        downloads_layout.addWidget(self.downloads_table, 1)
+
+        self.download_refresh_timer = QTimer(self)
+        self.download_refresh_timer.timeout.connect(self._refresh_download_list)
+        self.tabs.currentChanged.connect(lambda _index: self._update_download_refresh_interval())
+        self._update_download_buttons()
 
         dl_controls_layout = QHBoxLayout()
-        select_dir_button = QPushButton(qta.icon('mdi.folder-outline'), "Set Reference Folder")
+        self.select_dir_button = select_dir_button = QPushButton("Set Reference Folder")
         select_dir_button.setToolTip("Select the folder your external torrent client typically saves to.\nThis is just a reference and doesn't affect downloads directly.")
         select_dir_button.clicked.connect(self.select_download_directory)
 
@@ -512,14 +943,12 @@ class MainWindow(QMainWindow):
         explanation_label = QLabel(
             "Set the default download location used by your external torrent client. \n"
             "This is primarily for reference (e.g., future features like checking for existing files). \n"
-            "This application does not download files itself."
+            "This application does not download files itself; the list above is what Transmission is downloading."
         )
         explanation_label.setWordWrap(True)
         explanation_label.setStyleSheet("font-size: 9pt; color: grey;") # Optional styling
         downloads_layout.addWidget(explanation_label)
 
-        downloads_layout.addStretch()
-
         # --- Settings Tab --- #
         settings_tab = QWidget(objectName="SettingsTabWidget")
         settings_tab_layout = QVBoxLayout(settings_tab) # Layout FOR the tab itself
@@ -542,7 +971,8 @@ class MainWindow(QMainWindow):
         settings_content_layout.setSpacing(10) # Spacing between group boxes
 
         # Add the actual tab widget
-        self.tabs.addTab(settings_tab, qta.icon('mdi.cog-outline', color='gray'), "Settings")
+        self.settings_tab = settings_tab
+        self.tabs.addTab(settings_tab, "Settings")
 
         # --- Add SettingsWidget to Scroll Area ---
         # Moved import to top
@@ -551,8 +981,11 @@ class MainWindow(QMainWindow):
         # --- Connect SettingsWidget signals to MainWindow slots ---
         self.settings_widget.settings_changed.connect(self._handle_settings_widget_change)
         self.settings_widget.proxy_config_changed.connect(self._handle_proxy_config_change)
+        self.settings_widget.transmission_config_changed.connect(self._handle_transmission_config_change)
         self.settings_widget.request_clear_history.connect(self._clear_search_history)
         self.settings_widget.request_select_download_dir.connect(self.select_download_directory)
+        self.settings_widget.request_export_marks.connect(self._export_marks)
+        self.settings_widget.request_import_marks.connect(self._import_marks)
         # Pass necessary data/connect signals after settings are loaded
 
         # --- Status Bar ---
@@ -574,9 +1007,8 @@ class MainWindow(QMainWindow):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            self.search_history = []
+            self.history_store.clear()
             self._update_history_combo() # Update dropdown UI
-            self.save_settings() # Persist the empty list
             self.show_status_message("Search history cleared.", 3000)
         else:
             self.show_status_message("Clear history cancelled.", 3000)
@@ -611,6 +1043,8 @@ class MainWindow(QMainWindow):
 
     # --- Search History Handling ---
     def _update_history_combo(self):
+        """Rebuilds the dropdown from the store (startup, clear, size change)."""
+        self.search_history = self.history_store.recent(self.max_history_items)
         self.history_combo.blockSignals(True)
         self.history_combo.clear()
         self.history_combo.addItems(self.search_history)
@@ -622,13 +1056,53 @@ class MainWindow(QMainWindow):
         term = term.strip()
         if not term: return # Check again after stripping
 
+        self.history_store.add(term)
+        # Move/insert just this entry instead of rebuilding the dropdown
+        self.history_combo.blockSignals(True)
         if term in self.search_history:
-            self.search_history.remove(term)
+            index = self.search_history.index(term)
+            self.search_history.pop(index)
+            self.history_combo.removeItem(index)
         self.search_history.insert(0, term)
-        self.search_history = self.search_history[:self.max_history_items]
-        self._update_history_combo()
-        # Defer saving settings until explicitly called or on exit for performance
-        # self.save_settings() # Optional: save immediately
+        self.history_combo.insertItem(0, term)
+        while len(self.search_history) > self.max_history_items:
+            self.search_history.pop()
+            self.history_combo.removeItem(self.history_combo.count() - 1)
+        self.history_combo.setCurrentIndex(-1)
+        self.history_combo.blockSignals(False)
+
+    def _update_history_completions(self, text: str, use_trigrams: bool = False):
+        """Refreshes the completion popup from the history index as the user types."""
+        suggestions = self.history_store.suggest(text, self.HISTORY_SUGGESTION_LIMIT, use_trigrams)
+        if use_trigrams or len(suggestions) >= self.HISTORY_SUGGESTION_LIMIT or len(text.strip()) < 3:
+            self._history_substring_timer.stop()
+        else:
+            self._history_substring_timer.start() # The list may be missing rarer substring matches
+        if text.strip() in suggestions[:1]:
+            suggestions = suggestions[1:] # Already typed out in full
+        self.history_completion_model.setStringList(suggestions)
+        if suggestions:
+            self.history_completer.complete()
+        else:
+            self.history_completer.popup().hide()
+
+    def _complete_history_substrings(self):
+        if self.search_input.hasFocus():
+            self._update_history_completions(self.search_input.text(), use_trigrams=True)
+
+    def _migrate_legacy_history(self):
+        """Imports 'search_history' from settings.json into an empty history store."""
+        if len(self.history_store) or not os.path.exists(self.get_settings_path()):
+            return
+        try:
+            with open(self.get_settings_path(), "r", encoding="utf-8") as f:
+                legacy_history = json.load(f).get("search_history", [])
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Warning: Could not read legacy search history: {e}")
+            return
+        if isinstance(legacy_history, list) and legacy_history:
+            self.history_store.import_terms(legacy_history)
+            print(f"Migrated {len(self.history_store)} search history entries to {self.history_store.path}.")
 
     def _use_search_history(self, index: int):
         if 0 <= index < len(self.search_history):
@@ -676,14 +1150,16 @@ class MainWindow(QMainWindow):
              self.current_sort_column = self.sort_key_to_column_map.get(self.current_sort_by, 3) # Default date
              self.current_sort_order = Qt.DescendingOrder # Nyaa default
              print(f"Sort changed via dropdown to: {self.current_sort_by} (Col: {self.current_sort_column}, Order: Desc)")
+             # The dropdown always asks Nyaa, so drop any local reordering
+             self._clear_local_sort()
              # Update header indicator
-             self.results_table.horizontalHeader().setSortIndicator(
-                 self.current_sort_column, self.current_sort_order
-             )
+             self._update_sort_indicator()
              # Trigger search only if sort actually changed
              self.start_search(reset_page=True)
              
-    def start_search(self, reset_page=False, from_history=False):
+    def start_search(self, reset_page=False, from_history=False, refresh_in_place=False):
+        """Searches Nyaa for the current query, category, sort and page.
+        refresh_in_place keeps the rows on screen until the new ones arrive (warm start refresh)."""
         print("DEBUG: start_search entered.") # DEBUG
         query = self.search_input.text().strip()
 
@@ -698,17 +1174,19 @@ class MainWindow(QMainWindow):
             self._add_to_search_history(query)
 
         self.current_search_query = query
-        self.show_status_message(f"Searching for '{query}' (Page {self.current_page})...")
-        self.results_table.setRowCount(0)
+        if refresh_in_place:
+            self.show_status_message(f"Refreshing results for '{query}' (Page {self.current_page})...")
+        else:
+            self.show_status_message(f"Searching for '{query}' (Page {self.current_page})...")
+            self._clear_stale_results()
+            self.current_results = []
+            self.results_model.set_results(self.current_results)
         self.prev_button.setEnabled(False)
         self.next_button.setEnabled(False)
         self.loading_indicator_label.show() # Show loading indicator
 
         # Ensure indicator reflects current sort state before search
-        self.results_table.horizontalHeader().setSortIndicator(
-            self.current_sort_column, self.current_sort_order
-        )
-        self.results_table.horizontalHeader().setSortIndicatorShown(True)
+        self._update_sort_indicator()
 
         # Abort previous search worker if running
         if self.scraper_worker and self.scraper_worker.isRunning():
@@ -716,15 +1194,12 @@ class MainWindow(QMainWindow):
             self.scraper_worker.terminate() # Forcefully stop
             self.scraper_worker.wait() # Wait for termination
             print("Previous search worker terminated.")
+        self._abort_page_fetch()
+        self._search_generation += 1
+        self._last_page_fetch_time = time.monotonic() # The first auto-fetch waits like any other
 
         # Prepare proxy config dictionary
-        proxy_config = {
-            'type': self.proxy_type,
-            'host': self.proxy_host,
-            'port': self.proxy_port,
-            'username': self.proxy_username,
-            'password': self.proxy_password
-        }
+        proxy_config = self._current_proxy_config()
 
         self.scraper_worker = ScraperWorker(
             self.current_search_query,
@@ -755,6 +1230,9 @@ class MainWindow(QMainWindow):
             self.status_bar.clearMessage()
         # Allow the results_ready or error_occurred signal to set the final status
         self.scraper_worker = None # Release reference
+        if self.results_model.is_stale(): # The refresh failed; the old rows stay, still marked
+            self.stale_results_label.setText(f"{self._stale_results_text()} Could not refresh; search again to retry.")
+            self._update_pagination_controls()
 
     def update_results_table(self, results: list[ScrapeResult]):
         print(f"DEBUG: update_results_table called with {len(results)} results.") # DEBUG
@@ -764,176 +1242,133 @@ class MainWindow(QMainWindow):
         #     print("Ignoring results from outdated search worker.")
         #     return
 
-        self.results_table.setRowCount(0)
         original_results_count = len(results)
+        refresh_in_place = self.results_model.is_stale() # Replacing the last session's rows
+        self._clear_stale_results()
 
         # --- Apply Client-Side Filters ---
-        filtered_results = []
-        # Check if any filter is active
-        filtering_active = self.min_seeders > 0 or self.min_size_bytes > 0 or self.max_size_bytes > 0
-
-        if filtering_active:
-            for result in results:
-                # Seeder Check
-                if self.min_seeders > 0 and result.seeders < self.min_seeders:
-                    continue
-                # Min Size Check
-                if self.min_size_bytes > 0 and result.size_bytes < self.min_size_bytes:
-                    continue
-                # Max Size Check (only if max_size_bytes is set > 0)
-                if self.max_size_bytes > 0 and result.size_bytes > self.max_size_bytes:
-                    continue
-
-                # If all checks pass, add to filtered list
-                filtered_results.append(result)
-        else:
-            filtered_results = results # No filters applied
+        filtered_results = self._apply_client_filters(results)
 
         # --- Store results for context menu access --- #
         self.current_results = filtered_results
+        self._series_index_stale = True # Rebuilt lazily, only while grouping is on
 
         # --- Use filtered_results from now on ---
         results_count = len(filtered_results)
         print(f"Displaying {results_count} results after filtering from {original_results_count} fetched.")
 
+        # A fresh search starts a new run of loaded pages
+        self._loaded_pages = deque([(self.current_page, results_count)])
+        self._last_page_reached = original_results_count < self.RESULTS_PER_PAGE
+
         if results_count == 0:
+            self.results_model.set_results(self.current_results)
             if self.current_page == 1:
                 self.show_status_message(f"No results found for '{self.current_search_query}'.", 5000)
             else:
                 self.show_status_message(f"No more results found.", 5000)
             # Update pagination based on current page even if no results
-            self.prev_button.setEnabled(self.current_page > 1)
-            self.next_button.setEnabled(False)
-            self.page_label.setText(f"Page {self.current_page}")
+            self._update_pagination_controls()
             return
 
-        self.results_table.setRowCount(results_count)
-
-        # Performance: Disable sorting and updates during population
-        self.results_table.setSortingEnabled(False)
-        self.setUpdatesEnabled(False)
-
-        for row, result in enumerate(filtered_results):
-            # Category Item
-            category_item = QTableWidgetItem()
-            category_item.setIcon(self.get_category_icon(result.category))
-            category_item.setToolTip(result.category)
-            self.results_table.setItem(row, 1, category_item)
-
-            # Name Item
-            name_item = QTableWidgetItem(result.name)
-            name_item.setToolTip(result.name)
-            self.results_table.setItem(row, 2, name_item)
-
-            # Other text items            
-            self.results_table.setItem(row, 3, QTableWidgetItem(result.size))
-            self.results_table.setItem(row, 4, QTableWidgetItem(result.date))
-
-            # Numeric items (aligned)
-            s_item = QTableWidgetItem(str(result.seeders))
-            s_item.setTextAlignment(Qt.AlignCenter)
-            self.results_table.setItem(row, 5, s_item)
-            l_item = QTableWidgetItem(str(result.leechers))
-            l_item.setTextAlignment(Qt.AlignCenter)
-            self.results_table.setItem(row, 6, l_item)
-
-            # Uploader Item            
-            uploader_item = QTableWidgetItem(result.uploader)
-            uploader_item.setToolTip(result.uploader)
-            self.results_table.setItem(row, 7, uploader_item)
-
-            # Actions Column
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(2, 2, 2, 2)
-            actions_layout.setSpacing(5)
-            actions_layout.setAlignment(Qt.AlignCenter) # Center buttons in the cell
-
-            # Magnet Button (Opens Link)            
-            magnet_button = QPushButton(qta.icon('mdi.magnet', color='red'), "")
-            magnet_button.setToolTip(f"Open Magnet Link")
-            if result.magnet_link:
-                 # Correct lambda capture:                 
-                 magnet_button.clicked.connect(lambda checked=False, magnet=result.magnet_link, name=result.name: self.add_download(magnet, name))
-            else:
-                magnet_button.setEnabled(False)
-                magnet_button.setToolTip("Magnet link not found")
-            actions_layout.addWidget(magnet_button)
-
-            # Details Button
-            details_button = QPushButton(qta.icon('mdi.information-outline', color='lightblue'), "")
-            details_button.setToolTip("View Torrent Details")
-            if result.link and result.link != '#':
-                # Correct lambda capture:                
-                details_button.clicked.connect(lambda checked=False, link=result.link: self.show_details(link))
-            else:
-                details_button.setEnabled(False)
-                details_button.setToolTip("Details link not found or invalid")
-            actions_layout.addWidget(details_button)
-
-            actions_widget.setLayout(actions_layout)
-            self.results_table.setCellWidget(row, 8, actions_widget)
-
-            # Store the link (identifier) for the handler
-            torrent_link = result.link
-
-            # Marked Checkbox Item
-            mark_item = QTableWidgetItem()
-            mark_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            # Store link in item data for retrieval in handler
-            mark_item.setData(Qt.UserRole, torrent_link)
-            is_marked = torrent_link in self.marked_torrents
-            mark_item.setCheckState(Qt.Checked if is_marked else Qt.Unchecked)
-            self.results_table.setItem(row, self.mark_column_index, mark_item)
-
-        # Re-enable updates and apply settings
-        self.setUpdatesEnabled(True)
-        self.results_table.resizeRowsToContents()
-        # Apply initial row styles after populating
-        for row in range(results_count):
-            # Retrieve the check state from the created item
-            mark_item = self.results_table.item(row, self.mark_column_index)
-            if mark_item:
-                is_marked = mark_item.checkState() == Qt.Checked
-                self._apply_row_style(row, is_marked)
+        self._populate_results_rows(in_place=refresh_in_place)
 
         # Only resize columns if needed (e.g., on first load or if content drastically changes)
         # self.results_table.resizeColumnsToContents() # Maybe only do this once initially
 
         # --- Update Sort Indicator ---
-        self.results_table.horizontalHeader().setSortIndicator(
-            self.current_sort_column, self.current_sort_order
-        )
-        self.results_table.horizontalHeader().setSortIndicatorShown(True)
+        self._update_sort_indicator()
         
         # Update pagination
-        self.prev_button.setEnabled(self.current_page > 1)
-        # Nyaa usually shows 75 results/page. Enable 'Next' if 75 results are shown.
-        # Base 'Next' button enabling on the *original* count before filtering
-        # This prevents disabling 'Next' just because filters removed items from this page.
-        self.next_button.setEnabled(original_results_count >= 75)
-        self.page_label.setText(f"Page {self.current_page}")
+        # Nyaa usually shows 75 results/page. 'Next' is based on the *original* count before
+        # filtering, so filters removing items from this page don't disable it.
+        self._update_pagination_controls()
         # Update status message to reflect filtered count
         self.show_status_message(f"Displaying {results_count} results (filtered from {original_results_count}) for page {self.current_page}.", 5000)
         print("DEBUG: update_results_table finished.") # DEBUG
+        if self.infinite_scroll:
+            QTimer.singleShot(0, self._check_infinite_scroll) # Filtered pages may not fill the view
 
+    def _apply_client_filters(self, results: list[ScrapeResult]) -> list[ScrapeResult]:
+        """Applies the seeder/size filters from the Filters dialog to a fetched page."""
+        # Check if any filter is active
+        if not (self.min_seeders > 0 or self.min_size_bytes > 0 or self.max_size_bytes > 0):
+            return results # No filters applied
+        filtered_results = []
+        for result in results:
+            # Seeder Check
+            if self.min_seeders > 0 and result.seeders < self.min_seeders:
+                continue
+            # Min Size Check
+            if self.min_size_bytes > 0 and result.size_bytes < self.min_size_bytes:
+                continue
+            # Max Size Check (only if max_size_bytes is set > 0)
+            if self.max_size_bytes > 0 and result.size_bytes > self.max_size_bytes:
+                continue
+            filtered_results.append(result)
+        return filtered_results
+
+    def _update_pagination_controls(self):
+        """Prev/Next and the page label for either paging mode."""
+        if self.infinite_scroll:
+            self.prev_button.setEnabled(False)
+            self.next_button.setEnabled(False)
+            if self._loaded_pages and self._loaded_pages[0][0] != self._loaded_pages[-1][0]:
+                label = f"Pages {self._loaded_pages[0][0]}-{self._loaded_pages[-1][0]}"
+            else:
+                label = f"Page {self.current_page}"
+            self.page_label.setText(f"{label} (end)" if self._last_page_reached else label)
+        else:
+            self.prev_button.setEnabled(self.current_page > 1)
+            self.next_button.setEnabled(bool(self._loaded_pages) and not self._last_page_reached)
+            self.page_label.setText(f"Page {self.current_page}")
+
+
+    def _populate_results_rows(self, in_place=False):
+        """Hands self.current_results to the model and re-applies grouping and live filters.
+        in_place updates the rows already shown instead of resetting the table."""
+        if in_place:
+            self.results_model.update_results(self.current_results)
+        else:
+            self.results_model.set_results(self.current_results)
+        self.results_proxy.set_series_grouping(self._ensure_series_index(), self.group_by_series, keep_expanded=in_place)
+        # Apply the live name filter
+        self._apply_row_visibility_filters()
+
+    def _on_magnet_button_clicked(self, proxy_index):
+        result = self.results_model.result_at(self.results_proxy.mapToSource(proxy_index).row())
+        if result:
+            self.add_download(result.magnet_link, result.name)
+
+    def _on_details_button_clicked(self, proxy_index):
+        result = self.results_model.result_at(self.results_proxy.mapToSource(proxy_index).row())
+        if result and result.link and result.link != '#':
+            self.show_details(result.link)
 
     def add_download(self, magnet_link, name):
-        """Attempts to open the magnet link in the default torrent client."""
+        """Sends the magnet link to Transmission if it's set up, else opens it in the default torrent client."""
         if not magnet_link:
             self.show_error_message("No magnet link available for this item.")
             return
+        if self.transmission_enabled:
+            item = HandoffItem.from_magnet(magnet_link, name)
+            if self.downloads_model.contains_hash(item.info_hash):
+                self.show_status_message(f"'{name[:50]}' is already in Transmission.", 5000)
+                return
+            self._send_to_client([item])
+            return
 
         print(f"Attempting to open magnet link for: {name}")
         # --- Restore original behaviour --- #
         self.show_status_message(f"Opening '{name[:50]}...' in default client...", 5000)
 
         try:
+            import webbrowser
             opened = webbrowser.open(magnet_link)
             if not opened:
                 self.show_status_message("Could not automatically open torrent client.", 8000)
                 try:
-                    pyperclip.copy(magnet_link)
+                    copy_to_clipboard(magnet_link)
                     QMessageBox.information(self, "Magnet Link Copied",
                                             "Could not automatically open your torrent client.\n"
                                             "The magnet link has been copied to your clipboard. Please paste it into your client manually.")
@@ -948,6 +1383,82 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error Opening Link",
                                   f"Could not open the magnet link in the default application.\nError: {e}\n\nLink: {magnet_link}")
 
+    # --- Sending to Transmission --- #
+    def _send_selected_to_client(self):
+        self._send_results_to_client([result for _, result in self._get_all_selected_row_data()])
+
+    def _send_marked_to_client(self):
+        """Sends the marked torrents among the loaded results (marks keep no magnet links)."""
+        self._send_results_to_client([result for row, result in enumerate(self.results_model.results())
+                                      if self.results_model.is_marked(row)])
+
+    def _send_results_to_client(self, results: list[ScrapeResult]):
+        with_magnets = [result for result in results if result.magnet_link]
+        if not with_magnets:
+            self.show_status_message("None of these torrents has a magnet link.", 5000)
+            return
+        # The Downloads list already knows most of the client's hashes; the hand-off re-checks the rest
+        items = [HandoffItem(result.magnet_link, result.name, result.info_hash) for result in with_magnets
+                 if not self.downloads_model.contains_hash(result.info_hash)]
+        if not items:
+            self.show_status_message("Transmission already has all of these torrents.", 5000)
+            return
+        self._send_to_client(items)
+
+    def _send_to_client(self, items: list[HandoffItem]):
+        """Hands torrents to Transmission on a worker; ones it already has are skipped."""
+        if not self.transmission_enabled:
+            self.show_status_message("Enable Transmission in the Settings tab to send torrents to it.", 8000)
+            return
+        if self.handoff_worker and self.handoff_worker.isRunning():
+            self.show_status_message("Still sending the previous torrents to Transmission...", 5000)
+            return
+        worker = ClientHandoffWorker(items, self.transmission_host, self.transmission_port,
+                                     self.transmission_username, self.transmission_password)
+        worker.progress.connect(self._on_handoff_progress)
+        worker.report_ready.connect(self._on_handoff_finished)
+        worker.error_occurred.connect(lambda message: self.show_error_message(f"Transmission Connect Failed: {message}"))
+        worker.finished.connect(self._close_handoff_progress)
+        self.handoff_worker = worker
+        if len(items) > 1:
+            from PySide6.QtWidgets import QProgressDialog
+            dialog = QProgressDialog(f"Sending {len(items)} torrents to Transmission...", "Cancel", 0, len(items), self)
+            dialog.setWindowTitle("Send to Transmission")
+            dialog.setWindowModality(Qt.WindowModal)
+            dialog.setMinimumDuration(500) # Quick hand-offs finish before it would show
+            dialog.setAutoClose(False)
+            dialog.canceled.connect(worker.cancel)
+            self.handoff_progress_dialog = dialog
+        else:
+            self.show_status_message(f"Sending '{items[0].name[:50]}' to Transmission...", 5000)
+        worker.start()
+
+    def _on_handoff_progress(self, done: int, total: int, name: str):
+        if self.handoff_progress_dialog:
+            self.handoff_progress_dialog.setLabelText(f"Sending torrents to Transmission ({done}/{total})...\n{name[:80]}")
+            self.handoff_progress_dialog.setValue(done)
+
+    def _close_handoff_progress(self):
+        if self.handoff_progress_dialog:
+            self.handoff_progress_dialog.close()
+            self.handoff_progress_dialog.deleteLater()
+            self.handoff_progress_dialog = None
+
+    def _on_handoff_finished(self, report):
+        self._close_handoff_progress()
+        parts = [f"{len(report.added)} added"]
+        if report.skipped:
+            parts.append(f"{len(report.skipped)} already in Transmission")
+        if report.failed:
+            parts.append(f"{len(report.failed)} failed")
+        self.show_status_message(f"Sent to Transmission: {', '.join(parts)}.", 8000)
+        if report.failed:
+            lines = [f"{item.name or item.link}: {error}" for item, error in report.failed[:10]]
+            if len(report.failed) > 10:
+                lines.append(f"...and {len(report.failed) - 10} more")
+            QMessageBox.warning(self, "Some Torrents Were Not Added", "\n".join(lines))
+        self._refresh_download_list() # Show the new torrents without waiting for the next tick
+
     def show_details(self, link: str):
         """Initiates fetching and showing torrent details in a dialog."""
         if self.detail_worker and self.detail_worker.isRunning():
@@ -972,7 +1483,8 @@ class MainWindow(QMainWindow):
             'password': self.proxy_password
         }
 
-        self.detail_worker = DetailScraperWorker(link, self.scraper_delay, self.network_timeout, proxy_config)
+        self.detail_worker = DetailScraperWorker(link, self.scraper_delay, self.network_timeout, proxy_config,
+                                                 self.detail_comment_limit, self.detail_description_limit)
         self.detail_worker.details_ready.connect(self.display_detail_dialog)
         self.detail_worker.error_occurred.connect(self.show_detail_error)
         self.detail_worker.finished.connect(self._on_detail_worker_finished) # Cleanup connection        
@@ -988,8 +1500,11 @@ class MainWindow(QMainWindow):
     def display_detail_dialog(self, details: TorrentDetails):
         self.show_status_message(f"Details loaded for: {details.title[:50]}...", 5000)
         try:
+            from ui.torrent_detail_dialog import TorrentDetailDialog
             # Pass self (main window) as parent            
-            dialog = TorrentDetailDialog(details, self)
+            dialog = TorrentDetailDialog(details, self, image_cache=self.image_cache)
+            dialog.full_description_requested.connect(lambda: self._fetch_detail_part(dialog, details.url))
+            dialog.more_comments_requested.connect(lambda start: self._fetch_detail_part(dialog, details.url, start))
             dialog.exec()
         except Exception as e:
             import traceback
@@ -997,6 +1512,17 @@ class MainWindow(QMainWindow):
             traceback.print_exc()
             self.show_error_message(f"Failed to display details dialog: {e}")
 
+    def _fetch_detail_part(self, dialog, url: str, comments_start=None):
+        """Fetches the full description (comments_start None) or the next comments for an open details dialog."""
+        worker = DetailPartWorker(url, self.scraper_delay, self.network_timeout, self._current_proxy_config(),
+                                  comments_start, self.detail_comment_limit)
+        worker.description_ready.connect(dialog.set_full_description)
+        worker.comments_ready.connect(dialog.add_comments)
+        worker.error_occurred.connect(dialog.show_part_error)
+        worker.finished.connect(lambda: self._detail_part_workers.discard(worker))
+        self._detail_part_workers.add(worker) # Keep the thread object alive until it finishes
+        worker.start()
+
     def show_detail_error(self, message: str):
          self.show_error_message(f"Detail Error: {message}")
 
@@ -1010,8 +1536,160 @@ class MainWindow(QMainWindow):
         self.current_page += 1
         self.start_search() # Don't reset page here
 
+    # --- Infinite Scroll ---
+    def _on_infinite_scroll_changed(self, state):
+        is_checked = (state == Qt.Checked.value) or (state == Qt.Checked)
+        if is_checked == self.infinite_scroll:
+            return
+        self.infinite_scroll = is_checked
+        print(f"Infinite scroll changed to: {is_checked}")
+        if not is_checked:
+            self._page_fetch_timer.stop()
+        self._update_pagination_controls()
+        self.save_settings()
+        if is_checked:
+            self._check_infinite_scroll()
+
+    def _on_results_scrolled(self, value):
+        if self.infinite_scroll:
+            self._check_infinite_scroll()
+
+    def _check_infinite_scroll(self):
+        """Fetches the next page if the viewport is near the bottom (rate-limited)."""
+        if not self.infinite_scroll or self._last_page_reached or not self._loaded_pages or self.results_model.is_stale():
+            return
+        if self.page_fetch_worker is not None or (self.scraper_worker and self.scraper_worker.isRunning()):
+            return # One fetch at a time (cleared once its results have been handled)
+
+        last_visible_row = self.results_table.rowAt(self.results_table.viewport().height() - 1)
+        if last_visible_row != -1: # -1: the rows don't fill the viewport yet
+            rows_below = self.results_proxy.rowCount() - 1 - last_visible_row
+            if rows_below > self.INFINITE_SCROLL_THRESHOLD_ROWS:
+                return
+
+        elapsed_ms = (time.monotonic() - self._last_page_fetch_time) * 1000
+        if elapsed_ms < self.INFINITE_SCROLL_MIN_INTERVAL_MS:
+            if not self._page_fetch_timer.isActive():
+                self._page_fetch_timer.start(int(self.INFINITE_SCROLL_MIN_INTERVAL_MS - elapsed_ms) + 1)
+            return
+        self._fetch_next_page()
+
+    def _fetch_next_page(self):
+        next_page = self._loaded_pages[-1][0] + 1
+        self._last_page_fetch_time = time.monotonic()
+        generation = self._search_generation
+        self.show_status_message(f"Loading page {next_page}...")
+        self.loading_indicator_label.show()
+
+        self.page_fetch_worker = ScraperWorker(
+            self.current_search_query,
+            self.current_category,
+            self.current_sort_by,
+            next_page,
+            self.scraper_delay,
+            self.network_timeout,
+            self._current_proxy_config(),
+            self.filter_trusted_only,
+            self.filter_uploader
+        )
+        self.page_fetch_worker.results_ready.connect(
+            lambda results, page=next_page, generation=generation: self._append_results_page(page, results, generation)
+        )
+        self.page_fetch_worker.error_occurred.connect(self._on_page_fetch_error)
+        self.page_fetch_worker.finished.connect(self._on_page_fetch_worker_finished)
+        self.page_fetch_worker.start()
+
+    def _append_results_page(self, page, results: list[ScrapeResult], generation):
+        """Appends a fetched page below the loaded rows, then evicts old pages past the cap."""
+        if generation != self._search_generation or not self.infinite_scroll:
+            print(f"Ignoring page {page} fetched for an outdated search.")
+            return
+        original_results_count = len(results)
+        if original_results_count < self.RESULTS_PER_PAGE:
+            self._last_page_reached = True
+        filtered_results = self._apply_client_filters(results)
+        new_results = self.results_model.unseen_results(filtered_results) # Rows that moved down from the previous page
+        if len(new_results) < len(filtered_results):
+            print(f"Page {page}: skipped {len(filtered_results) - len(new_results)} results already loaded.")
+
+        if new_results:
+            if self.group_by_series and not self._series_index_stale:
+                self.series_index.extend(result.name for result in new_results)
+            self.results_model.append_results(new_results) # Extends self.current_results in place
+            if not self.group_by_series:
+                self._series_index_stale = True
+            else:
+                self.results_proxy.set_series_grouping(self._ensure_series_index(), True, keep_expanded=True)
+        self.current_page = page
+        self._loaded_pages.append((page, len(new_results)))
+        self._evict_old_pages()
+        self._update_pagination_controls()
+
+        if self._last_page_reached:
+            self.show_status_message(f"Reached the last page ({page}). {len(self.current_results)} results loaded.", 5000)
+        else:
+            self.show_status_message(f"Loaded page {page}: +{len(new_results)} results ({len(self.current_results)} loaded).", 5000)
+        QTimer.singleShot(0, self._check_infinite_scroll) # Keep going if the view still isn't full
+
+    def _evict_old_pages(self):
+        """Drops the oldest pages once more than INFINITE_SCROLL_MAX_PAGES are loaded."""
+        evicted_rows = 0
+        evicted_pages = []
+        while len(self._loaded_pages) > self.INFINITE_SCROLL_MAX_PAGES:
+            page, row_count = self._loaded_pages.popleft()
+            evicted_rows += row_count
+            evicted_pages.append(page)
+        if not evicted_pages:
+            return
+
+        # Keep the row at the top of the viewport in place while rows above it disappear
+        top_proxy_index = self.results_table.indexAt(self.results_table.viewport().rect().topLeft())
+        anchor_row = self.results_proxy.mapToSource(top_proxy_index).row() if top_proxy_index.isValid() else -1
+
+        self.results_model.remove_leading_rows(evicted_rows)
+        self._series_index_stale = True # Row positions shifted
+        if self.group_by_series:
+            self.results_proxy.set_series_grouping(self._ensure_series_index(), True, keep_expanded=True)
+
+        if anchor_row - evicted_rows >= 0:
+            anchor_index = self.results_proxy.mapFromSource(self.results_model.index(anchor_row - evicted_rows, 0))
+            if anchor_index.isValid():
+                self.results_table.scrollTo(anchor_index, QAbstractItemView.PositionAtTop)
+        print(f"Infinite scroll evicted page(s) {evicted_pages} ({evicted_rows} rows).")
+
+    def _on_page_fetch_error(self, message):
+        # Stop auto-fetching until the user scrolls again; the rate limit still applies
+        self.show_status_message(f"Could not load the next page: {message}", 8000)
+        print(f"Infinite scroll fetch failed: {message}")
+
+    def _on_page_fetch_worker_finished(self):
+        if not (self.scraper_worker and self.scraper_worker.isRunning()):
+            self.loading_indicator_label.hide()
+        self.page_fetch_worker = None
+
+    def _abort_page_fetch(self):
+        self._page_fetch_timer.stop()
+        if self.page_fetch_worker and self.page_fetch_worker.isRunning():
+            print("Terminating background page fetch...")
+            self.page_fetch_worker.terminate()
+            self.page_fetch_worker.wait()
+        self.page_fetch_worker = None
+
+    def _current_proxy_config(self) -> dict:
+        return {
+            'type': self.proxy_type,
+            'host': self.proxy_host,
+            'port': self.proxy_port,
+            'username': self.proxy_username,
+            'password': self.proxy_password
+        }
+
     # --- Sort Handling ---
     def handle_header_click(self, logicalIndex):
+        if self.sort_locally:
+            self._sort_loaded_results(logicalIndex)
+            return
+
         new_sort_key = self.column_to_sort_key_map.get(logicalIndex)
         if not new_sort_key:
              # Allow clicking to remove sort indicator if clicked column is not sortable
@@ -1049,6 +1727,54 @@ class MainWindow(QMainWindow):
         # Trigger search with new sort parameters
         self.start_search(reset_page=True)
 
+    def _sort_loaded_results(self, logicalIndex):
+        """Reorders the loaded rows in place (no new query). Re-clicking flips the order."""
+        if logicalIndex not in ResultsTableModel.SORTABLE_COLUMNS:
+            print(f"Column {logicalIndex} is not sortable.")
+            self._update_sort_indicator()
+            return
+
+        if self.local_sort_column == logicalIndex:
+            new_order = Qt.AscendingOrder if self.local_sort_order == Qt.DescendingOrder else Qt.DescendingOrder
+        elif logicalIndex in (ResultsTableModel.NAME_COLUMN, ResultsTableModel.UPLOADER_COLUMN):
+            new_order = Qt.AscendingOrder # Text columns read naturally A-Z first
+        else:
+            new_order = Qt.DescendingOrder # Biggest / newest first, like Nyaa
+
+        self.local_sort_column = logicalIndex
+        self.local_sort_order = new_order
+        self.results_proxy.set_local_sort(self.local_sort_column, self.local_sort_order)
+        self._update_sort_indicator()
+        order_name = "Asc" if new_order == Qt.AscendingOrder else "Desc"
+        print(f"Local sort changed via header click to: Col {logicalIndex}, Order: {order_name}")
+
+    def _clear_local_sort(self):
+        """Returns the table to the order Nyaa sent."""
+        self.local_sort_column = -1
+        self.local_sort_order = Qt.DescendingOrder
+        self.results_proxy.set_local_sort(-1)
+
+    def _update_sort_indicator(self):
+        """Shows the local sort if one is active, otherwise the server sort."""
+        header = self.results_table.horizontalHeader()
+        if self.sort_locally and self.local_sort_column >= 0:
+            header.setSortIndicator(self.local_sort_column, self.local_sort_order)
+        else:
+            header.setSortIndicator(self.current_sort_column, self.current_sort_order)
+        header.setSortIndicatorShown(True)
+
+    def _on_sort_locally_changed(self, state):
+        """Switches header clicks between local reordering and server re-queries."""
+        is_checked = (state == Qt.Checked.value) or (state == Qt.Checked)
+        if is_checked == self.sort_locally:
+            return
+        self.sort_locally = is_checked
+        print(f"Sort locally changed to: {is_checked}")
+        if not is_checked:
+            self._clear_local_sort() # Rows go back to the server's order; no re-query
+        self._update_sort_indicator()
+        self.save_settings()
+
     # --- Settings and Utils ---
     def select_download_directory(self):
         """Selects a directory for reference."""
@@ -1105,7 +1831,6 @@ class MainWindow(QMainWindow):
         settings_data = {
             "version": 1, # Add a version number for future migrations
             "default_download_path": self.saved_download_path,
-            "search_history": self.search_history,
             "scraper_delay": self.scraper_delay,
             "max_history_items": self.max_history_items,
             "network_timeout": self.network_timeout,
@@ -1115,9 +1840,18 @@ class MainWindow(QMainWindow):
             "proxy_port": self.proxy_port,
             "proxy_username": self.proxy_username,
             "proxy_password": self.proxy_password, # WARNING: Stored in plain text
-            "marked_torrents": list(self.marked_torrents), # Add marked torrents (convert set to list)
+            # Transmission RPC
+            "transmission_enabled": self.transmission_enabled,
+            "transmission_host": self.transmission_host,
+            "transmission_port": self.transmission_port,
+            "transmission_username": self.transmission_username,
+            "transmission_password": self.transmission_password, # WARNING: Stored in plain text
             "filter_trusted_only": self.filter_trusted_only, # Save trusted filter state
             "filter_uploader": self.filter_uploader, # Save uploader filter state
+            "sort_locally": self.sort_locally, # Header clicks sort loaded rows instead of re-querying
+            "infinite_scroll": self.infinite_scroll, # Append pages while scrolling instead of Prev/Next
+            "detail_comment_limit": self.detail_comment_limit,
+            "detail_description_limit": self.detail_description_limit,
             # "current_results": self.current_results, # Don't save results to settings
         }
 
@@ -1129,6 +1863,8 @@ class MainWindow(QMainWindow):
                 "scraper_delay", "network_timeout", "max_history_items",
                 "proxy_type",
                 "proxy_host", "proxy_port", "proxy_username", "proxy_password",
+                "transmission_enabled", "transmission_host", "transmission_port",
+                "transmission_username", "transmission_password",
                 "default_download_path" # Widget keeps track of this now
             ]
             for key in keys_to_update:
@@ -1142,21 +1878,14 @@ class MainWindow(QMainWindow):
             try:
                 header_state = self.results_table.horizontalHeader().saveState().toBase64().data().decode('ascii')
                 settings_data["table_header_state"] = header_state
+                settings_data["table_header_columns"] = self.results_model.columnCount()
             except Exception as e:
                  print(f"Warning: Could not save table header state: {e}")
         else:
              print("Warning: results_table not found during save_settings.")
 
-        path = self.get_settings_path()
-        try:
-            # Save the rest of the settings to JSON
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(settings_data, f, indent=4)
-            print(f"Settings saved to {path}")
-        except IOError as e:
-            self.show_error_message(f"Could not save settings to {path}: {e}")
-        except Exception as e:
-            self.show_error_message(f"Unexpected error saving settings: {e}")
+        # Coalesced with other saves and written off the UI thread; unchanged settings aren't rewritten
+        self.settings_store.submit(settings_data)
 
 
     def load_settings(self):
@@ -1166,7 +1895,6 @@ class MainWindow(QMainWindow):
 
         # Establish defaults
         default_path = os.path.expanduser("~")
-        default_history = []
         default_delay = self.DEFAULT_SCRAPER_DELAY
         default_max_history = 25
         default_timeout = 30
@@ -1176,14 +1904,21 @@ class MainWindow(QMainWindow):
         default_proxy_port = ""
         default_proxy_user = ""
         default_proxy_pass = ""
-        # Marked Torrents Default
-        default_marked_torrents = set()
+        # Transmission Defaults
+        default_transmission_enabled = False
+        default_transmission_host = "localhost"
+        default_transmission_port = 9091
+        default_transmission_user = ""
+        default_transmission_pass = ""
         default_trusted_only = False
         default_uploader = ""
+        default_sort_locally = False
+        default_infinite_scroll = False
+        default_comment_limit = DETAIL_COMMENT_LIMIT
+        default_description_limit = DETAIL_DESCRIPTION_LIMIT
 
         # Initialize loaded vars to defaults
         loaded_path = default_path
-        loaded_history = default_history
         loaded_delay = default_delay
         loaded_max_history = default_max_history
         loaded_network_timeout = default_timeout
@@ -1192,16 +1927,23 @@ class MainWindow(QMainWindow):
         loaded_proxy_port = default_proxy_port
         loaded_proxy_user = default_proxy_user
         loaded_proxy_pass = default_proxy_pass
-        loaded_marked_torrents = default_marked_torrents
+        loaded_transmission_enabled = default_transmission_enabled
+        loaded_transmission_host = default_transmission_host
+        loaded_transmission_port = default_transmission_port
+        loaded_transmission_user = default_transmission_user
+        loaded_transmission_pass = default_transmission_pass
         loaded_trusted_only = default_trusted_only
         loaded_uploader = default_uploader
+        loaded_sort_locally = default_sort_locally
+        loaded_infinite_scroll = default_infinite_scroll
+        loaded_comment_limit = default_comment_limit
+        loaded_description_limit = default_description_limit
         loaded_header_state = None # Default for header state
 
         if not os.path.exists(path):
             print(f"Settings file not found at {path}. Using defaults.")
             # Apply defaults directly
             self.saved_download_path = default_path
-            self.search_history = default_history
             self.scraper_delay = default_delay
             self.max_history_items = default_max_history
             self.network_timeout = default_timeout
@@ -1210,9 +1952,17 @@ class MainWindow(QMainWindow):
             self.proxy_port = default_proxy_port
             self.proxy_username = default_proxy_user
             self.proxy_password = default_proxy_pass
-            self.marked_torrents = default_marked_torrents
+            self.transmission_enabled = default_transmission_enabled
+            self.transmission_host = default_transmission_host
+            self.transmission_port = default_transmission_port
+            self.transmission_username = default_transmission_user
+            self.transmission_password = default_transmission_pass
             self.filter_trusted_only = default_trusted_only
             self.filter_uploader = default_uploader
+            self.sort_locally = default_sort_locally
+            self.infinite_scroll = default_infinite_scroll
+            self.detail_comment_limit = default_comment_limit
+            self.detail_description_limit = default_description_limit
             # No header state to restore
 
             # Apply to UI (call the update UI part)
@@ -1251,15 +2001,6 @@ class MainWindow(QMainWindow):
                 print(f"Warning: Invalid max_history_items value '{temp_max_hist}' in settings. Using default.")
                 loaded_max_history = default_max_history
 
-            # Load history safely and apply limit
-            temp_history = settings_data.get("search_history", default_history)
-            if isinstance(temp_history, list):
-                loaded_history = [str(item) for item in temp_history if isinstance(item, str)]
-                loaded_history = loaded_history[:loaded_max_history] # Apply limit
-            else:
-                print("Warning: Invalid search_history format in settings file. Using default.")
-                loaded_history = default_history
-
             # Load Proxy settings
             loaded_proxy_type = settings_data.get("proxy_type", default_proxy_type)
             if loaded_proxy_type not in ["none", "http", "socks5"]: loaded_proxy_type = default_proxy_type
@@ -1276,13 +2017,25 @@ class MainWindow(QMainWindow):
             loaded_proxy_pass = settings_data.get("proxy_password", default_proxy_pass)
             if not isinstance(loaded_proxy_pass, str): loaded_proxy_pass = default_proxy_pass
 
-            # Load marked torrents safely
-            temp_marked = settings_data.get("marked_torrents", [])
-            if isinstance(temp_marked, list):
-                loaded_marked_torrents = {str(item) for item in temp_marked if isinstance(item, str)}
+            # Load Transmission settings
+            loaded_transmission_enabled = settings_data.get("transmission_enabled", default_transmission_enabled)
+            if not isinstance(loaded_transmission_enabled, bool): loaded_transmission_enabled = default_transmission_enabled
+
+            loaded_transmission_host = settings_data.get("transmission_host", default_transmission_host)
+            if not isinstance(loaded_transmission_host, str): loaded_transmission_host = default_transmission_host
+
+            temp_transmission_port = settings_data.get("transmission_port", default_transmission_port)
+            if isinstance(temp_transmission_port, int) and not isinstance(temp_transmission_port, bool) and 1 <= temp_transmission_port <= 65535:
+                loaded_transmission_port = temp_transmission_port
             else:
-                print("Warning: Invalid marked_torrents format in settings. Using default.")
-                loaded_marked_torrents = default_marked_torrents
+                print(f"Warning: Invalid transmission_port value '{temp_transmission_port}' in settings. Using default.")
+                loaded_transmission_port = default_transmission_port
+
+            loaded_transmission_user = settings_data.get("transmission_username", default_transmission_user)
+            if not isinstance(loaded_transmission_user, str): loaded_transmission_user = default_transmission_user
+
+            loaded_transmission_pass = settings_data.get("transmission_password", default_transmission_pass)
+            if not isinstance(loaded_transmission_pass, str): loaded_transmission_pass = default_transmission_pass
 
             # Load trusted filter state
             loaded_trusted_only = settings_data.get("filter_trusted_only", default_trusted_only)
@@ -1296,8 +2049,40 @@ class MainWindow(QMainWindow):
                 print(f"Warning: Invalid filter_uploader value '{loaded_uploader}' in settings. Using default.")
                 loaded_uploader = default_uploader
 
+            # Load local sort toggle
+            loaded_sort_locally = settings_data.get("sort_locally", default_sort_locally)
+            if not isinstance(loaded_sort_locally, bool):
+                print(f"Warning: Invalid sort_locally value '{loaded_sort_locally}' in settings. Using default.")
+                loaded_sort_locally = default_sort_locally
+
+            # Load infinite scroll toggle
+            loaded_infinite_scroll = settings_data.get("infinite_scroll", default_infinite_scroll)
+            if not isinstance(loaded_infinite_scroll, bool):
+                print(f"Warning: Invalid infinite_scroll value '{loaded_infinite_scroll}' in settings. Using default.")
+                loaded_infinite_scroll = default_infinite_scroll
+
+            # Load how much of a details page is parsed up front
+            temp_comment_limit = settings_data.get("detail_comment_limit", default_comment_limit)
+            if isinstance(temp_comment_limit, int) and not isinstance(temp_comment_limit, bool) and 10 <= temp_comment_limit <= 1000:
+                loaded_comment_limit = temp_comment_limit
+            else:
+                print(f"Warning: Invalid detail_comment_limit value '{temp_comment_limit}' in settings. Using default.")
+                loaded_comment_limit = default_comment_limit
+
+            temp_description_limit = settings_data.get("detail_description_limit", default_description_limit)
+            if isinstance(temp_description_limit, int) and not isinstance(temp_description_limit, bool) and 4096 <= temp_description_limit <= 4 * 1024 * 1024:
+                loaded_description_limit = temp_description_limit
+            else:
+                print(f"Warning: Invalid detail_description_limit value '{temp_description_limit}' in settings. Using default.")
+                loaded_description_limit = default_description_limit
+
             # --- Load Header State --- #
             header_state_base64 = settings_data.get("table_header_state")
+            # A state saved with a different column set would put widths/modes on the wrong columns
+            if settings_data.get("table_header_columns") != self.results_model.columnCount():
+                if header_state_base64 is not None:
+                    print("Table columns changed since the header state was saved. Using default layout.")
+                header_state_base64 = None
             if isinstance(header_state_base64, str):
                 try:
                     # Decode from base64 before restoring
@@ -1314,7 +2099,6 @@ class MainWindow(QMainWindow):
             print(f"ERROR parsing settings file ({path}): {e}. Using defaults.")
             # Set all loaded vars to defaults here...
             loaded_path = default_path
-            loaded_history = default_history
             loaded_delay = default_delay
             loaded_max_history = default_max_history
             loaded_network_timeout = default_timeout
@@ -1323,16 +2107,23 @@ class MainWindow(QMainWindow):
             loaded_proxy_port = default_proxy_port
             loaded_proxy_user = default_proxy_user
             loaded_proxy_pass = default_proxy_pass
-            loaded_marked_torrents = default_marked_torrents
+            loaded_transmission_enabled = default_transmission_enabled
+            loaded_transmission_host = default_transmission_host
+            loaded_transmission_port = default_transmission_port
+            loaded_transmission_user = default_transmission_user
+            loaded_transmission_pass = default_transmission_pass
             loaded_trusted_only = default_trusted_only
             loaded_uploader = default_uploader
+            loaded_sort_locally = default_sort_locally
+            loaded_infinite_scroll = default_infinite_scroll
+            loaded_comment_limit = default_comment_limit
+            loaded_description_limit = default_description_limit
             loaded_header_state = None
 
         except Exception as e:
             print(f"ERROR loading settings ({path}): {type(e).__name__} - {e}. Using defaults.")
             # Set all loaded vars to defaults here...
             loaded_path = default_path
-            loaded_history = default_history
             loaded_delay = default_delay
             loaded_max_history = default_max_history
             loaded_network_timeout = default_timeout
@@ -1341,15 +2132,22 @@ class MainWindow(QMainWindow):
             loaded_proxy_port = default_proxy_port
             loaded_proxy_user = default_proxy_user
             loaded_proxy_pass = default_proxy_pass
-            loaded_marked_torrents = default_marked_torrents
+            loaded_transmission_enabled = default_transmission_enabled
+            loaded_transmission_host = default_transmission_host
+            loaded_transmission_port = default_transmission_port
+            loaded_transmission_user = default_transmission_user
+            loaded_transmission_pass = default_transmission_pass
             loaded_trusted_only = default_trusted_only
             loaded_uploader = default_uploader
+            loaded_sort_locally = default_sort_locally
+            loaded_infinite_scroll = default_infinite_scroll
+            loaded_comment_limit = default_comment_limit
+            loaded_description_limit = default_description_limit
             loaded_header_state = None
 
         # Apply loaded (or default) settings to state variables
         self.saved_download_path = loaded_path
         self.max_history_items = loaded_max_history # Apply before trimming history
-        self.search_history = loaded_history # Already trimmed during load
         self.scraper_delay = loaded_delay
         self.network_timeout = loaded_network_timeout
         self.proxy_type = loaded_proxy_type
@@ -1357,9 +2155,17 @@ class MainWindow(QMainWindow):
         self.proxy_port = loaded_proxy_port
         self.proxy_username = loaded_proxy_user
         self.proxy_password = loaded_proxy_pass
-        self.marked_torrents = loaded_marked_torrents
+        self.transmission_enabled = loaded_transmission_enabled
+        self.transmission_host = loaded_transmission_host
+        self.transmission_port = loaded_transmission_port
+        self.transmission_username = loaded_transmission_user
+        self.transmission_password = loaded_transmission_pass
         self.filter_trusted_only = loaded_trusted_only
         self.filter_uploader = loaded_uploader
+        self.sort_locally = loaded_sort_locally
+        self.infinite_scroll = loaded_infinite_scroll
+        self.detail_comment_limit = loaded_comment_limit
+        self.detail_description_limit = loaded_description_limit
 
         # Update UI elements *after* internal state is set
         self._update_settings_ui()
@@ -1393,6 +2199,15 @@ class MainWindow(QMainWindow):
          self.trusted_checkbox.blockSignals(True)
          self.trusted_checkbox.setChecked(self.filter_trusted_only)
          self.trusted_checkbox.blockSignals(False)
+         self.sort_locally_checkbox.blockSignals(True)
+         self.sort_locally_checkbox.setChecked(self.sort_locally)
+         self.sort_locally_checkbox.blockSignals(False)
+         if not self.sort_locally:
+             self._clear_local_sort()
+         self.infinite_scroll_checkbox.blockSignals(True)
+         self.infinite_scroll_checkbox.setChecked(self.infinite_scroll)
+         self.infinite_scroll_checkbox.blockSignals(False)
+         self._update_pagination_controls()
 
     def closeEvent(self, event):
         """Saves settings and cleans up on exit."""
@@ -1406,15 +2221,151 @@ class MainWindow(QMainWindow):
             print("Terminating active detail worker...")
             self.detail_worker.terminate()
             self.detail_worker.wait(1000)
-
+        if self.page_fetch_worker and self.page_fetch_worker.isRunning():
+            print("Terminating background page fetch...")
+            self.page_fetch_worker.terminate()
+            self.page_fetch_worker.wait(1000)
+        self._stop_transmission_worker(wait_ms=1000)
+        if self.handoff_worker and self.handoff_worker.isRunning():
+            print("Cancelling torrent hand-off...")
+            self.handoff_worker.cancel()
+            if not self.handoff_worker.wait(3000):
+                self.handoff_worker.terminate()
+                self.handoff_worker.wait(1000)
+        for worker in list(self._retired_transmission_workers):
+            if not worker.wait(1000):
+                worker.terminate()
+                worker.wait(1000)
+
+        self._save_results_snapshot()
         self.save_settings()
+        self.settings_store.close() # Writes the final settings before exiting
+        self.marked_torrents.close() # Writes any queued mark changes
+        self.history_store.close()
         print("Settings saved. Goodbye!")
         event.accept()
 
     # Method to be called by the timer
+    @property
+    def image_cache(self):
+        """The shared ImagePreviewCache, created (with its QtNetwork manager) on first use."""
+        if self._image_cache is None:
+            from .image_cache import ImagePreviewCache
+            self._image_cache = ImagePreviewCache(os.path.join(os.path.dirname(self.get_settings_path()), self.IMAGE_CACHE_DIR_NAME), self)
+        return self._image_cache
+
+    def event(self, event):
+        # The first paint is when the window is on screen; everything it didn't need runs right after
+        if not self._startup_finished and event.type() == QEvent.Paint:
+            self._startup_finished = True
+            QTimer.singleShot(0, self._finish_startup)
+        return super().event(event)
+
+    def _finish_startup(self):
+        """Installs the icon fonts and starts the initial search and Transmission connection once the first frame is up."""
+        self._install_icons()
+        print("DEBUG: Triggering initial search after the first frame.")
+        self._trigger_initial_search()
+        self._attempt_initial_transmission_connect()
+
+    def _install_icons(self):
+        """Sets the qtawesome icons left out of init_ui, so loading the icon fonts doesn't delay the first frame."""
+        import qtawesome as qta
+        self.tabs.setTabIcon(self.tabs.indexOf(self.search_tab), qta.icon('mdi.magnify', color='lightblue'))
+        self.tabs.setTabIcon(self.tabs.indexOf(self.downloads_tab), qta.icon('mdi.download-outline', color='lightgoldenrodyellow'))
+        self.tabs.setTabIcon(self.tabs.indexOf(self.settings_tab), qta.icon('mdi.cog-outline', color='gray'))
+        self.filters_button.setIcon(qta.icon('mdi.filter-variant'))
+        self.search_button.setIcon(qta.icon('mdi.magnify', color='white'))
+        self.prev_button.setIcon(qta.icon('mdi.arrow-left'))
+        self.next_button.setIcon(qta.icon('mdi.arrow-right'))
+        self.select_dir_button.setIcon(qta.icon('mdi.folder-outline'))
+        self.connect_button.setIcon(qta.icon('mdi.lan-connect'))
+        self.pause_button.setIcon(qta.icon('mdi.pause'))
+        self.resume_button.setIcon(qta.icon('mdi.play', color='lightgreen'))
+        self.remove_button.setIcon(qta.icon('mdi.close'))
+        self.remove_data_button.setIcon(qta.icon('mdi.trash-can-outline', color='tomato'))
+        loading_icon = qta.icon('mdi.loading', animation=qta.Spin(self), color='grey') # Use mdi.loading
+        self.loading_indicator_label.setPixmap(loading_icon.pixmap(QSize(32, 32))) # Use pixmap
+        self.settings_widget.install_icons()
+        self.category_icons.warm(self.category_icon_map, self.devicePixelRatioF())
+        self.results_model.clear_icon_cache() # Rows painted before the warm-up fetch their icons again
+
     def _trigger_initial_search(self):
         print("DEBUG: _trigger_initial_search called by timer.")
-        self.start_search(reset_page=True)
+        if self.results_model.is_stale():
+            self.start_search(refresh_in_place=True) # Same page as the snapshot, updated in place
+        else:
+            self.start_search(reset_page=True)
+
+    # --- Warm Start Snapshot --- #
+    def _results_snapshot_path(self) -> str:
+        return os.path.join(os.path.dirname(self.get_settings_path()), self.RESULTS_SNAPSHOT_FILE_NAME)
+
+    def _save_results_snapshot(self):
+        """Saves the first loaded page with its search, page and sort for the next launch."""
+        if self.results_model.is_stale():
+            return # Never refreshed: the file already holds these rows, with their real age
+        first_page, first_page_rows = self._loaded_pages[0] if self._loaded_pages else (self.current_page, 0)
+        snapshot = ResultsSnapshot(
+            query=self.current_search_query, category=self.current_category, sort_by=self.current_sort_by,
+            page=first_page, last_page_reached=self._last_page_reached and len(self._loaded_pages) <= 1,
+            trusted_only=self.filter_trusted_only, uploader=self.filter_uploader,
+            local_sort_column=self.local_sort_column if self.sort_locally else -1,
+            local_sort_ascending=self.local_sort_order == Qt.AscendingOrder,
+            saved_at=time.time(), results=self.results_model.results()[:first_page_rows])
+        try:
+            save_snapshot(self._results_snapshot_path(), snapshot)
+            print(f"Saved {len(snapshot.results)} results for the next launch.")
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Could not save results snapshot: {e}")
+
+    def _restore_results_snapshot(self) -> bool:
+        """Shows the last session's page right away, marked stale. Returns False if there was none."""
+        snapshot = load_snapshot(self._results_snapshot_path())
+        if snapshot is None or not snapshot.results:
+            return False
+        self._stale_snapshot = snapshot
+        self.current_search_query = snapshot.query
+        self.search_input.setText(snapshot.query)
+        self.current_category = snapshot.category
+        self.current_sort_by = snapshot.sort_by
+        self.current_sort_column = self.sort_key_to_column_map.get(self.current_sort_by, 3)
+        self.current_sort_order = Qt.DescendingOrder
+        for combo, value in ((self.category_combo, snapshot.category), (self.sort_combo, snapshot.sort_by)):
+            combo.blockSignals(True)
+            combo.setCurrentIndex(max(0, combo.findData(value)))
+            combo.blockSignals(False)
+        self.filter_trusted_only = snapshot.trusted_only
+        self.filter_uploader = snapshot.uploader
+        self._update_quick_filter_ui()
+        if self.sort_locally and snapshot.local_sort_column in ResultsTableModel.SORTABLE_COLUMNS:
+            self.local_sort_column = snapshot.local_sort_column
+            self.local_sort_order = Qt.AscendingOrder if snapshot.local_sort_ascending else Qt.DescendingOrder
+            self.results_proxy.set_local_sort(self.local_sort_column, self.local_sort_order)
+        self.current_page = snapshot.page
+
+        self.current_results = self._apply_client_filters(snapshot.results)
+        self._series_index_stale = True
+        self._loaded_pages = deque([(self.current_page, len(self.current_results))])
+        self._last_page_reached = snapshot.last_page_reached
+        self._populate_results_rows()
+        self.results_model.set_stale(True)
+        self._update_sort_indicator()
+        self._update_pagination_controls()
+        self.stale_results_label.setText(f"{self._stale_results_text()} Refreshing...")
+        self.stale_results_label.show()
+        print(f"Showing {len(self.current_results)} results from the last session while refreshing.")
+        return True
+
+    def _stale_results_text(self) -> str:
+        return f"Showing results from your last session (saved {self._stale_snapshot.age_text()})."
+
+    def _clear_stale_results(self):
+        """Drops the stale marking once fresh results (or a new search) replace the snapshot."""
+        if self.results_model.is_stale():
+            self.results_model.set_stale(False)
+            self.stale_results_label.hide()
+            self._stale_snapshot = None
 
     # --- Helper to create separators --- #
     def _create_separator(self) -> QFrame:
@@ -1438,7 +2389,7 @@ class MainWindow(QMainWindow):
         print("Resetting all settings to defaults...")
         # Reset state variables to defaults
         self.saved_download_path = os.path.expanduser("~")
-        self.search_history = []
+        self.history_store.clear()
         self.scraper_delay = self.DEFAULT_SCRAPER_DELAY
         self.max_history_items = 25
         self.network_timeout = 30
@@ -1447,9 +2398,20 @@ class MainWindow(QMainWindow):
         self.proxy_port = ""
         self.proxy_username = ""
         self.proxy_password = ""
-        self.marked_torrents = set()
+        self.transmission_enabled = False
+        self.transmission_host = "localhost"
+        self.transmission_port = 9091
+        self.transmission_username = ""
+        self.transmission_password = ""
+        self._connect_transmission() # Disabled now: disconnects
+        self.marked_torrents.clear()
+        self.results_model.refresh_rows()
         self.filter_trusted_only = False
         self.filter_uploader = ""
+        self.sort_locally = False
+        self.infinite_scroll = False
+        self.detail_comment_limit = DETAIL_COMMENT_LIMIT
+        self.detail_description_limit = DETAIL_DESCRIPTION_LIMIT
 
         # Apply defaults to UI
         self._update_settings_ui()
@@ -1486,6 +2448,16 @@ class MainWindow(QMainWindow):
         self.proxy_password = proxy_settings.get("proxy_password", "")
         # No need to save here, _handle_settings_widget_change handles saving
 
+    def _handle_transmission_config_change(self, transmission_settings: dict):
+        """Reconnects to Transmission with the address/login from SettingsWidget."""
+        print("MainWindow received transmission_config_changed signal.")
+        self.transmission_enabled = transmission_settings.get("transmission_enabled", False)
+        self.transmission_host = transmission_settings.get("transmission_host", "")
+        self.transmission_port = transmission_settings.get("transmission_port", 9091)
+        self.transmission_username = transmission_settings.get("transmission_username", "")
+        self.transmission_password = transmission_settings.get("transmission_password", "")
+        self._connect_transmission() # Saved by _handle_settings_widget_change
+
     def _update_state_from_settings_dict(self, settings_dict: dict):
         """Updates MainWindow's internal state variables from a settings dictionary."""
         # Update only the relevant MainWindow state variables
@@ -1500,67 +2472,89 @@ class MainWindow(QMainWindow):
         self.proxy_port = settings_dict.get("proxy_port", self.proxy_port)
         self.proxy_username = settings_dict.get("proxy_username", self.proxy_username)
         self.proxy_password = settings_dict.get("proxy_password", self.proxy_password)
-
-        # Trim history if max items changed
-        if len(self.search_history) > self.max_history_items:
-             self.search_history = self.search_history[:self.max_history_items]
+        # Transmission changes reconnect through _handle_transmission_config_change
+        self.transmission_enabled = settings_dict.get("transmission_enabled", self.transmission_enabled)
+        self.transmission_host = settings_dict.get("transmission_host", self.transmission_host)
+        self.transmission_port = settings_dict.get("transmission_port", self.transmission_port)
+        self.transmission_username = settings_dict.get("transmission_username", self.transmission_username)
+        self.transmission_password = settings_dict.get("transmission_password", self.transmission_password)
+
+        # Resize the history dropdown if max items changed
+        if len(self.search_history) != self.max_history_items:
              self._update_history_combo()
-        
-        # Re-apply defaults to main search UI in case they changed
-        self._apply_main_search_defaults()
 
 
-    # --- Item Changed Handling ---
-    def _handle_item_marked_state_changed(self, item: QTableWidgetItem):
-        """Handles the check state change for the 'Mark' column."""
-        if item.column() != self.mark_column_index:
-            return # Only handle changes in the mark column
+    # --- Mark Toggle Handling ---
+    def _migrate_legacy_marks(self):
+        """Imports marks from the old link journal or settings.json into an empty store."""
+        if len(self.marked_torrents):
+            return
+        data_dir = os.path.dirname(self.get_settings_path())
+        legacy_journal = os.path.join(data_dir, self.LEGACY_MARKS_JOURNAL_NAME)
+        legacy_marks, source = [], None
+        try:
+            if os.path.exists(legacy_journal):
+                marked = {}
+                with open(legacy_journal, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.rstrip("\n")
+                        if len(line) > 1 and line[0] in "+-":
+                            marked[line[1:]] = line[0] == "+"
+                legacy_marks = [link for link, is_marked in marked.items() if is_marked]
+                source = legacy_journal
+            elif os.path.exists(self.get_settings_path()):
+                with open(self.get_settings_path(), "r", encoding="utf-8") as f:
+                    legacy_marks = json.load(f).get("marked_torrents", [])
+                source = self.get_settings_path()
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Warning: Could not read legacy marks: {e}")
+            return
+        if isinstance(legacy_marks, list) and legacy_marks:
+            self.marked_torrents.update(item for item in legacy_marks if isinstance(item, str))
+            print(f"Migrated {len(self.marked_torrents)} marked torrents from {source}.")
+        if source == legacy_journal: # Even with no marks left in it, so it isn't read again
+            try:
+                os.replace(legacy_journal, legacy_journal + ".migrated")
+            except OSError as e:
+                print(f"Warning: Could not rename legacy marks journal {legacy_journal}: {e}")
 
-        row_index = item.row()
-        is_checked = item.checkState() == Qt.Checked
-        torrent_link = item.data(Qt.UserRole) # Retrieve the stored link
+    def _export_marks(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Marked Torrents", "nyaa-marks.txt", "Text Files (*.txt);;All Files (*)")
+        if not path:
+            return
+        try:
+            count = self.marked_torrents.export_marks(path)
+        except OSError as e:
+            self.show_error_message(f"Could not export marks to {path}: {e}")
+            return
+        self.show_status_message(f"Exported {count} marked torrents.", 5000)
 
-        if not torrent_link:
-            print(f"Warning: No torrent link found for item at row {row_index}")
+    def _import_marks(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Marked Torrents", "", "Text Files (*.txt);;All Files (*)")
+        if not path:
+            return
+        try:
+            count = self.marked_torrents.import_marks(path)
+        except (OSError, UnicodeDecodeError) as e:
+            self.show_error_message(f"Could not import marks from {path}: {e}")
             return
+        self.results_model.refresh_rows()
+        self.show_status_message(f"Imported {count} marked torrents.", 5000)
 
-        # Prevent signal loops if style changes trigger this handler
-        self.results_table.blockSignals(True)
+    def _handle_mark_toggled(self, torrent_link: str, magnet_link: str, is_checked: bool):
+        """Handles a 'Mark' checkbox toggle coming from the results model."""
+        if not torrent_link:
+            print("Warning: Mark toggled for a row without a torrent link")
+            return
 
         print(f"Mark state changed for {torrent_link}: {is_checked}")
         if is_checked:
-            self.marked_torrents.add(torrent_link)
+            self.marked_torrents.add(torrent_link, magnet_link)
         else:
-            self.marked_torrents.discard(torrent_link) # Use discard to avoid error if not present
-
-        self._apply_row_style(row_index, is_checked)
-
-        # Unblock signals and save
-        self.results_table.blockSignals(False)
-        self.save_settings()
+            self.marked_torrents.discard(torrent_link, magnet_link) # Also clears a mark made under another link
 
-    # --- Mark As Handling ---
-    def _apply_row_style(self, row_index, is_marked):
-        """Applies or removes visual styling for a marked row."""
-        font = self.results_table.font() # Get default font
-        font.setStrikeOut(is_marked)
-        # Dim color slightly if marked
-        text_color = QColor(Qt.gray) if is_marked else self.results_table.palette().color(QPalette.Text)
-
-        # Iterate through all columns *except* the checkbox column itself
-        for col_index in range(self.results_table.columnCount()):
-            if col_index == self.mark_column_index:
-                continue
-            item = self.results_table.item(row_index, col_index)
-            if item:
-                item.setFont(font)
-                item.setForeground(text_color)
-            # Apply to cell widget in Actions column too
-            elif col_index == 8: # Actions column index
-                widget = self.results_table.cellWidget(row_index, col_index)
-                if widget:
-                    # Might need to iterate through buttons if more complex styling needed
-                    widget.setEnabled(not is_marked)
+        # The model repaints the row (strike-out, disabled actions) itself;
+        # the store persists the change in the background
 
     # --- Filter Dialog Handling --- #
     def _show_filter_dialog(self):
@@ -1570,6 +2564,11 @@ class MainWindow(QMainWindow):
             "min_size_bytes": self.min_size_bytes,
             "max_size_bytes": self.max_size_bytes
         }
+        if self.filter_dialog is None:
+            from ui.filter_dialog import FilterDialog
+            self.filter_dialog = FilterDialog(self)
+            self.filter_dialog.filters_applied.connect(self._apply_filters_from_dialog)
+            self.filter_dialog.filters_cleared.connect(self._clear_filters_from_dialog)
         self.filter_dialog.set_filters(current_filters)
         self.filter_dialog.show() # Show non-modally
         self.filter_dialog.raise_() # Bring to front
@@ -1675,9 +2674,8 @@ class MainWindow(QMainWindow):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            self.search_history = []
+            self.history_store.clear()
             self._update_history_combo() # Update dropdown UI
-            self.save_settings() # Persist the empty list
             self.show_status_message("Search history cleared.", 3000)
         else:
             self.show_status_message("Clear history cancelled.", 3000)
@@ -1691,6 +2689,7 @@ class MainWindow(QMainWindow):
         if num_selected == 0:
             return # Don't show menu if no rows are selected
 
+        import qtawesome as qta # Already loaded by _install_icons
         menu = QMenu(self)
 
         if num_selected == 1:
@@ -1719,15 +2718,22 @@ class MainWindow(QMainWindow):
 
             menu.addSeparator()
 
-            mark_item = self.results_table.item(row_index, self.mark_column_index)
-            is_marked = mark_item.checkState() == Qt.Checked if mark_item else False
+            is_marked = self.results_model.is_marked(row_index)
             mark_action_text = "Unmark Torrent" if is_marked else "Mark Torrent"
             mark_action_icon = qta.icon('mdi.close-box-outline') if is_marked else qta.icon('mdi.checkbox-marked-outline')
             toggle_mark_action = QAction(mark_action_icon, mark_action_text, self)
             toggle_mark_action.triggered.connect(lambda checked=False, r=row_index: self._toggle_mark_row(r))
-            toggle_mark_action.setEnabled(mark_item is not None) # Only enable if item exists
+            toggle_mark_action.setEnabled(bool(result_data.link)) # Only enable if the row has a link
             menu.addAction(toggle_mark_action)
 
+            menu.addSeparator()
+            in_client = self.downloads_model.contains_hash(result_data.info_hash)
+            send_action = QAction(qta.icon('mdi.download-outline'),
+                                  "Already in Transmission" if in_client else "Send to Transmission", self)
+            send_action.triggered.connect(self._send_selected_to_client)
+            send_action.setEnabled(self.transmission_enabled and bool(result_data.magnet_link) and not in_client)
+            menu.addAction(send_action)
+
         else: # num_selected > 1
             # --- Bulk Actions --- #            
             menu.addAction(f"{num_selected} items selected")
@@ -1759,6 +2765,19 @@ class MainWindow(QMainWindow):
             copy_names_action.triggered.connect(self._copy_selected_names)
             menu.addAction(copy_names_action)
 
+            menu.addSeparator()
+            send_selected_action = QAction(qta.icon('mdi.download-outline'), f"Send Selected to Transmission ({num_selected})", self)
+            send_selected_action.triggered.connect(self._send_selected_to_client)
+            send_selected_action.setEnabled(self.transmission_enabled and any(res.magnet_link for _, res in selected_data))
+            menu.addAction(send_selected_action)
+
+        # Marked rows anywhere in the loaded results, whatever is selected
+        marked_count = sum(1 for row in range(self.results_model.rowCount()) if self.results_model.is_marked(row))
+        send_marked_action = QAction(qta.icon('mdi.download-multiple'), f"Send Marked to Transmission ({marked_count})", self)
+        send_marked_action.triggered.connect(self._send_marked_to_client)
+        send_marked_action.setEnabled(self.transmission_enabled and marked_count > 0)
+        menu.addAction(send_marked_action)
+
         # --- Show Menu --- #
         # Map the local position to global screen position
         global_pos = self.results_table.viewport().mapToGlobal(position)
@@ -1766,79 +2785,66 @@ class MainWindow(QMainWindow):
 
     # --- Single Row Context Menu Actions --- #
     def _open_details_selected_from_context(self, row_index):
-        """Opens details based on the VISIBLE row index from context menu."""
-        # We have the direct row index, get the data using the helper
-        mark_item = self.results_table.item(row_index, self.mark_column_index)
-        if mark_item:
-            original_index = mark_item.data(Qt.UserRole + 1)
-            if isinstance(original_index, int) and 0 <= original_index < len(self.unfiltered_page_results):
-                result_data = self.unfiltered_page_results[original_index]
-                if result_data and result_data.link and result_data.link != '#':
-                    self.show_details(result_data.link)
-                    return
+        """Opens details based on the row index from context menu."""
+        # row_index is a source row of results_model (see _get_all_selected_row_data)
+        result_data = self.results_model.result_at(row_index)
+        if result_data and result_data.link and result_data.link != '#':
+            self.show_details(result_data.link)
+            return
         self.show_error_message("Could not retrieve details link for the selected row.")
 
     def _copy_name(self, row_index):
-        """Copies name based on the VISIBLE row index from context menu."""
-        mark_item = self.results_table.item(row_index, self.mark_column_index)
-        if mark_item:
-            original_index = mark_item.data(Qt.UserRole + 1)
-            if isinstance(original_index, int) and 0 <= original_index < len(self.unfiltered_page_results):
-                result_data = self.unfiltered_page_results[original_index]
-                if result_data:
-                    try:
-                        pyperclip.copy(result_data.name)
-                        self.show_status_message(f"Copied name: {result_data.name[:50]}...", 3000)
-                    except Exception as e:
-                        print(f"Clipboard Error (Name Context): {e}")
-                        self.show_error_message("Failed to copy name to clipboard.")
-                    return
+        """Copies name based on the row index from context menu."""
+        # row_index is a source row of results_model (see _get_all_selected_row_data)
+        result_data = self.results_model.result_at(row_index)
+        if result_data:
+            try:
+                copy_to_clipboard(result_data.name)
+                self.show_status_message(f"Copied name: {result_data.name[:50]}...", 3000)
+            except Exception as e:
+                print(f"Clipboard Error (Name Context): {e}")
+                self.show_error_message("Failed to copy name to clipboard.")
+            return
         self.show_error_message("Could not retrieve name for the selected row.")
 
     def _copy_magnet_link(self, row_index):
-        """Copies magnet link based on the VISIBLE row index from context menu."""
-        mark_item = self.results_table.item(row_index, self.mark_column_index)
-        if mark_item:
-            original_index = mark_item.data(Qt.UserRole + 1)
-            if isinstance(original_index, int) and 0 <= original_index < len(self.unfiltered_page_results):
-                result_data = self.unfiltered_page_results[original_index]
-                if result_data and result_data.magnet_link:
-                    try:
-                        pyperclip.copy(result_data.magnet_link)
-                        self.show_status_message("Copied magnet link.", 3000)
-                    except Exception as e:
-                        print(f"Clipboard Error (Magnet Context): {e}")
-                        self.show_error_message("Failed to copy magnet link to clipboard.")
-                    return
+        """Copies magnet link based on the row index from context menu."""
+        # row_index is a source row of results_model (see _get_all_selected_row_data)
+        result_data = self.results_model.result_at(row_index)
+        if result_data and result_data.magnet_link:
+            try:
+                copy_to_clipboard(result_data.magnet_link)
+                self.show_status_message("Copied magnet link.", 3000)
+            except Exception as e:
+                print(f"Clipboard Error (Magnet Context): {e}")
+                self.show_error_message("Failed to copy magnet link to clipboard.")
+            return
         self.show_error_message("Could not retrieve magnet link for the selected row.")
 
     def _copy_details_link(self, row_index):
-        """Copies details link based on the VISIBLE row index from context menu."""
-        mark_item = self.results_table.item(row_index, self.mark_column_index)
-        if mark_item:
-            original_index = mark_item.data(Qt.UserRole + 1)
-            if isinstance(original_index, int) and 0 <= original_index < len(self.unfiltered_page_results):
-                result_data = self.unfiltered_page_results[original_index]
-                if result_data and result_data.link and result_data.link != '#':
-                    try:
-                        pyperclip.copy(result_data.link)
-                        self.show_status_message(f"Copied details link.", 3000)
-                    except Exception as e:
-                        print(f"Clipboard Error (Details Context): {e}")
-                        self.show_error_message("Failed to copy details link to clipboard.")
-                    return
+        """Copies details link based on the row index from context menu."""
+        # row_index is a source row of results_model (see _get_all_selected_row_data)
+        result_data = self.results_model.result_at(row_index)
+        if result_data and result_data.link and result_data.link != '#':
+            try:
+                copy_to_clipboard(result_data.link)
+                self.show_status_message(f"Copied details link.", 3000)
+            except Exception as e:
+                print(f"Clipboard Error (Details Context): {e}")
+                self.show_error_message("Failed to copy details link to clipboard.")
+            return
         self.show_error_message("Could not retrieve details link for the selected row.")
 
     def _toggle_mark_row(self, row_index):
-        """Toggles the check state of the mark checkbox for the given VISIBLE row index."""
-        mark_item = self.results_table.item(row_index, self.mark_column_index)
-        if mark_item:
-            current_state = mark_item.checkState()
-            new_state = Qt.Unchecked if current_state == Qt.Checked else Qt.Checked
-            mark_item.setCheckState(new_state)
-            # The itemChanged signal connected earlier will handle saving state and applying style
+        """Toggles the mark of the given source row (same path as clicking its checkbox)."""
+        result_data = self.results_model.result_at(row_index)
+        if result_data and result_data.link:
+            new_state = Qt.Unchecked if self.results_model.is_marked(row_index) else Qt.Checked
+            model_index = self.results_model.index(row_index, self.mark_column_index)
+            # setData emits mark_toggled, which updates marked_torrents
+            self.results_model.setData(model_index, new_state, Qt.CheckStateRole)
         else:
-            print(f"Warning: Could not find mark item for row {row_index} to toggle.")
+            print(f"Warning: Could not find torrent link for row {row_index} to toggle.")
 
     # --- Bulk Action Handlers --- #
     def _mark_selected_rows(self, mark_state=Qt.Checked):
@@ -1848,25 +2854,23 @@ class MainWindow(QMainWindow):
             return
         
         print(f"Setting mark state to {mark_state} for {len(selected_data)} rows.")
-        self.results_table.blockSignals(True)
+        should_mark = (mark_state == Qt.Checked)
         changed_links = set()
+        changed_rows = []
         for row_index, result_data in selected_data:
-            mark_item = self.results_table.item(row_index, self.mark_column_index)
-            if mark_item and mark_item.checkState() != mark_state:
-                mark_item.setCheckState(mark_state)
-                torrent_link = result_data.link
-                if torrent_link:
-                    if mark_state == Qt.Checked:
-                        self.marked_torrents.add(torrent_link)
-                    else:
-                        self.marked_torrents.discard(torrent_link)
-                    changed_links.add(torrent_link)
-                self._apply_row_style(row_index, mark_state == Qt.Checked)
-
-        self.results_table.blockSignals(False)
-        if changed_links:
-            self.save_settings() # Save if any state actually changed
-        action = "Marked" if mark_state == Qt.Checked else "Unmarked"
+            torrent_link = result_data.link
+            if torrent_link and self.results_model.is_marked(row_index) != should_mark:
+                if should_mark:
+                    self.marked_torrents.add(torrent_link, result_data.magnet_link)
+                else:
+                    self.marked_torrents.discard(torrent_link, result_data.magnet_link)
+                changed_links.add(torrent_link)
+                changed_rows.append(row_index)
+
+        # One repaint for the whole selection instead of per-row styling
+        # (the store writes all changes in one batch)
+        self.results_model.refresh_rows(changed_rows)
+        action = "Marked" if should_mark else "Unmarked"
         self.show_status_message(f"{action} {len(changed_links)} selected torrents.", 3000)
 
     def _unmark_selected_rows(self):
@@ -1877,7 +2881,7 @@ class MainWindow(QMainWindow):
         magnets = [res.magnet_link for _, res in selected_data if res.magnet_link]
         if magnets:
             try:
-                pyperclip.copy("\n".join(magnets))
+                copy_to_clipboard("\n".join(magnets))
                 self.show_status_message(f"Copied {len(magnets)} magnet links.", 3000)
             except Exception as e:
                 print(f"Clipboard Error (Bulk Magnets): {e}")
@@ -1890,7 +2894,7 @@ class MainWindow(QMainWindow):
         links = [res.link for _, res in selected_data if res.link and res.link != '#']
         if links:
             try:
-                pyperclip.copy("\n".join(links))
+                copy_to_clipboard("\n".join(links))
                 self.show_status_message(f"Copied {len(links)} detail links.", 3000)
             except Exception as e:
                 print(f"Clipboard Error (Bulk Details): {e}")
@@ -1903,7 +2907,7 @@ class MainWindow(QMainWindow):
         names = [res.name for _, res in selected_data]
         if names:
             try:
-                pyperclip.copy("\n".join(names))
+                copy_to_clipboard("\n".join(names))
                 self.show_status_message(f"Copied {len(names)} names.", 3000)
             except Exception as e:
                 print(f"Clipboard Error (Bulk Names): {e}")
@@ -1914,46 +2918,37 @@ class MainWindow(QMainWindow):
     # --- Live Filtering Method --- #
     def _apply_row_visibility_filters(self):
         """Hides/shows rows based on current filter criteria (name, size, seeders)."""
-        if not hasattr(self, 'results_table') or not hasattr(self, 'unfiltered_page_results'):
+        if not hasattr(self, 'results_proxy'):
             print("DEBUG: Filter called before table/results ready.")
             return # Table not ready
 
-        name_filter = self.search_input.text().lower().strip()
-        min_seeders = self.min_seeders
-        min_size = self.min_size_bytes
-        max_size = self.max_size_bytes
+        # The proxy only re-evaluates rows when a criterion actually changed
+        self.results_proxy.set_numeric_filters(self.min_seeders, self.min_size_bytes, self.max_size_bytes)
+        self.results_proxy.set_name_filter(self.search_input.text())
+        print(f"DEBUG: Live filter applied. Visible rows: {self.results_proxy.rowCount()}")
 
-        visible_count = 0
-        self.results_table.setUpdatesEnabled(False) # Performance boost
-
-        for row_index in range(self.results_table.rowCount()):
-            # Check if the unfiltered results list has this index
-            if row_index >= len(self.unfiltered_page_results):
-                # This case shouldn't happen if population is correct, but good to guard
-                self.results_table.setRowHidden(row_index, True)
-                continue
-
-            result = self.unfiltered_page_results[row_index]
-
-            # Apply filters
-            name_match = (not name_filter) or (name_filter in result.name.lower())
-            seeder_match = result.seeders >= min_seeders
-            min_size_match = result.size_bytes >= min_size
-            max_size_match = max_size <= 0 or result.size_bytes <= max_size
-
-            is_visible = name_match and seeder_match and min_size_match and max_size_match
-
-            self.results_table.setRowHidden(row_index, not is_visible)
-            if is_visible:
-                visible_count += 1
-
-        self.results_table.setUpdatesEnabled(True)
-        print(f"DEBUG: Live filter applied. Visible rows: {visible_count}")
-
-        # Optional: Update status bar?
-        # Might be too noisy to update on every keystroke.
-        # Consider updating only after a short delay (using QTimer) if desired.
-        # self.show_status_message(f"{visible_count} results shown after filtering.", 2000)
+    # --- Series Grouping --- #
+    def _on_group_by_series_changed(self, state):
+        """Re-lays out the loaded results grouped by series (no new search needed)."""
+        is_checked = (state == Qt.Checked.value) or (state == Qt.Checked)
+        if is_checked == self.group_by_series:
+            return
+        self.group_by_series = is_checked
+        print(f"Group by series changed to: {is_checked}")
+        self.results_proxy.set_series_grouping(self._ensure_series_index(), self.group_by_series)
+
+    def _ensure_series_index(self) -> SeriesIndex:
+        """Builds the series index for current_results if grouping needs it."""
+        if self.group_by_series and self._series_index_stale:
+            self.series_index.build(result.name for result in self.current_results)
+            self._series_index_stale = False
+        return self.series_index
+
+    def _handle_series_cell_clicked(self, proxy_index):
+        """Clicking a series leader's name toggles the rest of the series."""
+        if not self.group_by_series or proxy_index.column() != ResultsTableModel.NAME_COLUMN:
+            return
+        self.results_proxy.toggle_series(self.results_proxy.mapToSource(proxy_index).row())
 
     # --- Header Context Menu Logic --- #
     def _show_header_context_menu(self, position): # position is a QPoint relative to header
@@ -1966,7 +2961,7 @@ class MainWindow(QMainWindow):
         can_hide = len(visible_columns) > 1 # Can hide if more than one column is visible
 
         for logical_index in range(header.count()):
-            action_text = self.results_table.horizontalHeaderItem(logical_index).text()
+            action_text = self.results_model.headerData(logical_index, Qt.Horizontal)
             action = QAction(action_text, self, checkable=True)
             action.setChecked(not header.isSectionHidden(logical_index))
 
@@ -2059,50 +3054,26 @@ class MainWindow(QMainWindow):
     # --- Helper Methods for Selected Row Actions ---
     def _get_selected_row_data(self) -> ScrapeResult | None:
         """Gets the ScrapeResult data for the currently selected row."""
-        selected_items = self.results_table.selectedItems()
-        if not selected_items:            
-            return None
-        # Assume single row selection
-        selected_row_index = selected_items[0].row()
-        if 0 <= selected_row_index < len(self.current_results): # Use current_results which maps filtered rows
-            # Need to map the visible row index back to the unfiltered index if filtering is active
-            # Let's refine this - self.current_results is now potentially outdated with live filtering
-            # We should get the data directly associated with the table row
-
-            # Get the original index stored when populating
-            mark_item = self.results_table.item(selected_row_index, self.mark_column_index)
-            if mark_item:
-                original_index = mark_item.data(Qt.UserRole + 1)
-                if isinstance(original_index, int) and 0 <= original_index < len(self.unfiltered_page_results):
-                    return self.unfiltered_page_results[original_index]
-                else:
-                    print(f"Warning: Invalid original index ({original_index}) found for selected row {selected_row_index}")
-                    return None
-            else:
-                print(f"Warning: Mark item not found for selected row {selected_row_index} to get original index.")
-                return None
-        else:
-            print(f"Warning: Selected row index {selected_row_index} out of bounds for current_results.")
+        selected_rows = self.results_table.selectionModel().selectedRows()
+        if not selected_rows:            
             return None
+        # Assume single row selection; map the view (proxy) row back to the result store
+        source_row = self.results_proxy.mapToSource(selected_rows[0]).row()
+        result_data = self.results_model.result_at(source_row)
+        if result_data is None:
+            print(f"Warning: Selected row {selected_rows[0].row()} has no result data.")
+        return result_data
 
     def _get_all_selected_row_data(self) -> list[tuple[int, ScrapeResult]]:
-        """Gets the original row index and ScrapeResult data for all selected rows."""
+        """Gets the source row index and ScrapeResult data for all selected rows."""
         selected_rows_data = []
-        selected_indices = {index.row() for index in self.results_table.selectedIndexes()}
-        if not selected_indices:
-            return []
-
-        for row_index in sorted(list(selected_indices)):
-            # Get the original index stored when populating
-            mark_item = self.results_table.item(row_index, self.mark_column_index)
-            if mark_item:
-                original_index = mark_item.data(Qt.UserRole + 1)
-                if isinstance(original_index, int) and 0 <= original_index < len(self.unfiltered_page_results):
-                    selected_rows_data.append((row_index, self.unfiltered_page_results[original_index]))
-                else:
-                    print(f"Warning: Invalid original index ({original_index}) found for selected row {row_index}")
+        source_rows = {self.results_proxy.mapToSource(index).row() for index in self.results_table.selectionModel().selectedRows()}
+        for row_index in sorted(source_rows):
+            result_data = self.results_model.result_at(row_index)
+            if result_data is not None:
+                selected_rows_data.append((row_index, result_data))
             else:
-                print(f"Warning: Mark item not found for selected row {row_index} to get original index.")
+                print(f"Warning: No result data found for selected row {row_index}")
         return selected_rows_data
 
     def _open_details_selected(self):
@@ -2117,17 +3088,17 @@ class MainWindow(QMainWindow):
             self.show_status_message("No row selected or data not found.", 3000)
 
     def _get_selected_row_index(self) -> int | None:
-        """Helper to get the index of the single selected row, or None if multiple/zero."""
-        selected_indices = {index.row() for index in self.results_table.selectedIndexes()}
-        if len(selected_indices) == 1:
-            return list(selected_indices)[0]
+        """Helper to get the source row of the single selected row, or None if multiple/zero."""
+        selected_rows = self.results_table.selectionModel().selectedRows()
+        if len(selected_rows) == 1:
+            return self.results_proxy.mapToSource(selected_rows[0]).row()
         return None
 
     def _copy_magnet_selected(self):
         result_data = self._get_selected_row_data()
         if result_data and result_data.magnet_link:
             try:
-                pyperclip.copy(result_data.magnet_link)
+                copy_to_clipboard(result_data.magnet_link)
                 self.show_status_message("Copied magnet link.", 3000)
             except Exception as e:
                 print(f"Clipboard Error (Magnet Shortcut): {e}")
@@ -2141,7 +3112,7 @@ class MainWindow(QMainWindow):
         result_data = self._get_selected_row_data()
         if result_data and result_data.link and result_data.link != '#':
             try:
-                pyperclip.copy(result_data.link)
+                copy_to_clipboard(result_data.link)
                 self.show_status_message(f"Copied details link.", 3000)
             except Exception as e:
                 print(f"Clipboard Error (Details Shortcut): {e}")
@@ -2155,7 +3126,7 @@ class MainWindow(QMainWindow):
         result_data = self._get_selected_row_data()
         if result_data:
             try:
-                pyperclip.copy(result_data.name)
+                copy_to_clipboard(result_data.name)
                 self.show_status_message(f"Copied name: {result_data.name[:50]}...", 3000)
             except Exception as e:
                 print(f"Clipboard Error (Name Shortcut): {e}")
@@ -2164,10 +3135,8 @@ class MainWindow(QMainWindow):
             self.show_status_message("No row selected or data not found.", 3000)
 
     def _toggle_mark_selected(self):
-        selected_items = self.results_table.selectedItems()
-        if not selected_items:
+        row_index = self._get_selected_row_index()
+        if row_index is None:
             self.show_status_message("No row selected to mark/unmark.", 3000)
             return
-        # Assume single row selection
-        row_index = selected_items[0].row()
-        self._toggle_mark_row(row_index) # Use the existing context menu action method
\ No newline at end of file
+        self._toggle_mark_row(row_index) # Use the existing context menu action method
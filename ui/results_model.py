@@ -0,0 +1,649 @@
+# ui/results_model.py
+from PySide6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+                            Signal, QSize, QRect, QEvent, QPersistentModelIndex)
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QStyleOptionButton, QApplication, QToolTip
+
+from core.models import ScrapeResult
+from core.release_parser import SeriesIndex
+
+# --- Custom Roles ---
+ResultRole = Qt.UserRole + 1 # The ScrapeResult behind a row
+SortRole = Qt.UserRole + 2 # Raw value used for sorting
+MarkedRole = Qt.UserRole + 3 # bool, whether the row's torrent is marked
+
+
+def result_key(result: ScrapeResult) -> str:
+    """What makes two results the same torrent: the info hash, else the detail link."""
+    return result.info_hash or result.link
+
+
+def _is_checked(value) -> bool:
+    """CheckStateRole values arrive as ints or Qt.CheckState depending on the caller."""
+    try:
+        return Qt.CheckState(value) == Qt.Checked
+    except (ValueError, TypeError):
+        return bool(value)
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Table model over the loaded ScrapeResult list. Cells are computed on demand,
+    so only the rows in the viewport cost anything to render."""
+    HEADERS = ["Mark", "Cat", "Name", "Size", "Date", "S", "L", "D", "Uploader", "Actions"]
+    MARK_COLUMN = 0
+    CATEGORY_COLUMN = 1
+    NAME_COLUMN = 2
+    SIZE_COLUMN = 3
+    DATE_COLUMN = 4
+    SEEDERS_COLUMN = 5
+    LEECHERS_COLUMN = 6
+    DOWNLOADS_COLUMN = 7
+    UPLOADER_COLUMN = 8
+    ACTIONS_COLUMN = 9
+    # Columns with a SortRole value (usable for local sorting)
+    SORTABLE_COLUMNS = (NAME_COLUMN, SIZE_COLUMN, DATE_COLUMN, SEEDERS_COLUMN,
+                        LEECHERS_COLUMN, DOWNLOADS_COLUMN, UPLOADER_COLUMN)
+
+    # Emitted when the user toggles a Mark checkbox: (detail link, magnet link, checked)
+    mark_toggled = Signal(str, str, bool)
+
+    def __init__(self, marked_torrents, category_icon_provider, parent=None):
+        super().__init__(parent)
+        self._results: list[ScrapeResult] = []
+        self._folded_names: list[str] = [] # Casefolded once per row for the live name filter
+        self._key_counts: dict[str, int] = {} # result_key -> loaded rows with it, for dedup and hash lookups
+        self._epoch = 0 # Bumped whenever rows are replaced/inserted/removed
+        self._marked = marked_torrents # MarkStore, owned by MainWindow; only read here
+        self._row_marked: list[bool] = [] # Parallel to _results, looked up once per page
+        self._category_icon_provider = category_icon_provider
+        self._category_icons = {} # category name -> QIcon, one lookup per painted cell
+        self._marked_color = QColor(Qt.gray)
+        self._marked_font = QApplication.font()
+        self._marked_font.setStrikeOut(True)
+        self._stale = False # Rows come from the last session's snapshot and haven't been refreshed yet
+        self._stale_color = QColor(Qt.darkGray)
+        self._stale_font = QApplication.font()
+        self._stale_font.setItalic(True)
+
+    # --- Store Access ---
+    def set_results(self, results: list[ScrapeResult]):
+        """Replaces the whole result set (one reset instead of per-row work)."""
+        self.beginResetModel()
+        self._results = results
+        self._folded_names = [result.name.casefold() for result in results]
+        self._row_marked = self._marked_flags(results)
+        self._rebuild_key_counts()
+        self._epoch += 1
+        self.endResetModel()
+
+    def update_results(self, results: list[ScrapeResult]):
+        """Replaces the result set in place, matching rows by detail link: rows still
+        present keep their selection and scroll position and just repaint, rows that
+        are gone are removed and new ones inserted where they belong."""
+        new_rows = {} # link -> row in results (first occurrence)
+        for row, result in enumerate(results):
+            new_rows.setdefault(result.link, row)
+
+        # 1. Remove rows that aren't in the new set (or repeat a link), bottom-up
+        seen = set()
+        keep = []
+        for result in self._results:
+            keep.append(result.link in new_rows and result.link not in seen)
+            seen.add(result.link)
+        row = len(self._results) - 1
+        while row >= 0:
+            if keep[row]:
+                row -= 1
+                continue
+            end = row
+            while row > 0 and not keep[row - 1]:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, end)
+            del self._results[row:end + 1]
+            del self._folded_names[row:end + 1]
+            del self._row_marked[row:end + 1]
+            self.endRemoveRows()
+            row -= 1
+
+        # 2. Put the kept rows in their new relative order
+        order = sorted(range(len(self._results)), key=lambda row: new_rows[self._results[row].link])
+        if order != list(range(len(order))):
+            self.layoutAboutToBeChanged.emit()
+            new_position = {old_row: new_row for new_row, old_row in enumerate(order)}
+            self._results = [self._results[row] for row in order]
+            self._folded_names = [self._folded_names[row] for row in order]
+            self._row_marked = [self._row_marked[row] for row in order]
+            old_indexes = self.persistentIndexList()
+            self.changePersistentIndexList(old_indexes, [self.index(new_position[index.row()], index.column())
+                                                         for index in old_indexes])
+            self.layoutChanged.emit()
+
+        # 3. Insert the new rows, run by run; everything above a run is already in final order
+        kept = {result.link for result in self._results}
+        row = 0
+        while row < len(results):
+            if results[row].link in kept and new_rows[results[row].link] == row:
+                row += 1
+                continue
+            end = row
+            while end + 1 < len(results) and not (results[end + 1].link in kept and new_rows[results[end + 1].link] == end + 1):
+                end += 1
+            self.beginInsertRows(QModelIndex(), row, end)
+            self._results[row:row] = results[row:end + 1]
+            self._folded_names[row:row] = [result.name.casefold() for result in results[row:end + 1]]
+            self._row_marked[row:row] = [False] * (end + 1 - row) # Read below with the rest
+            self.endInsertRows()
+            row = end + 1
+
+        # 4. Fresh values (seeders, dates, ...) for every row
+        self._results = results
+        self._folded_names = [result.name.casefold() for result in results]
+        self._row_marked = self._marked_flags(results)
+        self._rebuild_key_counts()
+        self._epoch += 1
+        if results:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(results) - 1, self.columnCount() - 1))
+
+    def set_stale(self, stale: bool):
+        """Dims the rows while they are the last session's, until the refresh arrives."""
+        if stale == self._stale:
+            return
+        self._stale = stale
+        if self._results:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._results) - 1, self.columnCount() - 1),
+                                  [Qt.ForegroundRole, Qt.FontRole])
+
+    def is_stale(self) -> bool:
+        return self._stale
+
+    def unseen_results(self, results: list[ScrapeResult]) -> list[ScrapeResult]:
+        """The results that aren't loaded yet (nor repeated earlier in results), in order.
+        Pages shift while new torrents are uploaded, so the next page often repeats a few rows."""
+        seen = set()
+        unseen = []
+        for result in results:
+            key = result_key(result)
+            if key not in self._key_counts and key not in seen:
+                seen.add(key)
+                unseen.append(result)
+        return unseen
+
+    def append_results(self, results: list[ScrapeResult]):
+        """Appends rows (next page) with an insert, so scroll position and selection survive."""
+        if not results:
+            return
+        first = len(self._results)
+        self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+        for result in results:
+            key = result_key(result)
+            self._key_counts[key] = self._key_counts.get(key, 0) + 1
+        self._results.extend(results)
+        self._folded_names.extend(result.name.casefold() for result in results)
+        self._row_marked.extend(self._marked_flags(results))
+        self._epoch += 1
+        self.endInsertRows()
+
+    def remove_leading_rows(self, count: int):
+        """Drops the first count rows (oldest page) in place."""
+        count = min(count, len(self._results))
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        for result in self._results[:count]:
+            key = result_key(result)
+            if self._key_counts.get(key, 0) > 1:
+                self._key_counts[key] -= 1
+            else:
+                self._key_counts.pop(key, None)
+        del self._results[:count]
+        del self._folded_names[:count]
+        del self._row_marked[:count]
+        self._epoch += 1
+        self.endRemoveRows()
+
+    def _rebuild_key_counts(self):
+        self._key_counts = {}
+        for result in self._results:
+            key = result_key(result)
+            self._key_counts[key] = self._key_counts.get(key, 0) + 1
+
+    def results(self) -> list[ScrapeResult]:
+        return self._results
+
+    def folded_names(self) -> list[str]:
+        """Casefolded names, parallel to results()."""
+        return self._folded_names
+
+    def epoch(self) -> int:
+        """Changes whenever row positions may have changed."""
+        return self._epoch
+
+    def result_at(self, row: int) -> ScrapeResult | None:
+        if 0 <= row < len(self._results):
+            return self._results[row]
+        return None
+
+    def set_marked_torrents(self, marked_torrents):
+        """Points the model at a new marks set (settings load/reset replace it)."""
+        self._marked = marked_torrents
+        self.refresh_rows()
+
+    def clear_icon_cache(self):
+        """Drops cached category icons (e.g. after a device pixel ratio change)."""
+        self._category_icons.clear()
+        if self._results:
+            self.dataChanged.emit(self.index(0, self.CATEGORY_COLUMN),
+                                  self.index(len(self._results) - 1, self.CATEGORY_COLUMN), [Qt.DecorationRole])
+
+    def _marked_flags(self, results) -> list[bool]:
+        """Marked by detail link, or by info hash when marked under another link (a re-upload)."""
+        return self._marked.marked_flags([result.link for result in results], [result.info_hash for result in results])
+
+    def is_marked(self, row: int) -> bool:
+        return 0 <= row < len(self._row_marked) and self._row_marked[row]
+
+    def refresh_rows(self, rows=None):
+        """Re-reads marks for the given source rows (all rows if None) and repaints them."""
+        if not self._results:
+            return
+        if rows is None:
+            first, last = 0, len(self._results) - 1
+            self._row_marked = self._marked_flags(self._results)
+        else:
+            rows = [row for row in rows if 0 <= row < len(self._results)]
+            if not rows:
+                return
+            first, last = min(rows), max(rows)
+            flags = self._marked_flags([self._results[row] for row in rows])
+            for row, flag in zip(rows, flags):
+                self._row_marked[row] = flag
+        self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+
+    def notify_rows_changed(self, rows):
+        """Emits dataChanged per run of consecutive source rows (rows must be sorted).
+        A dynamic proxy re-filters just these rows instead of all of them."""
+        last_column = self.columnCount() - 1
+        run_start = previous = None
+        for row in rows:
+            if run_start is None:
+                run_start = previous = row
+            elif row == previous + 1:
+                previous = row
+            else:
+                self.dataChanged.emit(self.index(run_start, 0), self.index(previous, last_column))
+                run_start = previous = row
+        if run_start is not None:
+            self.dataChanged.emit(self.index(run_start, 0), self.index(previous, last_column))
+
+    # --- QAbstractTableModel Interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._results)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == self.MARK_COLUMN:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row >= len(self._results):
+            return None
+        result = self._results[row]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self.NAME_COLUMN: return result.name
+            if column == self.SIZE_COLUMN: return result.size
+            if column == self.DATE_COLUMN: return result.date
+            if column == self.SEEDERS_COLUMN: return str(result.seeders)
+            if column == self.LEECHERS_COLUMN: return str(result.leechers)
+            if column == self.DOWNLOADS_COLUMN: return str(result.downloads)
+            if column == self.UPLOADER_COLUMN: return result.uploader
+            return None
+        if role == Qt.CheckStateRole and column == self.MARK_COLUMN:
+            return Qt.Checked if self._row_marked[row] else Qt.Unchecked
+        if role == Qt.DecorationRole and column == self.CATEGORY_COLUMN:
+            icon = self._category_icons.get(result.category)
+            if icon is None:
+                icon = self._category_icons[result.category] = self._category_icon_provider(result.category)
+            return icon
+        if role == Qt.ToolTipRole:
+            if column == self.CATEGORY_COLUMN: return result.category
+            if column == self.NAME_COLUMN: return result.name
+            if column == self.DOWNLOADS_COLUMN: return f"{result.downloads} completed downloads"
+            if column == self.UPLOADER_COLUMN: return result.uploader
+            return None
+        if role == Qt.TextAlignmentRole and column in (self.SEEDERS_COLUMN, self.LEECHERS_COLUMN, self.DOWNLOADS_COLUMN):
+            return int(Qt.AlignCenter)
+        if role == Qt.ForegroundRole:
+            if self._row_marked[row]:
+                return self._marked_color
+            return self._stale_color if self._stale else None
+        if role == Qt.FontRole:
+            if column != self.MARK_COLUMN and self._row_marked[row]:
+                return self._marked_font
+            return self._stale_font if self._stale else None
+        if role == ResultRole:
+            return result
+        if role == MarkedRole:
+            return self._row_marked[row]
+        if role == SortRole:
+            if column == self.NAME_COLUMN: return result.name.casefold()
+            if column == self.SIZE_COLUMN: return result.size_bytes
+            if column == self.DATE_COLUMN: return result.timestamp
+            if column == self.SEEDERS_COLUMN: return result.seeders
+            if column == self.LEECHERS_COLUMN: return result.leechers
+            if column == self.DOWNLOADS_COLUMN: return result.downloads
+            if column == self.UPLOADER_COLUMN: return result.uploader.casefold()
+            return None
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole or index.column() != self.MARK_COLUMN:
+            return False
+        result = self.result_at(index.row())
+        if not result or not result.link:
+            return False
+        # MainWindow updates the marks set (and persists it) from this signal
+        self.mark_toggled.emit(result.link, result.magnet_link, _is_checked(value))
+        self.refresh_rows([index.row()])
+        return True
+
+
+class ResultsFilterProxyModel(QSortFilterProxyModel):
+    """Live name/size/seeder filtering plus series grouping on top of ResultsTableModel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._name_filter = ""
+        self._name_matches: set | None = None # Source rows matching _name_filter (None = no filter)
+        self._name_matches_epoch = -1 # Model epoch _name_matches was computed for
+        self._min_seeders = 0
+        self._min_size_bytes = 0
+        self._max_size_bytes = 0
+        # Series grouping
+        self._series_index: SeriesIndex | None = None
+        self._group_by_series = False
+        self._expanded_series = set()
+        self._group_rank = {} # Source row -> position in the grouped order
+        # Local sort (-1 = keep the server's order)
+        self._local_sort_column = -1
+        self._local_sort_order = Qt.DescendingOrder
+
+    def setSourceModel(self, model):
+        # sourceModel() goes through a binding lookup on every call; filterAcceptsRow uses this instead
+        self._model = model
+        super().setSourceModel(model)
+
+    # --- Filters ---
+    # Re-filter everything instead of per-row when more than this share of rows flips
+    FULL_REFILTER_RATIO = 0.25
+
+    def set_name_filter(self, text: str):
+        """Applies the live name filter, re-filtering only rows whose visibility changed."""
+        text = text.casefold().strip()
+        if text == self._name_filter:
+            return
+        model = self.sourceModel()
+        names = model.folded_names()
+        previous_filter = self._name_filter
+        previous_matches = self._current_name_matches(previous_filter, names)
+        self._name_filter = text
+
+        if not text:
+            matches = None
+        elif previous_matches is not None and previous_filter in text:
+            # Typing forward can only narrow the previous matches
+            matches = {row for row in previous_matches if text in names[row]}
+        else:
+            matches = {row for row, name in enumerate(names) if text in name}
+        self._name_matches = matches
+        self._name_matches_epoch = model.epoch()
+
+        if matches == previous_matches:
+            return # Same rows match (e.g. one more letter of a shown name)
+        if matches is None or previous_matches is None:
+            changed = set(range(len(names))) - (matches if matches is not None else previous_matches)
+        else:
+            changed = matches ^ previous_matches
+        if len(changed) > len(names) * self.FULL_REFILTER_RATIO:
+            self.invalidate()
+        else:
+            model.notify_rows_changed(sorted(changed))
+
+    def _current_name_matches(self, name_filter: str, names: list[str]) -> set | None:
+        """Matches for name_filter, recomputed if rows changed since they were cached."""
+        if not name_filter:
+            return None
+        if self._name_matches is None or self._name_matches_epoch != self.sourceModel().epoch():
+            self._name_matches = {row for row, name in enumerate(names) if name_filter in name}
+            self._name_matches_epoch = self.sourceModel().epoch()
+        return self._name_matches
+
+    def set_numeric_filters(self, min_seeders: int, min_size_bytes: int, max_size_bytes: int):
+        values = (min_seeders, min_size_bytes, max_size_bytes)
+        if values != (self._min_seeders, self._min_size_bytes, self._max_size_bytes):
+            self._min_seeders, self._min_size_bytes, self._max_size_bytes = values
+            self.invalidateRowsFilter()
+
+    # --- Series Grouping ---
+    def set_series_grouping(self, series_index: SeriesIndex, enabled: bool, keep_expanded=False):
+        """(Re)applies grouping after the index or the toggle changed.
+        keep_expanded keeps open series open (used when rows were appended/evicted)."""
+        self._series_index = series_index
+        self._group_by_series = enabled
+        if not keep_expanded:
+            self._expanded_series.clear() # Start with every series collapsed
+        if enabled:
+            self._group_rank = {row: rank for rank, row in enumerate(series_index.grouped_order())}
+        else:
+            self._group_rank = {}
+        self.invalidate()
+        self._apply_sort()
+
+    # --- Local Sorting ---
+    def set_local_sort(self, column: int, order=Qt.DescendingOrder):
+        """Reorders the loaded rows in place by SortRole. column -1 restores the fetch order."""
+        self._local_sort_column = column
+        self._local_sort_order = order
+        self._apply_sort()
+
+    def local_sort(self) -> tuple:
+        """(column, order) of the active local sort; column is -1 when off."""
+        return self._local_sort_column, self._local_sort_order
+
+    def _apply_sort(self):
+        if self._group_by_series:
+            # Group rank decides in lessThan (the local sort only orders rows within a series)
+            self.sort(ResultsTableModel.NAME_COLUMN, Qt.AscendingOrder)
+        elif self._local_sort_column >= 0:
+            self.sort(self._local_sort_column, self._local_sort_order)
+        else:
+            self.sort(-1) # Back to source (fetch) order
+
+    def is_grouping(self) -> bool:
+        return self._group_by_series
+
+    def is_series_leader(self, source_row: int) -> bool:
+        """First row of a series with more than one member."""
+        if not self._group_by_series or self._series_index is None:
+            return False
+        group = self._series_index.group(self._series_index.key_for_row(source_row))
+        return bool(group and len(group.rows) > 1 and group.rows[0] == source_row)
+
+    def toggle_series(self, source_row: int) -> bool:
+        """Expands/collapses the series led by source_row. Returns False if it isn't a leader."""
+        if not self.is_series_leader(source_row):
+            return False
+        series_key = self._series_index.key_for_row(source_row)
+        if series_key in self._expanded_series:
+            self._expanded_series.discard(series_key)
+        else:
+            self._expanded_series.add(series_key)
+        self.invalidateRowsFilter()
+        leader_index = self.mapFromSource(self.sourceModel().index(source_row, ResultsTableModel.NAME_COLUMN))
+        self.dataChanged.emit(leader_index, leader_index)
+        return True
+
+    # --- QSortFilterProxyModel Interface ---
+    def filterAcceptsRow(self, source_row, source_parent):
+        # Runs once per row on a full re-filter, so it sticks to list indexing and plain compares
+        model = self._model
+        names = model._folded_names
+        if source_row >= len(names):
+            return False
+        if self._name_filter and self._name_filter not in names[source_row]:
+            return False
+        if self._min_seeders or self._min_size_bytes or self._max_size_bytes:
+            result = model._results[source_row]
+            if result.seeders < self._min_seeders:
+                return False
+            if result.size_bytes < self._min_size_bytes:
+                return False
+            if self._max_size_bytes > 0 and result.size_bytes > self._max_size_bytes:
+                return False
+        if self._group_by_series and self._series_index is not None and source_row < len(self._series_index):
+            series_key = self._series_index.key_for_row(source_row)
+            if series_key not in self._expanded_series:
+                group = self._series_index.group(series_key)
+                return group is None or group.rows[0] == source_row
+        return True
+
+    def lessThan(self, left, right):
+        if self._group_by_series:
+            return self._grouped_less_than(left.row(), right.row())
+        left_value = left.data(SortRole)
+        right_value = right.data(SortRole)
+        if left_value is None or right_value is None:
+            return False # Qt's sort is stable, so ties keep the fetch order
+        return left_value < right_value
+
+    def _grouped_less_than(self, left_row: int, right_row: int) -> bool:
+        """Series stay contiguous; a local sort orders rows inside each series."""
+        if self._local_sort_column >= 0:
+            left_key = self._series_index.key_for_row(left_row)
+            right_key = self._series_index.key_for_row(right_row)
+            if left_key == right_key:
+                leader_row = self._series_index.group(left_key).rows[0]
+                if leader_row in (left_row, right_row):
+                    return left_row == leader_row # The (expandable) leader heads its series
+                model = self.sourceModel()
+                left_value = model.index(left_row, self._local_sort_column).data(SortRole)
+                right_value = model.index(right_row, self._local_sort_column).data(SortRole)
+                if left_value != right_value and left_value is not None and right_value is not None:
+                    # Sorting runs ascending here, so flip the comparison for descending
+                    if self._local_sort_order == Qt.DescendingOrder:
+                        return right_value < left_value
+                    return left_value < right_value
+        return self._group_rank.get(left_row, left_row) < self._group_rank.get(right_row, right_row)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if (role == Qt.DisplayRole and self._group_by_series
+                and index.isValid() and index.column() == ResultsTableModel.NAME_COLUMN):
+            source_row = self.mapToSource(index).row()
+            if self.is_series_leader(source_row):
+                group = self._series_index.group(self._series_index.key_for_row(source_row))
+                marker = "▾" if group.key in self._expanded_series else "▸"
+                return f"{marker} {super().data(index, role)}  (+{len(group.rows) - 1})"
+        return super().data(index, role)
+
+
+class ResultActionsDelegate(QStyledItemDelegate):
+    """Paints the Magnet/Details buttons of the Actions column instead of
+    creating a QWidget with two QPushButtons per row."""
+    magnet_clicked = Signal(QModelIndex)
+    details_clicked = Signal(QModelIndex)
+
+    BUTTON_SIZE = 26
+    BUTTON_SPACING = 5
+    MARGIN = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icons = None # (magnet, details), built on the first paint and shared by every row
+        self._pressed = None # (QPersistentModelIndex, button index) while the mouse is down
+
+    def _button_rects(self, cell_rect: QRect) -> list[QRect]:
+        total_width = 2 * self.BUTTON_SIZE + self.BUTTON_SPACING
+        left = cell_rect.x() + max(self.MARGIN, (cell_rect.width() - total_width) // 2)
+        top = cell_rect.y() + max(self.MARGIN, (cell_rect.height() - self.BUTTON_SIZE) // 2)
+        return [QRect(left, top, self.BUTTON_SIZE, self.BUTTON_SIZE),
+                QRect(left + self.BUTTON_SIZE + self.BUTTON_SPACING, top, self.BUTTON_SIZE, self.BUTTON_SIZE)]
+
+    def _button_states(self, index) -> tuple[bool, bool]:
+        """(magnet enabled, details enabled). Marked rows disable both, like before."""
+        result = index.data(ResultRole)
+        if result is None or index.data(MarkedRole):
+            return False, False
+        return bool(result.magnet_link), bool(result.link and result.link != '#')
+
+    def paint(self, painter, option, index):
+        # Draw selection/alternating background first
+        super().paint(painter, option, index)
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        enabled_states = self._button_states(index)
+        if self._icons is None:
+            import qtawesome as qta # Loaded after the window's first frame, not at import
+            self._icons = (qta.icon('mdi.magnet', color='red'), qta.icon('mdi.information-outline', color='lightblue'))
+        for button_index, (rect, icon) in enumerate(zip(self._button_rects(option.rect), self._icons)):
+            button_option = QStyleOptionButton()
+            button_option.rect = rect
+            button_option.icon = icon
+            button_option.iconSize = QSize(self.BUTTON_SIZE - 10, self.BUTTON_SIZE - 10)
+            button_option.state = QStyle.State_Raised
+            if enabled_states[button_index]:
+                button_option.state |= QStyle.State_Enabled
+                if self._pressed and self._pressed[0] == index and self._pressed[1] == button_index:
+                    button_option.state |= QStyle.State_Sunken
+            style.drawControl(QStyle.CE_PushButton, button_option, painter, widget)
+
+    def sizeHint(self, option, index):
+        return QSize(2 * self.BUTTON_SIZE + self.BUTTON_SPACING + 2 * self.MARGIN + 6, self.BUTTON_SIZE + 2 * self.MARGIN)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        hit = None
+        for button_index, rect in enumerate(self._button_rects(option.rect)):
+            if rect.contains(event.position().toPoint()):
+                hit = button_index
+                break
+        if hit is None or not self._button_states(index)[hit]:
+            self._pressed = None
+            return False
+        if event.type() == QEvent.MouseButtonPress:
+            self._pressed = (QPersistentModelIndex(index), hit)
+            return True
+        # Release: only fire if released over the same button that was pressed
+        was_pressed = self._pressed is not None and self._pressed[0] == index and self._pressed[1] == hit
+        self._pressed = None
+        if was_pressed:
+            (self.magnet_clicked if hit == 0 else self.details_clicked).emit(QModelIndex(index))
+        return True
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            for button_index, rect in enumerate(self._button_rects(option.rect)):
+                if rect.contains(event.pos()):
+                    result = index.data(ResultRole)
+                    if button_index == 0:
+                        text = "Open Magnet Link" if result and result.magnet_link else "Magnet link not found"
+                    else:
+                        text = "View Torrent Details" if result and result.link and result.link != '#' else "Details link not found or invalid"
+                    QToolTip.showText(event.globalPos(), text, view)
+                    return True
+        return super().helpEvent(event, view, option, index)
@@ -3,10 +3,9 @@ import os
 import json
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QGridLayout,
                                QLabel, QRadioButton, QButtonGroup, QSpinBox, QComboBox,
-                               QLineEdit, QPushButton, QScrollArea, QFrame, QMessageBox)
+                               QLineEdit, QPushButton, QScrollArea, QFrame, QMessageBox, QCheckBox)
 from PySide6.QtCore import Qt, Signal, QObject, QEvent, QByteArray
 from PySide6.QtGui import QKeySequence # Keep if needed for specific settings actions
-import qtawesome as qta
 
 # Assuming format_size might be needed if we display size-related settings?
 # from core.scraper import format_size # Import if needed
@@ -15,17 +14,22 @@ class SettingsWidget(QWidget):
     # Signals to notify MainWindow about changes that affect it directly
     settings_changed = Signal(dict) # General signal for persisting changes
     proxy_config_changed = Signal(dict) # Specific signal for proxy change
+    transmission_config_changed = Signal(dict) # Transmission address/login changed: reconnect
 
     # Signals to request actions from MainWindow
     request_clear_history = Signal()
     request_select_download_dir = Signal()
     request_reset_settings = Signal()
+    request_export_marks = Signal()
+    request_import_marks = Signal()
 
     # Constants (can be adjusted or passed in)
     DEFAULT_SCRAPER_DELAY = 10
     DEFAULT_NETWORK_TIMEOUT = 30
     DEFAULT_MAX_HISTORY = 25
     DEFAULT_PROXY_TYPE = "none"
+    DEFAULT_TRANSMISSION_HOST = "localhost"
+    DEFAULT_TRANSMISSION_PORT = 9091
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -40,6 +44,11 @@ class SettingsWidget(QWidget):
         self.proxy_port_edit = None
         self.proxy_user_edit = None
         self.proxy_pass_edit = None
+        self.transmission_enabled_checkbox = None
+        self.transmission_host_edit = None
+        self.transmission_port_spinbox = None
+        self.transmission_user_edit = None
+        self.transmission_pass_edit = None
         self.delay_spinbox = None
         self.timeout_spinbox = None
         self.max_history_spinbox = None
@@ -49,6 +58,9 @@ class SettingsWidget(QWidget):
         self._categories_list = []
         self._sort_options = {}
 
+        # (button, qtawesome name, color) set by install_icons, after the window's first frame
+        self._button_icons = []
+
         self._init_ui()
 
     def _init_ui(self):
@@ -96,7 +108,8 @@ class SettingsWidget(QWidget):
         paths_layout.setSpacing(8)
 
         dl_controls_layout = QHBoxLayout()
-        select_dir_button = QPushButton(qta.icon('mdi.folder-outline'), " Set Reference Folder")
+        select_dir_button = QPushButton(" Set Reference Folder")
+        self._button_icons.append((select_dir_button, 'mdi.folder-outline', None))
         select_dir_button.setToolTip("Select the folder your external torrent client typically saves to.\nThis is just a reference and doesn't affect downloads directly.")
         select_dir_button.clicked.connect(self.request_select_download_dir.emit) # Emit signal
 
@@ -134,7 +147,8 @@ class SettingsWidget(QWidget):
         history_controls_layout.addWidget(self.max_history_spinbox)
         history_controls_layout.addSpacing(20) 
 
-        clear_history_button = QPushButton(qta.icon('mdi.trash-can-outline', color='tomato'), " Clear Search History")
+        clear_history_button = QPushButton(" Clear Search History")
+        self._button_icons.append((clear_history_button, 'mdi.trash-can-outline', 'tomato'))
         clear_history_button.setToolTip("Removes all saved search terms from the history dropdown.")
         clear_history_button.clicked.connect(self.request_clear_history.emit) # Emit signal
 
@@ -142,6 +156,26 @@ class SettingsWidget(QWidget):
         history_controls_layout.addStretch() 
         history_layout.addLayout(history_controls_layout) 
 
+        # --- Marked Torrents Section ---
+        marks_group = QGroupBox("Marked Torrents")
+        main_layout.addWidget(marks_group)
+        marks_layout = QHBoxLayout(marks_group)
+        marks_layout.setContentsMargins(10, 15, 10, 10)
+        marks_layout.setSpacing(8)
+
+        export_marks_button = QPushButton(" Export Marks...")
+        self._button_icons.append((export_marks_button, 'mdi.export', None))
+        export_marks_button.setToolTip("Saves all marked torrents to a text file, e.g. to move them to another device.")
+        export_marks_button.clicked.connect(self.request_export_marks.emit) # Emit signal
+        marks_layout.addWidget(export_marks_button)
+
+        import_marks_button = QPushButton(" Import Marks...")
+        self._button_icons.append((import_marks_button, 'mdi.import', None))
+        import_marks_button.setToolTip("Adds the marked torrents from an exported file to the current marks.")
+        import_marks_button.clicked.connect(self.request_import_marks.emit) # Emit signal
+        marks_layout.addWidget(import_marks_button)
+        marks_layout.addStretch()
+
         # --- Proxy Settings Section ---
         proxy_group = QGroupBox("Proxy Settings")
         main_layout.addWidget(proxy_group)
@@ -186,6 +220,43 @@ class SettingsWidget(QWidget):
         proxy_note_label.setWordWrap(True)
         proxy_layout_group.addWidget(proxy_note_label)
         
+        # --- Transmission Section ---
+        transmission_group = QGroupBox("Transmission")
+        main_layout.addWidget(transmission_group)
+        transmission_layout_group = QVBoxLayout(transmission_group)
+        transmission_layout_group.setContentsMargins(10, 15, 10, 10)
+        transmission_layout_group.setSpacing(8)
+
+        self.transmission_enabled_checkbox = QCheckBox("Show and control Transmission's torrents in the Downloads tab")
+        self.transmission_enabled_checkbox.setToolTip("Connects to Transmission's remote control (RPC) interface.\nEnable remote access in Transmission's preferences first.")
+        transmission_layout_group.addWidget(self.transmission_enabled_checkbox)
+
+        transmission_grid = QGridLayout()
+        transmission_grid.addWidget(QLabel("Host:"), 0, 0, Qt.AlignRight)
+        self.transmission_host_edit = QLineEdit(self.DEFAULT_TRANSMISSION_HOST)
+        self.transmission_host_edit.setPlaceholderText("e.g., localhost or 192.168.1.10")
+        transmission_grid.addWidget(self.transmission_host_edit, 0, 1)
+
+        transmission_grid.addWidget(QLabel("Port:"), 0, 2, Qt.AlignRight)
+        self.transmission_port_spinbox = QSpinBox()
+        self.transmission_port_spinbox.setRange(1, 65535)
+        self.transmission_port_spinbox.setValue(self.DEFAULT_TRANSMISSION_PORT)
+        transmission_grid.addWidget(self.transmission_port_spinbox, 0, 3)
+
+        transmission_grid.addWidget(QLabel("Username (Optional):"), 1, 0, Qt.AlignRight)
+        self.transmission_user_edit = QLineEdit()
+        transmission_grid.addWidget(self.transmission_user_edit, 1, 1, 1, 3)
+
+        transmission_grid.addWidget(QLabel("Password (Optional):"), 2, 0, Qt.AlignRight)
+        self.transmission_pass_edit = QLineEdit()
+        self.transmission_pass_edit.setEchoMode(QLineEdit.Password)
+        transmission_grid.addWidget(self.transmission_pass_edit, 2, 1, 1, 3)
+
+        transmission_grid.setColumnStretch(1, 1)
+        transmission_grid.setColumnMinimumWidth(3, 80)
+        transmission_layout_group.addLayout(transmission_grid)
+        self._update_transmission_fields_enabled_state()
+
         # Connect proxy signals internally
         # self.proxy_type_combo.currentIndexChanged.connect(self._handle_proxy_setting_changed)
         # self.proxy_host_edit.textChanged.connect(self._handle_proxy_setting_changed)
@@ -196,7 +267,8 @@ class SettingsWidget(QWidget):
         # --- Reset Settings Button ---
         reset_layout = QHBoxLayout()
         reset_layout.addStretch()
-        self.reset_button = QPushButton(qta.icon('mdi.restore', color='orange'), " Reset All Settings to Defaults")
+        self.reset_button = QPushButton(" Reset All Settings to Defaults")
+        self._button_icons.append((self.reset_button, 'mdi.restore', 'orange'))
         self.reset_button.setToolTip("Resets all application settings to their original values.")
         self.reset_button.clicked.connect(self._confirm_reset_settings)
         reset_layout.addWidget(self.reset_button)
@@ -208,6 +280,12 @@ class SettingsWidget(QWidget):
         # --- Connect internal signals ONCE after creating UI elements ---
         self._connect_internal_signals()
 
+    def install_icons(self):
+        """Sets the button icons; qtawesome and its fonts are only loaded here."""
+        import qtawesome as qta
+        for button, icon_name, color in self._button_icons:
+            button.setIcon(qta.icon(icon_name, color=color) if color else qta.icon(icon_name))
+
     # --- Placeholder methods to be filled ---
 
     def set_combo_options(self, categories_list, sort_options):
@@ -234,6 +312,11 @@ class SettingsWidget(QWidget):
             "proxy_port": self.proxy_port_edit.text().strip(),
             "proxy_username": self.proxy_user_edit.text().strip(),
             "proxy_password": self.proxy_pass_edit.text(),
+            "transmission_enabled": self.transmission_enabled_checkbox.isChecked(),
+            "transmission_host": self.transmission_host_edit.text().strip(),
+            "transmission_port": self.transmission_port_spinbox.value(),
+            "transmission_username": self.transmission_user_edit.text().strip(),
+            "transmission_password": self.transmission_pass_edit.text(),
             # MainWindow handles saving these, but widget needs to know the current value for display
             "default_download_path": self._current_settings.get("default_download_path", ""), 
         }
@@ -281,6 +364,20 @@ class SettingsWidget(QWidget):
         self.proxy_pass_edit.setText(self._current_settings.get("proxy_password", ""))
         self._update_proxy_fields_enabled_state()
 
+        # Transmission
+        transmission_controls = (self.transmission_enabled_checkbox, self.transmission_host_edit, self.transmission_port_spinbox,
+                                 self.transmission_user_edit, self.transmission_pass_edit)
+        for control in transmission_controls:
+            control.blockSignals(True)
+        self.transmission_enabled_checkbox.setChecked(self._current_settings.get("transmission_enabled", False))
+        self.transmission_host_edit.setText(self._current_settings.get("transmission_host", self.DEFAULT_TRANSMISSION_HOST))
+        self.transmission_port_spinbox.setValue(self._current_settings.get("transmission_port", self.DEFAULT_TRANSMISSION_PORT))
+        self.transmission_user_edit.setText(self._current_settings.get("transmission_username", ""))
+        self.transmission_pass_edit.setText(self._current_settings.get("transmission_password", ""))
+        for control in transmission_controls:
+            control.blockSignals(False)
+        self._update_transmission_fields_enabled_state()
+
         # Connect signals now that UI is populated
         # self._connect_internal_signals()
 
@@ -294,6 +391,12 @@ class SettingsWidget(QWidget):
         self.proxy_port_edit.textChanged.connect(self._handle_proxy_setting_changed)
         self.proxy_user_edit.textChanged.connect(self._handle_proxy_setting_changed)
         self.proxy_pass_edit.textChanged.connect(self._handle_proxy_setting_changed)
+        # Transmission reconnects on every change, so text fields report when editing is done, not per keystroke
+        self.transmission_enabled_checkbox.toggled.connect(self._handle_transmission_setting_changed)
+        self.transmission_host_edit.editingFinished.connect(self._handle_transmission_setting_changed)
+        self.transmission_port_spinbox.editingFinished.connect(self._handle_transmission_setting_changed)
+        self.transmission_user_edit.editingFinished.connect(self._handle_transmission_setting_changed)
+        self.transmission_pass_edit.editingFinished.connect(self._handle_transmission_setting_changed)
         print("DEBUG: SettingsWidget internal signals connected.")
 
     def _emit_changed_settings(self):
@@ -362,6 +465,23 @@ class SettingsWidget(QWidget):
         self.proxy_user_edit.setEnabled(is_enabled)
         self.proxy_pass_edit.setEnabled(is_enabled)
 
+    def _handle_transmission_setting_changed(self, *_args):
+        """Emits transmission_config_changed (and a save) if any Transmission field changed."""
+        keys = ("transmission_enabled", "transmission_host", "transmission_port", "transmission_username", "transmission_password")
+        previous = {key: self._current_settings.get(key) for key in keys}
+        self._update_transmission_fields_enabled_state()
+        current_settings = self.get_current_settings() # Also updates _current_settings
+        if any(current_settings[key] != previous[key] for key in keys):
+            print("SettingsWidget: Transmission settings changed")
+            self.transmission_config_changed.emit(current_settings)
+            self.settings_changed.emit(current_settings) # General save signal
+
+    def _update_transmission_fields_enabled_state(self):
+        is_enabled = self.transmission_enabled_checkbox.isChecked()
+        for control in (self.transmission_host_edit, self.transmission_port_spinbox,
+                        self.transmission_user_edit, self.transmission_pass_edit):
+            control.setEnabled(is_enabled)
+
     def _confirm_reset_settings(self):
          reply = QMessageBox.question(self, "Reset Settings?",
                                       "Are you sure you want to reset all application settings to their defaults?",
@@ -375,7 +495,8 @@ class SettingsWidget(QWidget):
         spin_boxes = [
             self.delay_spinbox,
             self.timeout_spinbox,
-            self.max_history_spinbox
+            self.max_history_spinbox,
+            self.transmission_port_spinbox
         ]
         # Filter out None values if some spinboxes weren't created yet
         spin_boxes = [box for box in spin_boxes if box is not None]
@@ -1,18 +1,24 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextBrowser,
-                               QTreeWidget, QTreeWidgetItem, QSizePolicy,
+                               QTreeView, QSizePolicy,
                                QPushButton, QDialogButtonBox, QHeaderView, QGridLayout,
                                QApplication, QMessageBox, QWidget, QSpacerItem, QLineEdit,
-                               QScrollArea) # Add QScrollArea
-from PySide6.QtCore import Qt, QTimer, QUrl, QSize, QPropertyAnimation, QEasingCurve, QPoint, QParallelAnimationGroup # Added QSize, QPropertyAnimation, QEasingCurve, QPoint, QParallelAnimationGroup
+                               QScrollArea, QListView) # Add QScrollArea
+from PySide6.QtCore import Qt, Signal, QTimer, QUrl, QSize, QPropertyAnimation, QEasingCurve, QPoint, QParallelAnimationGroup, QStandardPaths # Added QSize, QPropertyAnimation, QEasingCurve, QPoint, QParallelAnimationGroup
 from PySide6.QtGui import QDesktopServices, QPixmap # Added QPixmap
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply # Add Network imports
 
-from core.scraper import TorrentDetails, FileInfo, format_size
+from core.models import TorrentDetails, FileInfo
+from ui.image_cache import ImagePreviewCache
+from ui.file_tree_model import FileTreeModel
+from ui.comments_model import CommentsModel, CommentDelegate
 import os
 import qtawesome as qta
 import pyperclip
 
 class TorrentDetailDialog(QDialog):
+    # The parts of the page the scraper's caps left out; MainWindow fetches them
+    full_description_requested = Signal()
+    more_comments_requested = Signal(int) # Index of the first comment div wanted
+
     FILE_TYPE_ICONS = {
         # Archives
         "zip": ("mdi.folder-zip-outline", "orange"), "rar": ("mdi.folder-zip-outline", "orange"),
@@ -48,9 +54,11 @@ class TorrentDetailDialog(QDialog):
         "default": ("mdi.file-outline", "lightgrey")
     }
 
-    def __init__(self, details: TorrentDetails, parent=None):
+    def __init__(self, details: TorrentDetails, parent=None, image_cache: ImagePreviewCache | None = None):
         super().__init__(parent)
         self.details = details
+        # Shared with other dialogs so previews survive closing/reopening
+        self.image_cache = image_cache or getattr(parent, "image_cache", None)
         # Use text wrapping for potentially long titles
         self.setWindowTitle(f"Details") # Set basic title first
         self.setMinimumSize(750, 600) # Increase min height slightly for better spacing
@@ -170,6 +178,11 @@ class TorrentDetailDialog(QDialog):
         self.description_browser.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred) # Prefer height based on content
         self.description_browser.setFixedHeight(150) # Start with a fixed height, user can scroll
         layout.addWidget(self.description_browser) # No stretch factor initially
+        if details.description_truncated:
+            self.full_description_button = QPushButton("Show Full Description")
+            self.full_description_button.setToolTip("Only the start of this long description was loaded.")
+            self.full_description_button.clicked.connect(self._request_full_description)
+            layout.addWidget(self.full_description_button, 0, Qt.AlignLeft)
 
         # --- Image Preview Section ---
         if details.image_urls:
@@ -185,26 +198,32 @@ class TorrentDetailDialog(QDialog):
             layout.addWidget(image_preview_container)
 
             self.image_labels = {} # url -> QLabel map
-            self.network_manager = QNetworkAccessManager()
+            self._unrequested_previews = [] # (position, url) not scrolled into view yet
+            if self.image_cache is None:
+                cache_dir = os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "image_cache")
+                self.image_cache = ImagePreviewCache(cache_dir, self)
+            self.finished.connect(lambda _result: self.image_cache.cancel(self)) # Late replies skip our labels
 
             # Limit displayed previews
             preview_limit = 10
             for img_url in details.image_urls[:preview_limit]:
                 placeholder_label = QLabel(f"Loading {os.path.basename(QUrl(img_url).path())[:20]}...")
-                placeholder_label.setFixedSize(150, 150) # Fixed size for placeholder
+                placeholder_label.setFixedSize(ImagePreviewCache.THUMBNAIL_SIZE, ImagePreviewCache.THUMBNAIL_SIZE) # Fixed size for placeholder
                 placeholder_label.setAlignment(Qt.AlignCenter)
                 placeholder_label.setStyleSheet("border: 1px solid grey; background-color: #eee;") # Basic styling
                 self.image_preview_layout.addWidget(placeholder_label)
                 self.image_labels[img_url] = placeholder_label
-                self._download_image(img_url, placeholder_label)
+                # Requested once the placeholder scrolls into view (_load_visible_previews)
+                self._unrequested_previews.append((len(self._unrequested_previews), img_url))
             self.image_preview_layout.addStretch() # Push images left
 
         # --- File List Section ---
         files_label = QLabel("<b>Files:</b>")
         files_label.setObjectName("SectionHeaderLabel") # Add object name
         layout.addWidget(files_label)
-        self.file_tree = QTreeWidget()
-        self.file_tree.setHeaderLabels(["Name", "Size"])
+        self.file_tree = QTreeView()
+        self.file_tree.setUniformRowHeights(True) # Lets the view skip measuring every row
+        self.populate_nested_file_tree(details.file_list)
         self.file_tree.header().setStretchLastSection(False)
         self.file_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
         self.file_tree.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
@@ -212,50 +231,35 @@ class TorrentDetailDialog(QDialog):
         self.file_tree.setSortingEnabled(True) # Enable sorting
         self.file_tree.header().setSectionsClickable(True) # Make headers clickable
 
-        self.populate_nested_file_tree(details.file_list)
-
         # Allow file tree to take significant vertical space
         self.file_tree.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.file_tree, 1) # Give file tree stretch factor 1
 
-        # --- Connect Signals ---
-        self.file_tree.header().sectionClicked.connect(self._handle_file_tree_sort)
-
         # --- Comments Section --- #
         if details.comments:
             comments_label = QLabel("<b>Comments:</b>")
             comments_label.setObjectName("SectionHeaderLabel")
             layout.addWidget(comments_label)
 
-            self.comments_browser = QTextBrowser()
-            self.comments_browser.setOpenExternalLinks(False) # Handle links manually
-            self.comments_browser.anchorClicked.connect(self.safe_open_url)
-            self.comments_browser.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            self.comments_browser.setFixedHeight(200) # Start with a fixed height
-
-            # Build HTML for comments
-            all_comments_html = """
-            <style>
-                .comment-block { border: 1px solid #444; margin-bottom: 10px; padding: 8px; border-radius: 4px; }
-                .comment-header { font-size: 9pt; color: grey; margin-bottom: 5px; }
-                .comment-author { font-weight: bold; }
-                .comment-body p { margin: 0; padding: 0; }
-            </style>
-            """
-            for comment in details.comments:
-                all_comments_html += f"""
-                <div class='comment-block'>
-                    <div class='comment-header'>
-                        <span class='comment-author'>{comment.get('author', 'N/A')}</span> - 
-                        <span class='comment-date'>{comment.get('date', 'N/A')}</span>
-                    </div>
-                    <div class='comment-body'>
-                        {comment.get('content_html', '[No Content]')}
-                    </div>
-                </div>
-                """
-            self.comments_browser.setHtml(all_comments_html)
-            layout.addWidget(self.comments_browser)
+            # Comments are laid out and rendered only as they scroll into view (fetchMore + delegate)
+            self.comments_view = QListView()
+            self.comments_model = CommentsModel(details.comments, self)
+            self.comments_delegate = CommentDelegate(self.comments_view, self)
+            self.comments_delegate.link_activated.connect(self.safe_open_url) # Handle links manually
+            self.comments_view.setModel(self.comments_model)
+            self.comments_view.setItemDelegate(self.comments_delegate)
+            self.comments_view.setSelectionMode(QListView.NoSelection)
+            self.comments_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+            self.comments_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+            self.comments_view.setResizeMode(QListView.Adjust) # Re-wrap comments when the width changes
+            self.comments_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+            self.comments_view.setFixedHeight(200) # Start with a fixed height
+            layout.addWidget(self.comments_view)
+
+            self.more_comments_button = QPushButton()
+            self.more_comments_button.clicked.connect(self._request_more_comments)
+            layout.addWidget(self.more_comments_button, 0, Qt.AlignLeft)
+            self._update_more_comments_button()
 
         # --- Dialog Buttons (OK Button) ---
         button_box = QDialogButtonBox(QDialogButtonBox.Ok)
@@ -268,6 +272,7 @@ class TorrentDetailDialog(QDialog):
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll_area.setWidget(main_widget) # Put the widget with all content inside scroll area
+        scroll_area.verticalScrollBar().valueChanged.connect(self._load_visible_previews)
 
         # Create a new main layout for the dialog itself
         dialog_layout = QVBoxLayout(self) # Apply to self (the QDialog)
@@ -294,6 +299,7 @@ class TorrentDetailDialog(QDialog):
 
         # Call the original showEvent AFTER setting initial state
         super().showEvent(event)
+        QTimer.singleShot(0, self._load_visible_previews) # Once the layout has placed the placeholders
 
         # --- Setup Animations --- #
         # Opacity Animation (Fade In)
@@ -375,148 +381,89 @@ class TorrentDetailDialog(QDialog):
 
 
     def populate_nested_file_tree(self, file_list: list[FileInfo]):
-        self.file_tree.clear()
-        if not file_list:
-            QTreeWidgetItem(self.file_tree, ["No file information available."])
-            return
-
-        folder_items = {} # path_str: QTreeWidgetItem
-        self.file_tree.setUpdatesEnabled(False) # Performance optimization
-
-        for file_info in file_list:
-            path_components = file_info.name.replace("\\", "/").split('/')
-            filename = path_components[-1]
-            folder_path_components = path_components[:-1]
-
-            current_parent_item = self.file_tree.invisibleRootItem()
-            current_path_str = ""
-
-            for i, component in enumerate(folder_path_components):
-                if not component: continue
-                parent_path_str = current_path_str
-                current_path_str = os.path.join(current_path_str, component) if current_path_str else component # Use os.path.join for consistency? No, stick to forward slash for dict keys.
-                current_path_str = "/".join(folder_path_components[:i+1]) # Build path key reliably
-
-
-                if current_path_str not in folder_items:
-                    folder_item = QTreeWidgetItem(current_parent_item)
-                    folder_item.setText(0, component)
-                    folder_item.setIcon(0, qta.icon('mdi.folder-outline', color='#87CEFA')) # Use mdi folder
-                    folder_item.setData(0, Qt.UserRole, component.lower()) # Store lowercase name for sorting
-                    folder_item.setData(1, Qt.UserRole, 0) # Store size in bytes for sorting
-                    # Set tooltip to show full path for folder
-                    folder_item.setToolTip(0, current_path_str)
-                    folder_items[current_path_str] = folder_item
-                    current_parent_item = folder_item
-                else:
-                    current_parent_item = folder_items[current_path_str]
-
-                # Add file size to this folder and implicitly handled later or during creation
-                existing_size = current_parent_item.data(1, Qt.UserRole) or 0
-                current_parent_item.setData(1, Qt.UserRole, existing_size + file_info.size_bytes)
-
-            # Create the file item
-            file_item = QTreeWidgetItem(current_parent_item)
-            file_item.setText(0, filename)
-            file_item.setText(1, file_info.size_str)
-            file_item.setData(0, Qt.UserRole, filename.lower()) # Store lowercase name for sorting
-            file_item.setData(1, Qt.UserRole, file_info.size_bytes) # Store size bytes for sorting
-            file_item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-            file_item.setIcon(0, self.get_file_type_icon(filename))
-            # Set tooltip to show full path for file
-            full_file_path = "/".join(path_components)
-            file_item.setToolTip(0, full_file_path)
-            file_item.setToolTip(1, f"{file_info.size_bytes:,} bytes") # Show bytes in tooltip
-
-        # Second pass to set folder sizes and alignment
-        for item in folder_items.values():
-            total_folder_size = item.data(1, Qt.UserRole)
-            if total_folder_size is not None:
-                item.setText(1, format_size(total_folder_size))
-                item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-                item.setToolTip(1, f"{total_folder_size:,} bytes") # Show bytes in tooltip
-
-        self.file_tree.setUpdatesEnabled(True)
-        # Sort items within each level by name (column 0)
-        # self.file_tree.sortItems(0, Qt.AscendingOrder) # This sorts globally, need per-level sort if desired. Recursive sort might be complex. Default order is usually fine.
-
-    def _handle_file_tree_sort(self, logicalIndex):
-        """Handles clicking on the file tree header to sort columns."""
-        current_order = self.file_tree.header().sortIndicatorOrder()
-        current_column = self.file_tree.header().sortIndicatorSection()
-
-        # Toggle order if the same column is clicked, otherwise default to ascending
-        if logicalIndex == current_column:
-            new_order = Qt.DescendingOrder if current_order == Qt.AscendingOrder else Qt.AscendingOrder
+        """Shows file_list in the file tree; folder rows are created as they are expanded."""
+        self.file_tree_model = FileTreeModel(file_list, self.get_file_type_icon, self)
+        self.file_tree.setModel(self.file_tree_model)
+
+    # --- Capped Parts (fetched on demand) ---
+    def _request_full_description(self):
+        self.full_description_button.setEnabled(False)
+        self.full_description_button.setText("Loading Full Description...")
+        self.full_description_requested.emit()
+
+    def set_full_description(self, description_html: str):
+        self.description_browser.setHtml(description_html.replace('<br>', '<br/>'))
+        self.full_description_button.hide()
+
+    def _request_more_comments(self):
+        self.more_comments_button.setEnabled(False)
+        self.more_comments_button.setText("Loading Comments...")
+        self.more_comments_requested.emit(self.details.comments_next)
+
+    def add_comments(self, comments: list[dict], next_start: int):
+        self.comments_model.add_comments(comments)
+        if next_start <= self.details.comments_next: # Page changed since it was opened; nothing more to get
+            self.details.comment_count = self.details.comments_next
         else:
-            new_order = Qt.AscendingOrder
-
-        # Set the sort column role. We stored data in Qt.UserRole.
-        # Note: Qt's default sorting uses Qt.DisplayRole (text). By setting
-        # the column's sort role to Qt.UserRole, we tell it to use the data
-        # we stored (lowercase name for col 0, size_bytes for col 1).
-        self.file_tree.setSortRole(Qt.UserRole)
-        self.file_tree.sortByColumn(logicalIndex, new_order)
-
-        # Update the visual sort indicator
-        self.file_tree.header().setSortIndicator(logicalIndex, new_order)
-        self.file_tree.header().setSortIndicatorShown(True)
+            self.details.comments_next = next_start
+        self._update_more_comments_button()
+
+    def _update_more_comments_button(self):
+        remaining = self.details.comment_count - self.details.comments_next
+        self.more_comments_button.setVisible(remaining > 0)
+        self.more_comments_button.setEnabled(True)
+        self.more_comments_button.setText(f"Load More Comments ({remaining} more)")
+
+    def show_part_error(self, message: str):
+        for button in (getattr(self, "full_description_button", None), getattr(self, "more_comments_button", None)):
+            if button is not None and not button.isEnabled():
+                button.setEnabled(True)
+                button.setText("Retry")
+        QMessageBox.warning(self, "Loading Failed", f"Could not load the rest of the page:\n{message}")
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._load_visible_previews() # Growing the dialog can uncover placeholders
+
+    def _load_visible_previews(self, *_args):
+        """Requests previews whose placeholders are on screen; earlier ones go first."""
+        pending = getattr(self, "_unrequested_previews", None)
+        if not pending or not self.isVisible():
+            return
+        still_hidden = []
+        for position, url in pending:
+            label = self.image_labels[url]
+            if label.visibleRegion().isEmpty():
+                still_hidden.append((position, url))
+            else:
+                self._load_image_preview(url, label, position)
+        self._unrequested_previews = still_hidden
 
-    def _download_image(self, url_string, target_label):
-        """Starts asynchronous download of an image URL."""
-        try:
-            qurl = QUrl(url_string)
-            if not qurl.isValid():
-                target_label.setText("Invalid URL")
-                target_label.setStyleSheet("border: 1px solid red; color: red;")
-                return
-
-            request = QNetworkRequest(qurl)
-            reply = self.network_manager.get(request)
-            # Store target label with the reply object
-            reply.setProperty("target_label", target_label)
-            reply.setProperty("image_url", url_string) # Store URL too for tooltips/errors
-            # Connect the finished signal to the slot
-            reply.finished.connect(self._on_image_download_finished)
-            print(f"Starting download for: {url_string}")
-        except Exception as e:
-            print(f"Error initiating download for {url_string}: {e}")
-            target_label.setText("Download Init Error")
+    def _load_image_preview(self, url_string, target_label, priority=0):
+        """Shows a cached thumbnail or queues a download through the shared image cache."""
+        if not QUrl(url_string).isValid():
+            target_label.setText("Invalid URL")
             target_label.setStyleSheet("border: 1px solid red; color: red;")
+            return
+        self.image_cache.fetch(url_string, self, self._on_image_preview_ready, priority)
 
-    def _on_image_download_finished(self):
-        """Handles the completed image download request."""
-        reply = self.sender() # Get the reply object that emitted the signal
-        if not reply:
+    def _on_image_preview_ready(self, image_url, thumbnail, error):
+        """Puts a (pre-scaled) thumbnail or an error into the image's placeholder label."""
+        target_label = self.image_labels.get(image_url)
+        if target_label is None:
+            print(f"Error: Target label not found for {image_url}")
             return
 
-        target_label = reply.property("target_label")
-        image_url = reply.property("image_url")
-
-        if not target_label:
-             print(f"Error: Target label not found for reply of {image_url}")
-             reply.deleteLater()
-             return
-
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            image_data = reply.readAll()
-            pixmap = QPixmap()
-            if pixmap.loadFromData(image_data):
-                # Scale pixmap to fit the label size while keeping aspect ratio
-                scaled_pixmap = pixmap.scaled(target_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                target_label.setPixmap(scaled_pixmap)
-                target_label.setToolTip(f"<img src='{image_url}' width='300'/><br/>{image_url}") # Show larger preview on hover
-                target_label.setStyleSheet("") # Clear placeholder style
-                print(f"Successfully loaded image: {image_url}")
-            else:
-                target_label.setText("Load Failed")
-                target_label.setStyleSheet("border: 1px solid orange; color: orange;")
-                print(f"Failed to load image data into QPixmap for: {image_url}")
+        if thumbnail is not None:
+            target_label.setPixmap(thumbnail)
+            original_path = self.image_cache.original_path(image_url)
+            preview_src = QUrl.fromLocalFile(original_path).toString() if original_path else image_url
+            target_label.setToolTip(f"<img src='{preview_src}' width='300'/><br/>{image_url}") # Show larger preview on hover
+            target_label.setStyleSheet("") # Clear placeholder style
+        elif error == "Load Failed":
+            target_label.setText("Load Failed")
+            target_label.setStyleSheet("border: 1px solid orange; color: orange;")
         else:
-            error_string = reply.errorString()
-            target_label.setText(f"Net Error: {reply.error()}")
-            target_label.setToolTip(f"Network Error: {error_string}\nURL: {image_url}")
+            target_label.setText(error)
+            target_label.setToolTip(f"{error}\nURL: {image_url}")
             target_label.setStyleSheet("border: 1px solid red; color: red;")
-            print(f"Network error downloading {image_url}: {error_string}")
-
-        reply.deleteLater() # Clean up the reply object
\ No newline at end of file